@@ -0,0 +1,109 @@
+import pygame
+
+from assets.animation_manifest import ANIMATIONS
+from assets.asset_cache import asset_cache
+from assets.spritesheet import HandleSpriteSheet
+
+
+class AnimationBank:
+    """
+    Holds every animation of a character type. A bank is built once and shared by every
+    sprite of that type, so changing a sprite's state only switches which frames it reads.
+    The flipped frames are made the first time a sprite facing left asks for them, so those
+    sprites never flip a frame while they are drawn.
+
+    Attributes:
+        animations (dict[str, tuple[pygame.Surface, ...]]): The frames of each state.
+        flipped_animations (dict[str, tuple[pygame.Surface, ...]]): The frames of each state flipped
+            horizontally, or None until they're first asked for.
+    """
+    def __init__(self, animations):
+        """
+        Initializes an AnimationBank object.
+
+        Args:
+            animations (dict[str, list[pygame.Surface]]): The frames of each state.
+        """
+        self.animations = {state: tuple(frames) for state, frames in animations.items()}
+        self.flipped_animations = None
+
+    def frames(self, flip=False):
+        """
+        Args:
+            flip (bool, optional): Whether the frames face the other way. Defaults to False.
+
+        :returns dict[str, tuple[pygame.Surface, ...]]: The shared frames of each state.
+        """
+        if not flip:
+            return self.animations
+        if self.flipped_animations is None:
+            self.flipped_animations = {state: tuple(pygame.transform.flip(frame, True, False) for frame in frames)
+                                       for state, frames in self.animations.items()}
+        return self.flipped_animations
+
+
+def frame_source(animation, state, frame):
+    """
+    Works out where a frame of the animation manifest is cut from.
+
+    Args:
+        animation (dict): The animation's entry in the manifest.
+        state (str): The state the frame belongs to.
+        frame (tuple or str): The frame's entry in the manifest.
+
+    :returns tuple[str, tuple[int, int, int, int] or None, int]: The path of the image, the part of it
+        to cut out (None for the whole image) and the scale factor.
+    """
+    scale = animation.get("scale", 1)
+    if isinstance(frame, str):
+        return frame, None, scale
+    sheet = animation["sheet"]
+    if isinstance(sheet, dict):
+        sheet = sheet[state]
+    width, height = animation["frame_size"]
+    offset_h, offset_v = animation.get("offset", (0, 0))
+    column, row = frame[:2]
+    if len(frame) == 4:
+        offset_h, offset_v = frame[2:]
+    return sheet, (column * width + offset_h, row * height + offset_v, width, height), scale
+
+def cut_animations(name, manifest=ANIMATIONS):
+    """
+    Cuts the frames of an animation out of its sprite sheets through the asset cache. The frames of a
+    state are scaled together and handed out as views, so a state costs one scaled surface.
+
+    Args:
+        name (str): The name of the animation in the manifest, for example "combat_enemy/slime".
+        manifest (dict, optional): The animation manifest. Defaults to ANIMATIONS.
+
+    :returns dict[str, list[pygame.Surface]]: The frames of each state.
+    """
+    animation = manifest[name]
+    animations = {}
+    for state, frames in animation["states"].items():
+        sources = [frame_source(animation, state, frame) for frame in frames]
+        path, _, scale = sources[0]
+        if all(rect is not None for _, rect, _ in sources):
+            sprite_loader = HandleSpriteSheet(asset_cache.load(path), path)
+            animations[state] = sprite_loader.get_frames([rect for _, rect, _ in sources], scale)
+        else:
+            animations[state] = [asset_cache.get(*source) for source in sources]
+    return animations
+
+
+animation_banks = {}
+
+def get_animation_bank(name):
+    """
+    Returns the animation bank of a character type. Banks are normally filled from the sprite
+    atlas at startup; a bank that isn't there yet is cut out of the sprite sheets the first time.
+
+    Args:
+        name (str): The name of the animation in the manifest, for example "combat_enemy/slime".
+
+    :returns AnimationBank: The shared bank.
+    """
+    bank = animation_banks.get(name)
+    if bank is None:
+        bank = animation_banks[name] = AnimationBank(cut_animations(name))
+    return bank
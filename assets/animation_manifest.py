@@ -0,0 +1,151 @@
+"""
+Describes every animation of the game: which sheet its frames are cut from, the size and offset of
+the frame grid, the scale factor and the frames of each state. The atlas build step and the runtime
+fallback both read the frames from here, so no sprite class keeps coordinate tables of its own.
+
+Each animation has:
+    sheet (str or dict[str, str]): The path of the sprite sheet, or the path of each state's sheet.
+    frame_size (tuple[int, int]): The width and height of a frame on the sheet.
+    offset (tuple[int, int], optional): The horizontal and vertical offset of the frame grid. Defaults to (0, 0).
+    scale (int, optional): The scale factor of the frames. Defaults to 1.
+    states (dict[str, list]): The frames of each state. A frame is the (column, row) of the frame on the grid,
+        a (column, row, offset_h, offset_v) tuple with an offset of its own, or the path of an image used whole.
+"""
+
+
+def strip(row, count, start=0):
+    """
+    Lists the frames of a horizontal strip of the frame grid.
+
+    Args:
+        row (int): The row of the strip.
+        count (int): The number of frames in the strip.
+        start (int, optional): The column of the first frame. Defaults to 0.
+
+    :returns list[tuple[int, int]]: The (column, row) of every frame.
+    """
+    return [(column, row) for column in range(start, start + count)]
+
+
+SKELETON_STATES = {
+    "idle": strip(3, 4),
+    "attack": strip(0, 13),
+    "hurt": strip(4, 3),
+    "death": strip(1, 13),
+}
+
+ANIMATIONS = {
+    "player": {
+        "sheet": "../assets/map_entities/player_sheet.png",
+        "frame_size": (16, 16),
+        "offset": (0, 8),
+        "states": {
+            "right_idle": [(0, 0)],
+            "left_idle": [(1, 0)],
+            "back_idle": [(2, 0)],
+            "front_idle": [(3, 0)],
+            "right_run": [(0, 1), (0, 2)],
+            "left_run": [(1, 1), (1, 2)],
+            "back_run": [(2, 1), (2, 2)],
+            "front_run": [(3, 1), (3, 2)],
+        },
+    },
+    "enemy/slime": {
+        "sheet": "../assets/map_entities/slime_sprite_sheet.png",
+        "frame_size": (16, 16),
+        "states": {"idle": [(0, 0, 8, 0), (1, 0, 16, 0)]},
+    },
+    "enemy/zombie": {
+        "sheet": "../assets/map_entities/undead_sprites.png",
+        "frame_size": (16, 16),
+        "offset": (11, 0),
+        "states": {"idle": strip(1, 4)},
+    },
+    "enemy/skeleton": {
+        "sheet": "../assets/map_entities/undead_sprites.png",
+        "frame_size": (16, 16),
+        "offset": (10, 0),
+        "states": {"idle": strip(2, 4)},
+    },
+    "enemy/boss": {
+        "sheet": "../assets/map_entities/boss_summon_circle.png",
+        "frame_size": (16, 16),
+        "states": {"idle": [(0, 0)]},
+    },
+    "combat_player": {
+        "sheet": {
+            "idle": "../assets/combat_elements/Knight_1/Idle.png",
+            "attack": "../assets/combat_elements/Knight_1/Attack_1.png",
+            "hurt": "../assets/combat_elements/Knight_1/Hurt.png",
+            "death": "../assets/combat_elements/Knight_1/Dead.png",
+        },
+        "frame_size": (128, 128),
+        "offset": (8, 0),
+        "scale": 4,
+        "states": {
+            "idle": strip(0, 4),
+            "attack": strip(0, 5),
+            "hurt": strip(0, 2),
+            "death": strip(0, 6),
+        },
+    },
+    "combat_enemy/slime": {
+        "sheet": "../assets/map_entities/slime_sprite_sheet.png",
+        "frame_size": (24, 16),
+        "offset": (4, 0),
+        "scale": 10,
+        "states": {
+            "idle": strip(0, 2),
+            "attack": strip(1, 4),
+            "hurt": [(0, 2), (0, 0), (1, 0)],
+            "death": strip(2, 4),
+        },
+    },
+    "combat_enemy/zombie": {
+        "sheet": "../assets/combat_elements/Zombie.png",
+        "frame_size": (32, 32),
+        "scale": 8,
+        "states": {
+            "idle": strip(0, 8),
+            "attack": strip(1, 7),
+            "hurt": strip(5, 4),
+            "death": strip(5, 8),
+        },
+    },
+    "combat_enemy/skeleton": {
+        "sheet": "../assets/combat_elements/skeleton/Skeleton_enemy.png",
+        "frame_size": (64, 64),
+        "scale": 6,
+        "states": SKELETON_STATES,
+    },
+    "combat_enemy/boss": {
+        "sheet": "../assets/combat_elements/skeleton/Skeleton_enemy.png",
+        "frame_size": (64, 64),
+        "scale": 6,
+        "states": SKELETON_STATES,
+    },
+    "dice": {
+        "scale": 2,
+        "states": {
+            "angled": [
+                "../assets/dice_faces/angled-left&right-1.png",
+                "../assets/dice_faces/angled-left-2.png",
+                "../assets/dice_faces/angled-right-2.png",
+                "../assets/dice_faces/angled-left-3.png",
+                "../assets/dice_faces/angled-right-3.png",
+                "../assets/dice_faces/angled-left&right-4.png",
+                "../assets/dice_faces/angled-left&right-5.png",
+                "../assets/dice_faces/angled-left-6.png",
+                "../assets/dice_faces/angled-right-6.png",
+            ],
+            "front": [
+                "../assets/dice_faces/front&side-1.png",
+                "../assets/dice_faces/front-2.png",
+                "../assets/dice_faces/front-3.png",
+                "../assets/dice_faces/front&side-4.png",
+                "../assets/dice_faces/front-5.png",
+                "../assets/dice_faces/front-6.png",
+            ],
+        },
+    },
+}
@@ -0,0 +1,143 @@
+from collections import OrderedDict
+
+import pygame
+
+DEFAULT_BYTE_BUDGET = 64 * 1024 * 1024
+
+
+def crop(image, rect):
+    """
+    Cuts a part out of an image without copying its pixels. A part reaching past the edges of the
+    image can't be a view, so it's copied onto a transparent surface of its full size instead.
+
+    Args:
+        image (pygame.Surface): The image to cut from.
+        rect (tuple[int, int, int, int]): The x, y, width and height of the part.
+
+    :returns pygame.Surface: A view into the image, or a padded copy of the part.
+    """
+    if image.get_rect().contains(rect):
+        return image.subsurface(rect)
+    surface = pygame.Surface(rect[2:], pygame.SRCALPHA).convert_alpha()
+    surface.blit(image, (0, 0), rect)
+    return surface
+
+
+class AssetCache:
+    """
+    Decodes every image file once and hands out shared surfaces for whole images and for
+    frames cut out of them, scaled and flipped. Surfaces are shared between everything that
+    asks for the same key, so they must never be drawn on. When the cached surfaces take up
+    more than the byte budget, the least recently used ones are dropped.
+
+    Attributes:
+        byte_budget (int): The number of bytes the cached surfaces may take up.
+        entries (OrderedDict[tuple, pygame.Surface]): The cached surfaces keyed by
+            (path, rect, scale, flip, alpha), from least to most recently used.
+        size (int): The number of bytes the cached surfaces take up.
+        disk_loads (int): The number of image files read from disk so far.
+    """
+    def __init__(self, byte_budget=DEFAULT_BYTE_BUDGET):
+        """
+        Initializes an empty AssetCache.
+
+        Args:
+            byte_budget (int, optional): The number of bytes the cached surfaces may take up.
+                Defaults to DEFAULT_BYTE_BUDGET.
+        """
+        self.byte_budget = byte_budget
+        self.entries = OrderedDict()
+        self.size = 0
+        self.disk_loads = 0
+
+    @staticmethod
+    def surface_bytes(surface):
+        """
+        Args:
+            surface (pygame.Surface): The surface to measure.
+
+        :returns int: The number of bytes the pixels of the surface take up. Views share their parent's pixels
+            and take up none.
+        """
+        if surface.get_parent() is not None:
+            return 0
+        return surface.get_pitch() * surface.get_height()
+
+    def load(self, path, alpha=True):
+        """
+        Returns a whole image, reading it from disk only the first time.
+
+        Args:
+            path (str): The path of the image file.
+            alpha (bool, optional): Whether the image keeps its transparency. Defaults to True.
+
+        :returns pygame.Surface: The shared image converted to the display's pixel format.
+        """
+        return self.get(path, alpha=alpha)
+
+    def get(self, path, rect=None, scale=1, flip=False, alpha=True):
+        """
+        Returns a shared surface for an image, or a part of it, scaled and flipped.
+        Every step is cached on its own, so a flipped frame reuses its scaled frame and
+        every frame of a sheet is a view into the sheet.
+
+        Args:
+            path (str): The path of the image file.
+            rect (tuple[int, int, int, int], optional): The x, y, width and height of the part
+                to cut out. Defaults to the whole image.
+            scale (int or tuple[int, int], optional): The scale factor, or the exact size to scale to. Defaults to 1.
+            flip (bool, optional): Whether the image is flipped horizontally. Defaults to False.
+            alpha (bool, optional): Whether the image keeps its transparency. Defaults to True.
+
+        :returns pygame.Surface: The shared surface.
+        """
+        key = (path, rect, scale, flip, alpha)
+        surface = self.entries.get(key)
+        if surface is not None:
+            self.entries.move_to_end(key)
+            return surface
+
+        if flip:
+            surface = pygame.transform.flip(self.get(path, rect, scale, False, alpha), True, False)
+        elif scale != 1:
+            image = self.get(path, rect, 1, False, alpha)
+            if isinstance(scale, tuple):
+                size = scale
+            else:
+                size = (image.get_width() * scale, image.get_height() * scale)
+            surface = pygame.transform.scale(image, size)
+        elif rect is not None:
+            surface = crop(self.get(path, alpha=alpha), rect)
+        else:
+            image = pygame.image.load(path)
+            surface = image.convert_alpha() if alpha else image.convert()
+            self.disk_loads += 1
+        self.store(key, surface)
+        return surface
+
+    def store(self, key, surface):
+        """
+        Caches a surface and drops the least recently used ones while the budget is exceeded.
+        Surfaces larger than the whole budget are not cached.
+
+        Args:
+            key (tuple): The key of the surface.
+            surface (pygame.Surface): The surface to cache.
+        """
+        surface_bytes = self.surface_bytes(surface)
+        if surface_bytes > self.byte_budget:
+            return
+        self.entries[key] = surface
+        self.size += surface_bytes
+        while self.size > self.byte_budget:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= self.surface_bytes(evicted)
+
+    def clear(self):
+        """
+        Drops every cached surface.
+        """
+        self.entries.clear()
+        self.size = 0
+
+asset_cache = AssetCache()
@@ -0,0 +1,301 @@
+import os
+import queue
+import struct
+import threading
+import zlib
+
+from assets.dungeon import FloorState
+from assets.playerstate import PlayerState
+from assets.savefile import RunSave, save_run, load_run
+
+JOURNAL_MAGIC = b"TTJN"
+JOURNAL_HEADER = struct.Struct("<4sIQ")
+JOURNAL_DATA = struct.Struct("<Bq")
+JOURNAL_RECORD = struct.Struct("<BqI")
+COMPACT_EVERY = 64
+
+ENEMY_KILLED = 1
+GOLD_CHANGED = 2
+POTION_CHANGED = 3
+HEALTH_CHANGED = 4
+LUCKY_DIE_CHANGED = 5
+PLAYER_MOVED = 6
+
+
+def copy_run(run_save):
+    """
+    Copies the parts of a run that change while it's played, so it can be handed to another thread.
+    The floor snapshot and the random number generator state are immutable and shared.
+
+    Args:
+        run_save (RunSave): The run to copy.
+
+    :returns RunSave: The copy.
+    """
+    floor_state = run_save.floor_state
+    player_state = run_save.player_state
+    return RunSave(run_save.floor_number,
+                   FloorState(floor_state.snapshot, floor_state.killed),
+                   run_save.player_pos,
+                   PlayerState(player_state.current_health, player_state.gold, max_health=player_state.max_health,
+                               potion_amount=player_state.potion_amount,
+                               lucky_die_amount=player_state.lucky_die_amount),
+                   run_save.rng_state)
+
+def pack_position(pos):
+    """
+    Packs a tile position into the value of a PLAYER_MOVED record.
+
+    Args:
+        pos (tuple[int, int]): The (y, x) tile position.
+
+    :returns int: The packed position.
+    """
+    y, x = pos
+    return (y << 32) | x
+
+def unpack_position(value):
+    """
+    Unpacks the value of a PLAYER_MOVED record.
+
+    Args:
+        value (int): The packed position.
+
+    :returns tuple[int, int]: The (y, x) tile position.
+    """
+    return value >> 32, value & 0xFFFFFFFF
+
+def apply_delta(run_save, kind, value):
+    """
+    Applies a journal record to a run. Every record holds the new value instead of the change,
+    so applying a record twice gives the same run.
+
+    Args:
+        run_save (RunSave): The run to change.
+        kind (int): The type of the record, for example ENEMY_KILLED.
+        value (int): The killed enemy's index, the packed position of the player or the new amount.
+    """
+    player_state = run_save.player_state
+    if kind == ENEMY_KILLED:
+        floor_state = run_save.floor_state
+        floor_state.kill(floor_state.snapshot.enemies[value])
+    elif kind == PLAYER_MOVED:
+        run_save.player_pos = unpack_position(value)
+    elif kind == GOLD_CHANGED:
+        player_state.gold = value
+    elif kind == POTION_CHANGED:
+        player_state.potion_amount = value
+    elif kind == HEALTH_CHANGED:
+        player_state.current_health = value
+    elif kind == LUCKY_DIE_CHANGED:
+        player_state.lucky_die_amount = value
+    else:
+        raise ValueError(f"Unknown journal record type {kind}.")
+
+def read_journal(journal_path, floor_number, seed):
+    """
+    Reads the records of a journal written for the given floor. A record cut off by a crash
+    and everything after a damaged record are ignored.
+
+    Args:
+        journal_path (str): The path of the journal.
+        floor_number (int): The number of the floor the journal has to belong to.
+        seed (int): The seed of the floor the journal has to belong to.
+
+    :returns list[tuple[int, int]]: The type and value of every intact record, oldest first.
+    """
+    try:
+        with open(journal_path, "rb") as journal_file:
+            data = journal_file.read()
+    except FileNotFoundError:
+        return []
+    if len(data) < JOURNAL_HEADER.size:
+        return []
+    magic, journal_floor, journal_seed = JOURNAL_HEADER.unpack_from(data, 0)
+    if magic != JOURNAL_MAGIC or (journal_floor, journal_seed) != (floor_number, seed):
+        return []
+    records = []
+    for offset in range(JOURNAL_HEADER.size, len(data) - JOURNAL_RECORD.size + 1, JOURNAL_RECORD.size):
+        kind, value, checksum = JOURNAL_RECORD.unpack_from(data, offset)
+        if zlib.crc32(data[offset:offset + JOURNAL_DATA.size]) != checksum:
+            break
+        records.append((kind, value))
+    return records
+
+def delete_run(save_path):
+    """
+    Deletes a save file and its journal, if they exist.
+
+    Args:
+        save_path (str): The path of the save file. The journal at save_path + ".journal" is deleted too.
+    """
+    for path in (save_path, save_path + ".journal"):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+def recover_run(save_path):
+    """
+    Loads the last full save of a run and replays the journal written after it, so a run
+    interrupted by a crash continues from its last recorded change.
+
+    Args:
+        save_path (str): The path of the save file. The journal is read from save_path + ".journal".
+
+    :returns RunSave: The recovered run.
+    """
+    run_save = load_run(save_path)
+    snapshot = run_save.floor_state.snapshot
+    for kind, value in read_journal(save_path + ".journal", run_save.floor_number, snapshot.seed):
+        apply_delta(run_save, kind, value)
+    return run_save
+
+
+class AutosaveWriter:
+    """
+    Saves a run in the background. The game only puts changes on a queue, a writer thread
+    appends them to a journal next to the save file and keeps its own copy of the run up to date.
+    Every COMPACT_EVERY records, and whenever a full snapshot is handed over, the copy is written
+    as a full save and the journal starts over.
+
+    Attributes:
+        save_path (str): The path of the save file.
+        journal_path (str): The path of the journal.
+        compact_every (int): The number of journal records written before the journal is compacted.
+        queue (queue.Queue): The snapshots and records waiting to be written.
+        thread (threading.Thread): The writer thread, or None until the first snapshot.
+        run_save (RunSave): The writer thread's copy of the run.
+        journal_size (int): The number of records in the journal.
+    """
+    def __init__(self, save_path, compact_every=COMPACT_EVERY):
+        """
+        Initializes an AutosaveWriter object. The writer thread is started by the first snapshot.
+
+        Args:
+            save_path (str): The path of the save file.
+            compact_every (int, optional): The number of journal records before compaction. Defaults to COMPACT_EVERY.
+        """
+        self.save_path = save_path
+        self.journal_path = save_path + ".journal"
+        self.compact_every = compact_every
+        self.queue = queue.Queue()
+        self.thread = None
+        self.run_save = None
+        self.journal_size = 0
+
+    def snapshot(self, run_save):
+        """
+        Hands over the full run to be saved, for example when a new floor is entered.
+
+        Args:
+            run_save (RunSave): The run to save. Its changing parts are copied before it's queued.
+        """
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name="autosave", daemon=True)
+            self.thread.start()
+        self.queue.put(("snapshot", copy_run(run_save)))
+
+    def record(self, kind, value):
+        """
+        Queues a change of the run to be appended to the journal. Changes made before the
+        first snapshot are ignored.
+
+        Args:
+            kind (int): The type of the change, for example ENEMY_KILLED.
+            value (int): The killed enemy's index, the packed position of the player or the new amount.
+        """
+        if self.thread is not None:
+            self.queue.put(("record", kind, value))
+
+    def discard(self):
+        """
+        Deletes the save and the journal once everything queued so far is handled, for example when
+        the run is over. Records queued afterwards are ignored until the next snapshot.
+        """
+        if self.thread is None:
+            delete_run(self.save_path)
+        else:
+            self.queue.put(("discard",))
+
+    def flush(self):
+        """
+        Waits until everything queued so far is written.
+        """
+        if self.thread is not None:
+            self.queue.join()
+
+    def close(self):
+        """
+        Writes everything queued so far and stops the writer thread.
+        """
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join()
+            self.thread = None
+
+    def compact(self):
+        """
+        Writes the writer's copy of the run as a full save and starts a new journal for it.
+        """
+        save_run(self.save_path, self.run_save)
+        snapshot = self.run_save.floor_state.snapshot
+        with open(self.journal_path, "wb") as journal_file:
+            journal_file.write(JOURNAL_HEADER.pack(JOURNAL_MAGIC, self.run_save.floor_number, snapshot.seed))
+        self.journal_size = 0
+
+    def write_records(self, records):
+        """
+        Applies records to the writer's copy of the run and appends them to the journal.
+
+        Args:
+            records (list[tuple[int, int]]): The type and value of every record.
+        """
+        data = bytearray()
+        for kind, value in records:
+            apply_delta(self.run_save, kind, value)
+            data += JOURNAL_RECORD.pack(kind, value, zlib.crc32(JOURNAL_DATA.pack(kind, value)))
+        with open(self.journal_path, "ab") as journal_file:
+            journal_file.write(data)
+            journal_file.flush()
+            os.fsync(journal_file.fileno())
+        self.journal_size += len(records)
+        if self.journal_size >= self.compact_every:
+            self.compact()
+
+    def run(self):
+        """
+        The loop of the writer thread. Writes whatever is on the queue in batches until it's closed.
+        """
+        running = True
+        while running:
+            items = [self.queue.get()]
+            while True:
+                try:
+                    items.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            records = []
+            try:
+                for item in items:
+                    if item is None:
+                        running = False
+                    elif item[0] == "snapshot":
+                        if records:
+                            self.write_records(records)
+                            records = []
+                        self.run_save = item[1]
+                        self.compact()
+                    elif item[0] == "discard":
+                        records = []
+                        self.run_save = None
+                        delete_run(self.save_path)
+                    elif self.run_save is not None:
+                        records.append(item[1:])
+                if records:
+                    self.write_records(records)
+            except (OSError, ValueError) as error:
+                print(f"Error: autosave failed: {error}")
+            finally:
+                for _ in items:
+                    self.queue.task_done()
@@ -0,0 +1,153 @@
+import numpy as np
+
+from assets.tilegrid import WALL, FLOOR, CORRIDOR, TRAPDOOR, DOOR, MERCHANT
+
+NORTH = 1
+EAST = 2
+SOUTH = 4
+WEST = 8
+NORTH_EAST = 16
+SOUTH_EAST = 32
+SOUTH_WEST = 64
+NORTH_WEST = 128
+
+ROTATIONS = (0, 90, 180, 270)
+OPEN_TILES = (FLOOR, CORRIDOR, TRAPDOOR, MERCHANT)
+SOLID_TILES = (WALL, DOOR)
+
+
+def floor_variant(solid_bits):
+    """
+    Picks the floor image for a floor tile, shaded on the sides that touch a wall.
+
+    Args:
+        solid_bits (int): The neighbour mask of the wall and door tiles around the floor tile.
+
+    :returns tuple[int, int]: The number of the dongeonWallFloorTransparent image and its rotation.
+    """
+    north = solid_bits & NORTH
+    east = solid_bits & EAST
+    south = solid_bits & SOUTH
+    west = solid_bits & WEST
+    if north and west:
+        return 16, 0
+    if north and east:
+        return 16, 270
+    if south and west:
+        return 15, 0
+    if south and east:
+        return 15, 90
+    if west:
+        return 2, 0
+    if east:
+        return 2, 180
+    if north:
+        return 13, 0
+    if south:
+        return 14, 0
+    return 1, 0
+
+def wall_variant(open_bits):
+    """
+    Picks the wall image for a wall tile. Walls above a room show their front face, walls beside
+    and below a room are drawn as a thin edge facing the room, and the bottom corners join those edges.
+
+    Args:
+        open_bits (int): The neighbour mask of the walkable tiles around the wall tile.
+
+    :returns tuple[int or str, int]: The number of the dongeonWallFloorTransparent image, or "corner",
+        and its rotation.
+    """
+    if open_bits & SOUTH or (open_bits & EAST and open_bits & WEST):
+        return 10, 0
+    if open_bits & EAST:
+        return 3, 0
+    if open_bits & WEST:
+        return 6, 0
+    if open_bits & NORTH:
+        return 3, 90
+    if open_bits & (SOUTH_EAST | SOUTH_WEST):
+        return 10, 0
+    if open_bits & NORTH_EAST and not open_bits & NORTH_WEST:
+        return "corner", 0
+    if open_bits & NORTH_WEST and not open_bits & NORTH_EAST:
+        return "corner", 90
+    return 10, 0
+
+def door_variant(open_bits):
+    """
+    Picks the door image for a door tile, turned to face the room beside it.
+
+    Args:
+        open_bits (int): The neighbour mask of the walkable tiles around the door tile.
+
+    :returns tuple[str, int]: The "door" image name and its rotation.
+    """
+    if open_bits & WEST and not open_bits & SOUTH:
+        return "door", 270
+    if open_bits & EAST and not open_bits & SOUTH:
+        return "door", 90
+    return "door", 0
+
+ATLAS_KEYS = ([(variant, rotation) for variant in range(1, 17) for rotation in ROTATIONS]
+              + [(name, rotation) for name in ("corner", "door", "trapdoor") for rotation in ROTATIONS])
+ATLAS_INDEX = {key: index for index, key in enumerate(ATLAS_KEYS)}
+FLOOR_LOOKUP = np.array([ATLAS_INDEX[floor_variant(bits)] for bits in range(256)], dtype=np.int16)
+WALL_LOOKUP = np.array([ATLAS_INDEX[wall_variant(bits)] for bits in range(256)], dtype=np.int16)
+DOOR_LOOKUP = np.array([ATLAS_INDEX[door_variant(bits)] for bits in range(256)], dtype=np.int16)
+
+
+def neighbour_mask(mask):
+    """
+    Packs, for every cell, which of its 8 neighbours are set in a boolean mask into one byte.
+    Cells outside the mask count as not set.
+
+    Args:
+        mask (numpy.ndarray): A 2D boolean array.
+
+    :returns numpy.ndarray: A uint8 array of NORTH, EAST, SOUTH, WEST and diagonal bits.
+    """
+    height, width = mask.shape
+    padded = np.pad(mask, 1).astype(np.uint8)
+    bits = np.zeros(mask.shape, dtype=np.uint8)
+    for bit, dy, dx in ((NORTH, -1, 0), (EAST, 0, 1), (SOUTH, 1, 0), (WEST, 0, -1),
+                        (NORTH_EAST, -1, 1), (SOUTH_EAST, 1, 1), (SOUTH_WEST, 1, -1), (NORTH_WEST, -1, -1)):
+        bits |= padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width] * np.uint8(bit)
+    return bits
+
+def autotile(grid, x=0, y=0, width=None, height=None):
+    """
+    Chooses the atlas image of every visible tile inside a region of a dungeon map from its neighbours.
+    Only the region and a one tile border around it are looked at, so large maps can be tiled piece by piece.
+
+    Args:
+        grid (TileGrid): The grid of tiles representing the dungeon map.
+        x (int, optional): The x-coordinate of the region's top-left tile. Defaults to 0.
+        y (int, optional): The y-coordinate of the region's top-left tile. Defaults to 0.
+        width (int, optional): The width of the region in tiles. Defaults to the rest of the map.
+        height (int, optional): The height of the region in tiles. Defaults to the rest of the map.
+
+    :returns list[tuple[int, int, tuple]]: The (y, x) position relative to the region and the ATLAS_KEYS key
+        of every tile to draw, in row-major order.
+    """
+    width = grid.width - x if width is None else min(width, grid.width - x)
+    height = grid.height - y if height is None else min(height, grid.height - y)
+    top = max(0, y - 1)
+    left = max(0, x - 1)
+    codes = grid.codes[top:min(grid.height, y + height + 1), left:min(grid.width, x + width + 1)]
+    open_bits = neighbour_mask(np.isin(codes, OPEN_TILES))
+    solid_bits = neighbour_mask(np.isin(codes, SOLID_TILES))
+
+    atlas_index = np.full(codes.shape, -1, dtype=np.int16)
+    floors = np.isin(codes, (FLOOR, CORRIDOR, MERCHANT))
+    atlas_index[floors] = FLOOR_LOOKUP[solid_bits[floors]]
+    walls = codes == WALL
+    atlas_index[walls] = WALL_LOOKUP[open_bits[walls]]
+    doors = codes == DOOR
+    atlas_index[doors] = DOOR_LOOKUP[open_bits[doors]]
+    atlas_index[codes == TRAPDOOR] = ATLAS_INDEX[("trapdoor", 0)]
+
+    region = atlas_index[y - top:y - top + height, x - left:x - left + width]
+    ys, xs = np.nonzero(region >= 0)
+    return [(tile_y, tile_x, ATLAS_KEYS[index])
+            for tile_y, tile_x, index in zip(ys.tolist(), xs.tolist(), region[ys, xs].tolist())]
@@ -2,6 +2,8 @@ from email.mime import image
 
 import pygame
 
+from assets.text_cache import text_cache
+
 class Button:
     """
     Button class for creating a button in a pygame window.
@@ -21,7 +23,7 @@ class Button:
         text_rect (pygame.Rect): The rectangle representing the button's text position.
     """
     pygame.init()
-    def __init__(self, pos, text_input, font=pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 50),
+    def __init__(self, pos, text_input, font=None,
                  base_color=(169,169,169), rect_color=(0,0,0), rect_size=None, hover_color=(112,128,144)):
         """
         Initializes a Button object.
@@ -29,7 +31,8 @@ class Button:
         Args:
             pos (tuple): The position of the button as a tuple (x, y).
             text_input (str): The text displayed on the button.
-            font (pygame.font.Font, optional): The font used for rendering the button's text.
+            font (pygame.font.Font, optional): The font used for rendering the button's text. Defaults to the
+                game's font in size 50.
             base_color (tuple, optional): The color of the button's text.
             rect_color (tuple, optional): The color of the button's rectangle.
             rect_size (tuple, optional): The size of the button's rectangle.
@@ -37,13 +40,13 @@ class Button:
         """
         self.x_pos = pos[0]
         self.y_pos = pos[1]
-        self.font = font
+        self.font = font if font is not None else text_cache.font(50)
         self.default_rect_color = rect_color
         self.text_input = text_input
         self.base_color = base_color
         self.rect_color = rect_color
         self.hover_color = hover_color
-        self.text = self.font.render(self.text_input, False, self.base_color)
+        self.text = text_cache.render(self.font, self.text_input, self.base_color)
         text_width = self.text.get_width()
         text_height = self.text.get_height()
 
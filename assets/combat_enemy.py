@@ -1,30 +1,8 @@
 import pygame
-import random
 
-from assets.spritesheet import HandleSpriteSheet
-
-ENEMY_STATS = {
-    "slime": {
-        "max_health": 30,
-        "damage_range": (3,7),
-        "reward_range": (10,15)
-    },
-    "skeleton": {
-        "max_health": 45,
-        "damage_range": (10,14),
-        "reward_range": (15,20)
-    },
-    "zombie": {
-        "max_health": 60,
-        "damage_range": (7,12),
-        "reward_range": (20,25)
-    },
-    "boss":{
-        "max_health": 80,
-        "damage_range": (12,16),
-        "reward_range": (20,25)
-    }
-}
+from assets.animation_bank import get_animation_bank
+from assets.combat_rules import ENEMY_STATS, roll_enemy
+from assets.game_clock import game_clock
 
 class CombatEnemy(pygame.sprite.Sprite):
     """
@@ -39,14 +17,13 @@ class CombatEnemy(pygame.sprite.Sprite):
         damage (int): The amount of damage an enemy can deal to a target.
         reward (int): The reward value for defeating an enemy.
         image (pygame.Surface): The enemy's image.
-        sprite_sheet (pygame.Surface): The sprite sheet containing animation
-        frames for the enemy.
-        frames (dict): A dictionary for different enemy states.
+        frames (dict): The shared animation frames of the enemy's type for each enemy state.
         frame_index (int): The index of the current frame being displayed in the
         enemy's animation.
         rect (pygame.Rect): The rectangle representing the enemy's position and size.
         frame_timer (int): The timestamp of the last frame update for timing animations.
         frame_delay (int): The delay between animation frame changes.
+        clock (GameClock): The clock timing the animations and the delays after attacks and death.
         state (str): The current state of the enemy.
         is_dead (bool): True if the enemy is dead, False otherwise.
         animation_finished (bool): True if the current animation is finished, False otherwise.
@@ -54,7 +31,7 @@ class CombatEnemy(pygame.sprite.Sprite):
         attack_timer (int): A timer for handling delay after attack state.
         death_timer (int): A timer for handling delay after death state.
     """
-    def __init__(self,x,y,enemy_type,frame_delay=250):
+    def __init__(self,x,y,enemy_type,frame_delay=250,flip=False,clock=game_clock,damage=None,reward=None):
         """
         Initializes an enemy object.
 
@@ -63,6 +40,10 @@ class CombatEnemy(pygame.sprite.Sprite):
             y (int): The y coordinate of the enemy's position.
             enemy_type (str): The type of the enemy.
             frame_delay (int,optional): The delay between animation frame changes.
+            flip (bool, optional): Whether the enemy faces left. Defaults to False.
+            clock (GameClock, optional): The clock timing the animations. Defaults to the shared game clock.
+            damage (int, optional): The damage of the enemy. Rolled from ENEMY_STATS if it's None.
+            reward (int, optional): The reward for defeating the enemy. Rolled from ENEMY_STATS if it's None.
         """
         super().__init__()
         stats = ENEMY_STATS.get(enemy_type)
@@ -71,145 +52,23 @@ class CombatEnemy(pygame.sprite.Sprite):
         self.enemy_type = enemy_type
         self.max_health = stats["max_health"]
         self.current_health = self.max_health
-        self.damage = random.randint(*stats["damage_range"])
-        self.reward = random.randint(*stats["reward_range"])
-        self.image = None
-        self.sprite_sheet = None
-        self.frames = {}
+        if damage is None or reward is None:
+            damage, reward = roll_enemy(enemy_type)
+        self.damage = damage
+        self.reward = reward
+        self.frames = get_animation_bank("combat_enemy/" + enemy_type).frames(flip)
         self.frame_index = 0
-        self.rect = pygame.Rect(x,y,100,100)
         self.frame_timer = 0
         self.frame_delay = frame_delay
+        self.clock = clock
         self.state = "idle"
+        self.image = self.frames[self.state][0]
+        self.rect = self.image.get_rect(topleft=(x, y))
         self.is_dead = False
         self.animation_finished = False
         self.next_state = None
         self.attack_timer = 0
         self.death_timer = 0
-        self.load_sprite_sheet()
-        self.load_frames()
-
-    def load_sprite_sheet(self):
-        """
-        Loads the sprite sheet for the enemy based on its type.
-        """
-        if self.enemy_type == "slime":
-            self.sprite_sheet = pygame.image.load("../assets/map_entities/slime_sprite_sheet.png").convert_alpha()
-        if self.enemy_type == "skeleton" or self.enemy_type == "boss":
-            self.sprite_sheet = pygame.image.load("../assets/combat_elements/skeleton/Skeleton_enemy.png").convert_alpha()
-        if self.enemy_type == "zombie":
-            self.sprite_sheet = pygame.image.load("../assets/combat_elements/Zombie.png").convert_alpha()
-
-    def load_frames(self):
-        """
-        Loads the enemy's animation frames from the sprite sheet and associates them with their respective dictionary keys
-        based on enemy type.
-        """
-        sprite_loader = HandleSpriteSheet(self.sprite_sheet)
-        if self.enemy_type == "slime":
-            self.frames["idle"] = [
-                sprite_loader.get_image(0, 0, 24, 16, offset_h=4, scale=10),
-                sprite_loader.get_image(1, 0, 24, 16, offset_h=4, scale=10)
-            ]
-            self.frames["attack"] = [
-                sprite_loader.get_image(0, 1, 24, 16, offset_h=4,scale=10),
-                sprite_loader.get_image(1, 1, 24, 16, offset_h=4,scale=10),
-                sprite_loader.get_image(2, 1, 24, 16, offset_h=4,scale=10),
-                sprite_loader.get_image(3, 1, 24, 16, offset_h=4,scale=10)
-            ]
-            self.frames["hurt"] = [
-                sprite_loader.get_image(0, 2, 24, 16, offset_h=4, scale=10),
-                sprite_loader.get_image(0, 0, 24, 16, offset_h=4, scale=10),
-                sprite_loader.get_image(1, 0, 24, 16, offset_h=4, scale=10)
-            ]
-            self.frames["death"] = [
-                sprite_loader.get_image(0, 2, 24, 16, offset_h=4, scale=10),
-                sprite_loader.get_image(1, 2, 24, 16, offset_h=4, scale=10),
-                sprite_loader.get_image(2, 2, 24, 16, offset_h=4, scale=10),
-                sprite_loader.get_image(3, 2, 24, 16, offset_h=4, scale=10)
-            ]
-        if self.enemy_type == "zombie":
-            self.frames["idle"] = [
-                sprite_loader.get_image(0, 0, 32, 32, scale=8),
-                sprite_loader.get_image(1, 0, 32, 32, scale=8),
-                sprite_loader.get_image(2, 0, 32, 32, scale=8),
-                sprite_loader.get_image(3, 0, 32, 32, scale=8),
-                sprite_loader.get_image(4, 0, 32, 32, scale=8),
-                sprite_loader.get_image(5, 0, 32, 32, scale=8),
-                sprite_loader.get_image(6, 0, 32, 32, scale=8),
-                sprite_loader.get_image(7, 0, 32, 32, scale=8)
-            ]
-            self.frames["attack"] = [
-                sprite_loader.get_image(0, 1, 32, 32, scale=8),
-                sprite_loader.get_image(1, 1, 32, 32, scale=8),
-                sprite_loader.get_image(2, 1, 32, 32, scale=8),
-                sprite_loader.get_image(3, 1, 32, 32, scale=8),
-                sprite_loader.get_image(4, 1, 32, 32, scale=8),
-                sprite_loader.get_image(5, 1, 32, 32, scale=8),
-                sprite_loader.get_image(6, 1, 32, 32, scale=8)
-            ]
-            self.frames["hurt"] = [
-                sprite_loader.get_image(0, 5, 32, 32, scale=8),
-                sprite_loader.get_image(1, 5, 32, 32, scale=8),
-                sprite_loader.get_image(2, 5, 32, 32, scale=8),
-                sprite_loader.get_image(3, 5, 32, 32, scale=8)
-            ]
-            self.frames["death"] = [
-                sprite_loader.get_image(0, 5, 32, 32, scale=8),
-                sprite_loader.get_image(1, 5, 32, 32, scale=8),
-                sprite_loader.get_image(2, 5, 32, 32, scale=8),
-                sprite_loader.get_image(3, 5, 32, 32, scale=8),
-                sprite_loader.get_image(4, 5, 32, 32, scale=8),
-                sprite_loader.get_image(5, 5, 32, 32, scale=8),
-                sprite_loader.get_image(6, 5, 32, 32, scale=8),
-                sprite_loader.get_image(7, 5, 32, 32, scale=8)
-            ]
-        if self.enemy_type == "skeleton" or self.enemy_type == "boss":
-            self.frames["idle"] = [
-                sprite_loader.get_image(0, 3, 64, 64, scale=6),
-                sprite_loader.get_image(1, 3, 64, 64, scale=6),
-                sprite_loader.get_image(2, 3, 64, 64, scale=6),
-                sprite_loader.get_image(3, 3, 64, 64, scale=6)
-            ]
-            self.frames["attack"] = [
-                sprite_loader.get_image(0, 0, 64, 64, scale=6),
-                sprite_loader.get_image(1, 0, 64, 64, scale=6),
-                sprite_loader.get_image(2, 0, 64, 64, scale=6),
-                sprite_loader.get_image(3, 0, 64, 64, scale=6),
-                sprite_loader.get_image(4, 0, 64, 64, scale=6),
-                sprite_loader.get_image(5, 0, 64, 64, scale=6),
-                sprite_loader.get_image(6, 0, 64, 64, scale=6),
-                sprite_loader.get_image(7, 0, 64, 64, scale=6),
-                sprite_loader.get_image(8, 0, 64, 64, scale=6),
-                sprite_loader.get_image(9, 0, 64, 64, scale=6),
-                sprite_loader.get_image(10, 0, 64, 64, scale=6),
-                sprite_loader.get_image(11, 0, 64, 64, scale=6),
-                sprite_loader.get_image(12, 0, 64, 64, scale=6)
-            ]
-            self.frames["hurt"] = [
-                sprite_loader.get_image(0, 4, 64, 64, scale=6),
-                sprite_loader.get_image(1, 4, 64, 64, scale=6),
-                sprite_loader.get_image(2, 4, 64, 64, scale=6),
-
-            ]
-            self.frames["death"] = [
-                sprite_loader.get_image(0, 1, 64, 64, scale=6),
-                sprite_loader.get_image(1, 1, 64, 64, scale=6),
-                sprite_loader.get_image(2, 1, 64, 64, scale=6),
-                sprite_loader.get_image(3, 1, 64, 64, scale=6),
-                sprite_loader.get_image(4, 1, 64, 64, scale=6),
-                sprite_loader.get_image(5, 1, 64, 64, scale=6),
-                sprite_loader.get_image(6, 1, 64, 64, scale=6),
-                sprite_loader.get_image(7, 1, 64, 64, scale=6),
-                sprite_loader.get_image(8, 1, 64, 64, scale=6),
-                sprite_loader.get_image(9, 1, 64, 64, scale=6),
-                sprite_loader.get_image(10, 1, 64, 64, scale=6),
-                sprite_loader.get_image(11, 1, 64, 64, scale=6),
-                sprite_loader.get_image(12, 1, 64, 64, scale=6)
-            ]
-        if self.frames[self.state]:
-            self.image = self.frames[self.state][0]
-            self.rect = self.image.get_rect(topleft=(self.x, self.y))
 
     def change_state(self,new_state):
         """
@@ -222,10 +81,9 @@ class CombatEnemy(pygame.sprite.Sprite):
         if self.animation_finished or self.state == "idle":
             print(f"ENEMY:State changed to {new_state}")
             self.state = new_state
-            self.load_sprite_sheet()
-            self.load_frames()
+            self.image = self.frames[new_state][0]
             self.frame_index = 0
-            self.frame_timer = pygame.time.get_ticks()
+            self.frame_timer = self.clock.get_ticks()
             self.animation_finished = new_state != "idle"
             self.next_state = "idle" if new_state != "idle" else None
         else:
@@ -236,8 +94,8 @@ class CombatEnemy(pygame.sprite.Sprite):
         """
         Updates the animation frames based on the current state and elapsed time.
         """
-        current_time = pygame.time.get_ticks()
-        if current_time - self.frame_timer > self.frame_delay:
+        current_time = self.clock.get_ticks()
+        if current_time - self.frame_timer > self.clock.wait(self.frame_delay):
             self.frame_index += 1
             self.frame_timer = current_time
             if self.frame_index >= len(self.frames[self.state]):
@@ -264,44 +122,37 @@ class CombatEnemy(pygame.sprite.Sprite):
 
     def take_damage(self,damage):
         """
-        Handles damage taken calculation and set's enemy's state into hurt if possible.
+        Shows the damage taken by the enemy and set's enemy's state into hurt if possible.
         Handles reward and set state into death if the enemy cannot take any more damage.
 
         Args:
-            damage (int): The damage value taken by the enemy
+            damage (int): The damage value taken by the enemy, as computed by the combat rules.
 
         :returns: Reward for defeating an enemy,
         """
-        if self.enemy_type == "boss":
-            self.current_health -= damage // 2
-            print(f"{self.enemy_type} takes {damage // 2} damage! Current health: {self.current_health}")
-        else:
-            self.current_health -= damage
-            print(f"{self.enemy_type} takes {damage} damage! Current health: {self.current_health}")
+        self.current_health -= damage
+        print(f"{self.enemy_type} takes {damage} damage! Current health: {self.current_health}")
         if self.current_health > 0:
             if self.state == "idle" or self.animation_finished:
                 self.change_state("hurt")
-                self.attack_timer = pygame.time.get_ticks()
+                self.attack_timer = self.clock.get_ticks()
         else:
             self.change_state("death")
-            self.death_timer = pygame.time.get_ticks()
+            self.death_timer = self.clock.get_ticks()
             print(f"{self.enemy_type} is defeated! Reward: {self.reward}")
             self.is_dead = True
             return self.reward
 
-    def attack(self,player,dice_roll_value):
+    def attack(self,player,attack_damage):
         """
-        Sets enemy's state to attack if possible. Handles enemy damage calculation.
+        Sets enemy's state to attack and shows the damage dealt to the player.
 
         Args:
             player (CombatPlayer): The player object that will take the damage value from the enemy's attack
-            dice_roll_value (int): The value rolled by a die which will be added to the enemy's attack
-            damage.
+            attack_damage (int): The damage of the attack, as computed by the combat rules.
 
         """
-        attack_damage = self.damage + dice_roll_value
-        if self.state == "idle" or self.animation_finished:
-            self.change_state("attack")
-            self.next_state = "idle"
-            print(f"Enemy attacks for Dice roll value {dice_roll_value}, damage {self.damage}")
-            player.take_damage(attack_damage)
\ No newline at end of file
+        self.change_state("attack")
+        self.next_state = "idle"
+        print(f"Enemy attacks for {attack_damage} damage!")
+        player.take_damage(attack_damage)
\ No newline at end of file
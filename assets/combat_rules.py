@@ -0,0 +1,228 @@
+"""
+The rules of a combat, without pygame, so fights can be run headless for balancing and testing.
+Fight plays a fight one turn at a time. The combat scene plays its turns through a Fight, the sprites only show them.
+"""
+import random
+
+ENEMY_STATS = {
+    "slime": {
+        "max_health": 30,
+        "damage_range": (3,7),
+        "reward_range": (10,15)
+    },
+    "skeleton": {
+        "max_health": 45,
+        "damage_range": (10,14),
+        "reward_range": (15,20)
+    },
+    "zombie": {
+        "max_health": 60,
+        "damage_range": (7,12),
+        "reward_range": (20,25)
+    },
+    "boss":{
+        "max_health": 80,
+        "damage_range": (12,16),
+        "reward_range": (20,25)
+    }
+}
+PLAYER_DAMAGE = 10
+
+
+def roll_face(rng=random):
+    """
+    Rolls a die.
+
+    Args:
+        rng (random.Random, optional): The random number generator to use. Defaults to the random module.
+
+    :returns int: The face the die landed on, from 1 to 6.
+    """
+    return rng.randint(1, 6)
+
+
+def roll_value(face):
+    """
+    Computes the value of a rolled face for combat purposes. A six counts double.
+
+    Args:
+        face (int): The face the die landed on, from 1 to 6.
+
+    :returns int: The value of the roll.
+    """
+    if face == 6:
+        return face * 2
+    return face
+
+
+def roll_enemy(enemy_type, rng=random):
+    """
+    Rolls the damage and the reward of a new enemy.
+
+    Args:
+        enemy_type (str): The type of the enemy.
+        rng (random.Random, optional): The random number generator to use. Defaults to the random module.
+
+    :returns tuple[int, int]: The damage and the reward of the enemy.
+    """
+    stats = ENEMY_STATS[enemy_type]
+    damage = rng.randint(*stats["damage_range"])
+    reward = rng.randint(*stats["reward_range"])
+    return damage, reward
+
+
+def player_attack_damage(damage, dice_roll_value, lucky_die_amount, rng=random):
+    """
+    Computes the damage of the player's attack. Every lucky die adds the same extra roll of a die.
+
+    Args:
+        damage (int): The base damage of the player.
+        dice_roll_value (int): The value rolled by the die.
+        lucky_die_amount (int): The amount of lucky dice the player holds.
+        rng (random.Random, optional): The random number generator to use. Defaults to the random module.
+
+    :returns int: The damage dealt to the enemy, before the enemy's defense.
+    """
+    return damage + dice_roll_value + (lucky_die_amount * rng.randint(1,6))
+
+
+def enemy_attack_damage(damage, dice_roll_value):
+    """
+    Computes the damage of an enemy's attack.
+
+    Args:
+        damage (int): The damage of the enemy.
+        dice_roll_value (int): The value rolled by the player's die, which is added to the enemy's damage too.
+
+    :returns int: The damage dealt to the player.
+    """
+    return damage + dice_roll_value
+
+
+def damage_taken(enemy_type, damage):
+    """
+    Computes how much of an attack an enemy takes. The boss takes half damage.
+
+    Args:
+        enemy_type (str): The type of the enemy.
+        damage (int): The damage of the attack.
+
+    :returns int: The damage taken by the enemy.
+    """
+    if enemy_type == "boss":
+        return damage // 2
+    return damage
+
+
+class Turn:
+    """
+    The result of one turn of a fight.
+
+    Attributes:
+        face (int): The face the player's die landed on.
+        player_damage (int): The damage the enemy took from the player's attack.
+        enemy_damage (int): The damage the player took from the enemy's attack, 0 if the enemy died first.
+    """
+    def __init__(self, face, player_damage, enemy_damage):
+        """
+        Initializes a Turn object.
+
+        Args:
+            face (int): The face the player's die landed on.
+            player_damage (int): The damage the enemy took from the player's attack.
+            enemy_damage (int): The damage the player took from the enemy's attack.
+        """
+        self.face = face
+        self.player_damage = player_damage
+        self.enemy_damage = enemy_damage
+
+
+class Fight:
+    """
+    A fight between the player and an enemy. Each turn the player rolls the die and attacks,
+    then the enemy attacks back with the same roll if it's still alive.
+
+    Attributes:
+        enemy_type (str): The type of the enemy.
+        rng (random.Random): The random number generator rolling the dice and the enemy.
+        player_health (int): The player's current health.
+        player_damage (int): The base damage of the player.
+        lucky_die_amount (int): The amount of lucky dice the player holds.
+        enemy_health (int): The enemy's current health.
+        enemy_damage (int): The damage of the enemy.
+        reward (int): The gold rewarded for defeating the enemy.
+        turns (int): The number of turns played.
+    """
+    def __init__(self, enemy_type, player_health, lucky_die_amount=0, rng=random, player_damage=PLAYER_DAMAGE):
+        """
+        Initializes a Fight and rolls the enemy.
+
+        Args:
+            enemy_type (str): The type of the enemy.
+            player_health (int): The player's health at the start of the fight.
+            lucky_die_amount (int, optional): The amount of lucky dice the player holds. Defaults to 0.
+            rng (random.Random, optional): The random number generator to use. Defaults to the random module.
+            player_damage (int, optional): The base damage of the player. Defaults to 10.
+        """
+        if enemy_type not in ENEMY_STATS:
+            raise ValueError(f"Unknown enemy type: {enemy_type}")
+        self.enemy_type = enemy_type
+        self.rng = rng
+        self.player_health = player_health
+        self.player_damage = player_damage
+        self.lucky_die_amount = lucky_die_amount
+        self.enemy_health = ENEMY_STATS[enemy_type]["max_health"]
+        self.enemy_damage, self.reward = roll_enemy(enemy_type, rng)
+        self.turns = 0
+
+    @property
+    def won(self):
+        """
+        :returns bool: True if the enemy is defeated.
+        """
+        return self.enemy_health <= 0
+
+    @property
+    def lost(self):
+        """
+        :returns bool: True if the player died.
+        """
+        return self.player_health <= 0
+
+    @property
+    def over(self):
+        """
+        :returns bool: True if the fight has ended.
+        """
+        return self.won or self.lost
+
+    def step(self):
+        """
+        Plays one turn of the fight.
+
+        :returns Turn: What happened in the turn.
+        """
+        if self.over:
+            raise ValueError("The fight is already over.")
+        rng = self.rng
+        face = roll_face(rng)
+        dice_roll_value = roll_value(face)
+        attack = player_attack_damage(self.player_damage, dice_roll_value, self.lucky_die_amount, rng)
+        player_damage = damage_taken(self.enemy_type, attack)
+        self.enemy_health -= player_damage
+        enemy_damage = 0
+        if not self.won:
+            enemy_damage = enemy_attack_damage(self.enemy_damage, dice_roll_value)
+            self.player_health -= enemy_damage
+        self.turns += 1
+        return Turn(face, player_damage, enemy_damage)
+
+    def run(self):
+        """
+        Plays turns until the fight is over.
+
+        :returns bool: True if the player won.
+        """
+        while not self.over:
+            self.step()
+        return self.won
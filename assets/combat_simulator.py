@@ -0,0 +1,176 @@
+"""
+Runs many fights at once with NumPy, for balancing the enemies. It follows the rules in assets/combat_rules.py,
+but plays a turn of every running fight with a few array operations instead of one Fight at a time.
+"""
+import numpy as np
+
+from assets.combat_rules import ENEMY_STATS, PLAYER_DAMAGE
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+class FightResults:
+    """
+    The outcomes of a batch of simulated fights against one enemy type.
+
+    Attributes:
+        enemy_type (str): The type of the enemy fought.
+        won (numpy.ndarray): A boolean array, True where the player won the fight.
+        turns (numpy.ndarray): The number of turns each fight lasted.
+        player_health (numpy.ndarray): The player's health at the end of each fight, 0 or less if the player died.
+    """
+    def __init__(self, enemy_type, won, turns, player_health):
+        """
+        Initializes a FightResults object.
+
+        Args:
+            enemy_type (str): The type of the enemy fought.
+            won (numpy.ndarray): A boolean array, True where the player won the fight.
+            turns (numpy.ndarray): The number of turns each fight lasted.
+            player_health (numpy.ndarray): The player's health at the end of each fight.
+        """
+        self.enemy_type = enemy_type
+        self.won = won
+        self.turns = turns
+        self.player_health = player_health
+
+    @property
+    def count(self):
+        """
+        :returns int: The number of fights.
+        """
+        return len(self.won)
+
+    @property
+    def win_rate(self):
+        """
+        :returns float: The fraction of fights the player won.
+        """
+        return float(self.won.mean()) if self.count else 0.0
+
+    def turns_distribution(self, won_only=True):
+        """
+        Counts how many fights lasted each number of turns.
+
+        Args:
+            won_only (bool, optional): Whether to count only the fights the player won, i.e. the turns to kill. Defaults to True.
+
+        :returns numpy.ndarray: The number of fights that lasted i turns at index i.
+        """
+        turns = self.turns[self.won] if won_only else self.turns
+        return np.bincount(turns)
+
+    def health_distribution(self):
+        """
+        Counts how much health the player had left after the fights the player won.
+
+        :returns numpy.ndarray: The number of won fights that left the player with i health at index i.
+        """
+        return np.bincount(self.player_health[self.won])
+
+
+def distribution_percentile(counts, fraction):
+    """
+    Picks the value below which the given fraction of a distribution lies, using the nearest rank.
+
+    Args:
+        counts (numpy.ndarray): The number of samples with value i at index i.
+        fraction (float): The fraction between 0 and 1.
+
+    :returns int or None: The percentile value, or None if the distribution is empty.
+    """
+    cumulative = np.cumsum(counts)
+    if len(cumulative) == 0 or cumulative[-1] == 0:
+        return None
+    rank = max(1, round(fraction * int(cumulative[-1])))
+    return int(np.searchsorted(cumulative, rank))
+
+
+def simulate_chunk(rng, enemy_type, count, player_health, lucky_die_amount, player_damage, stats):
+    """
+    Plays a chunk of fights against one enemy type to the end, one turn of all running fights at a time.
+
+    Args:
+        rng (numpy.random.Generator): The random number generator to use.
+        enemy_type (str): The type of the enemy.
+        count (int): The number of fights.
+        player_health (int): The player's health at the start of each fight.
+        lucky_die_amount (int): The amount of lucky dice the player holds.
+        player_damage (int): The base damage of the player.
+        stats (dict): The stats of the enemy type, as in ENEMY_STATS.
+
+    :returns tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Whether the player won, the number of turns
+        and the player's health at the end of each fight.
+    """
+    won = np.zeros(count, dtype=bool)
+    turns = np.zeros(count, dtype=np.int32)
+    final_health = np.zeros(count, dtype=np.int32)
+
+    damage_low, damage_high = stats["damage_range"]
+    fights = np.arange(count, dtype=np.int32)
+    enemy_damage = rng.integers(damage_low, damage_high + 1, size=count, dtype=np.int32)
+    enemy_health = np.full(count, stats["max_health"], dtype=np.int32)
+    health = np.full(count, player_health, dtype=np.int32)
+    halved = enemy_type == "boss"
+
+    turn = 0
+    while len(fights):
+        turn += 1
+        running = len(fights)
+        dice_roll_value = rng.integers(1, 7, size=running, dtype=np.int32)
+        dice_roll_value[dice_roll_value == 6] = 12
+        attack = dice_roll_value + player_damage
+        if lucky_die_amount:
+            attack += lucky_die_amount * rng.integers(1, 7, size=running, dtype=np.int32)
+        if halved:
+            attack //= 2
+        enemy_health -= attack
+        enemy_dead = enemy_health <= 0
+        health -= np.where(enemy_dead, 0, enemy_damage + dice_roll_value)
+        player_dead = health <= 0
+
+        over = enemy_dead | player_dead
+        if over.any():
+            ended = fights[over]
+            won[ended] = enemy_dead[over]
+            turns[ended] = turn
+            final_health[ended] = health[over]
+            still_running = ~over
+            fights = fights[still_running]
+            enemy_damage = enemy_damage[still_running]
+            enemy_health = enemy_health[still_running]
+            health = health[still_running]
+    return won, turns, final_health
+
+
+def simulate_fights(enemy_type, count, player_health, lucky_die_amount=0, seed=None,
+                    player_damage=PLAYER_DAMAGE, enemy_stats=ENEMY_STATS, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Simulates independent fights against one enemy type. The fights are played in chunks, so the
+    memory use stays bounded however many fights are simulated.
+
+    Args:
+        enemy_type (str): The type of the enemy.
+        count (int): The number of fights.
+        player_health (int): The player's health at the start of each fight.
+        lucky_die_amount (int, optional): The amount of lucky dice the player holds. Defaults to 0.
+        seed (int, optional): The seed of the random number generator. Defaults to None, a random seed.
+        player_damage (int, optional): The base damage of the player. Defaults to 10.
+        enemy_stats (dict, optional): The stats of every enemy type. Defaults to ENEMY_STATS.
+        chunk_size (int, optional): The number of fights played at once. Defaults to 2**20.
+
+    :returns FightResults: The outcomes of the fights.
+    """
+    if enemy_type not in enemy_stats:
+        raise ValueError(f"Unknown enemy type: {enemy_type}")
+    if player_health <= 0:
+        raise ValueError("The player's health must be positive.")
+    rng = np.random.default_rng(seed)
+    won = np.empty(count, dtype=bool)
+    turns = np.empty(count, dtype=np.int32)
+    final_health = np.empty(count, dtype=np.int32)
+    for start in range(0, count, chunk_size):
+        end = min(count, start + chunk_size)
+        won[start:end], turns[start:end], final_health[start:end] = simulate_chunk(
+            rng, enemy_type, end - start, player_health, lucky_die_amount, player_damage, enemy_stats[enemy_type])
+    return FightResults(enemy_type, won, turns, final_health)
@@ -1,5 +1,8 @@
 import pygame
 import random
+
+from assets.animation_bank import get_animation_bank
+from assets.combat_rules import roll_face, roll_value
 pygame.init()
 
 class Dice(pygame.sprite.Sprite):
@@ -17,19 +20,23 @@ class Dice(pygame.sprite.Sprite):
         start (bool): Indicates whether the die has stopped the animation.
         x_offset (int): The current x-offset applied to the dice.
         jump_strength (int): The strength of the jump applied to the dice.
-        angled_frames (list): A list of surfaces representing the die's angled frames.
-        front_frames (list): A list of surfaces representing the die's front frames.
+        angled_frames (tuple): The shared surfaces representing the die's angled frames.
+        front_frames (tuple): The shared surfaces representing the die's front frames.
         current_frame_index (int): The index of the current frame.
         frame_counter (int): The counter used to determine when to change frames.
         ground_level (int): The y-coordinate of the ground level.
         landed_index (int): The index of the last frame which has the die landed on.
+        result_face (int): The face the die lands on, or None to roll it when the die lands.
+        previous_topleft (tuple[int, int]): The position of the die before the last update.
     """
     def __init__(self, x, y):
         super().__init__()
         self.starting_x = x
         self.starting_y = y
-        self.image = pygame.image.load("../assets/dice_faces/front-6.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, (self.image.get_width() * 2, self.image.get_height() * 2))
+        frames = get_animation_bank("dice").frames()
+        self.angled_frames = frames["angled"]
+        self.front_frames = frames["front"]
+        self.image = self.front_frames[5]
         self.rect = self.image.get_rect(midbottom=(x, y))
         self.gravity = 0
         self.jumped = False
@@ -38,69 +45,24 @@ class Dice(pygame.sprite.Sprite):
         self.start = True
         self.x_offset = 0
         self.jump_strength = 20
-        self.angled_frames = self.scale_frames(self.angled_dice(),2)
-        self.front_frames = self.scale_frames(self.front_dice(), 2)
         self.current_frame_index = 0
         self.frame_counter = 0
         self.ground_level = y
         self.landed_index = None
+        self.result_face = None
+        self.previous_topleft = self.rect.topleft
 
-    @staticmethod
-    def scale_frames(frames, scale_factor):
-        """
-        Scales a list of surfaces by a specified factor.
-
-        Args:
-            frames (list): List of surface objects representing the frames to scale.
-            scale_factor (float): The factor by which the frame dimensions should be scaled.
-
-        :returns list: List of scaled frames.
-        """
-        return [pygame.transform.scale(frame, (frame.get_width() * scale_factor,frame.get_height() * scale_factor))
-                for frame in frames]
-    @staticmethod
-    def angled_dice():
-        """
-        Loads and returns a list of surfaces representing all angled die face images.
-
-        :returns list: A list representing all the die's angled face images.
-        """
-        dice_angled_1_surf = pygame.image.load("../assets/dice_faces/angled-left&right-1.png").convert_alpha()
-        dice_angled_left_2_surf = pygame.image.load("../assets/dice_faces/angled-left-2.png").convert_alpha()
-        dice_angled_right_2_surf = pygame.image.load("../assets/dice_faces/angled-right-2.png").convert_alpha()
-        dice_angled_left_3_surf = pygame.image.load("../assets/dice_faces/angled-left-3.png").convert_alpha()
-        dice_angled_right_3_surf = pygame.image.load("../assets/dice_faces/angled-right-3.png").convert_alpha()
-        dice_angled_left_right_4_surf = pygame.image.load("../assets/dice_faces/angled-left&right-4.png").convert_alpha()
-        dice_angled_left_right_5_surf = pygame.image.load("../assets/dice_faces/angled-left&right-5.png").convert_alpha()
-        dice_angled_left_6_surf = pygame.image.load("../assets/dice_faces/angled-left-6.png").convert_alpha()
-        dice_angled_right_6_surf = pygame.image.load("../assets/dice_faces/angled-right-6.png").convert_alpha()
-
-        return [dice_angled_1_surf, dice_angled_left_2_surf, dice_angled_right_2_surf, dice_angled_left_3_surf,
-                          dice_angled_right_3_surf, dice_angled_left_right_4_surf, dice_angled_left_right_5_surf,
-                          dice_angled_left_6_surf, dice_angled_right_6_surf]
-    @staticmethod
-    def front_dice():
-        """
-        Loads and returns a list of images representing all front faces.
-
-        :returns list: A list representing all the die's front face images.
-        """
-        dice_front_1_surf = pygame.image.load("../assets/dice_faces/front&side-1.png").convert_alpha()
-        dice_front_2_surf = pygame.image.load("../assets/dice_faces/front-2.png").convert_alpha()
-        dice_front_3_surf = pygame.image.load("../assets/dice_faces/front-3.png").convert_alpha()
-        dice_front_4_surf = pygame.image.load("../assets/dice_faces/front&side-4.png").convert_alpha()
-        dice_front_5_surf = pygame.image.load("../assets/dice_faces/front-5.png").convert_alpha()
-        dice_front_6_surf = pygame.image.load("../assets/dice_faces/front-6.png").convert_alpha()
-
-        return [dice_front_1_surf, dice_front_2_surf, dice_front_3_surf, dice_front_4_surf, dice_front_5_surf, dice_front_6_surf]
-
-    def roll_dice_start(self):
+    def roll_dice_start(self, face=None):
         """
         Starts the dice roll animation. Resets the die into it's starting position.
         Initiates the jump motion.
+
+        Args:
+            face (int, optional): The face the die lands on. Rolled when the die lands if it's None.
         """
         if self.start and self.rect.bottom == self.ground_level:
             self.rect.midbottom = (self.starting_x, self.starting_y) # reset to starting position
+            self.previous_topleft = self.rect.topleft
             self.x_offset = 0
             self.gravity = -self.jump_strength #applies gravity for jump
             self.jumped = True
@@ -108,6 +70,7 @@ class Dice(pygame.sprite.Sprite):
             self.start = False
             self.has_landed = False
             self.landed_index = None
+            self.result_face = face
 
     def roll_animation(self):
         """
@@ -124,7 +87,7 @@ class Dice(pygame.sprite.Sprite):
                  self.image = random.choice(self.front_frames)
         elif self.has_landed:
             if self.landed_index is None:
-                self.landed_index = random.randint(1, 6)
+                self.landed_index = self.result_face if self.result_face is not None else roll_face()
             self.image = self.front_frames[self.landed_index - 1]
 
     def apply_gravity(self):
@@ -157,13 +120,27 @@ class Dice(pygame.sprite.Sprite):
         """
         Controls the speed of the die's frame switching.
         Controls the motion of the die and updates the animation to reflect
-        the motion.
+        the motion. Called once per fixed time step, so the roll takes the same time at any frame rate.
         """
+        self.previous_topleft = self.rect.topleft
         self.frame_counter += 1
         self.apply_gravity()
         self.roll_animation()
 
 
+    def interpolated_topleft(self, interpolation):
+        """
+        Computes where to draw the die between its last two positions.
+
+        Args:
+            interpolation (float): How far the drawn frame is between the last and the next update, from 0 to 1.
+
+        :returns tuple[float, float]: The position of the die's top left corner.
+        """
+        previous_x, previous_y = self.previous_topleft
+        return (previous_x + (self.rect.x - previous_x) * interpolation,
+                previous_y + (self.rect.y - previous_y) * interpolation)
+
     def roll_value(self):
         """
         Computes the last frame's value for combat purposes.
@@ -172,7 +149,5 @@ class Dice(pygame.sprite.Sprite):
             object has not landed.
         """
         if self.has_landed and self.landed_index is not None:
-            if self.landed_index == 6:
-                return self.landed_index * 2
-            return self.landed_index
+            return roll_value(self.landed_index)
         return None
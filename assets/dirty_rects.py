@@ -0,0 +1,75 @@
+import pygame
+
+
+class DirtyTracker:
+    """
+    Remembers what was drawn where in the last frame, so a scene only has to redraw and update
+    the parts of the screen where something appeared, disappeared, moved or changed its image.
+
+    Attributes:
+        drawn (dict[Hashable, tuple[pygame.Surface, pygame.Rect]]): The image and screen area of
+            everything drawn in the last frame, keyed by what it belongs to.
+    """
+    def __init__(self):
+        """
+        Initializes a DirtyTracker with nothing drawn yet.
+        """
+        self.drawn = {}
+
+    def changes(self, drawables):
+        """
+        Compares this frame's drawables with the last frame's and remembers this frame's.
+
+        Args:
+            drawables (list[tuple[Hashable, pygame.Surface, pygame.Rect]]): The key, image and screen
+                area of everything drawn on top of the background this frame.
+
+        :returns list[pygame.Rect]: The areas of the screen that have to be redrawn. Overlapping areas are merged.
+        """
+        dirty = []
+        current = {}
+        for key, surface, rect in drawables:
+            current[key] = (surface, rect)
+            previous = self.drawn.get(key)
+            if previous is None:
+                dirty.append(rect)
+            elif previous[0] is not surface or previous[1] != rect:
+                dirty.append(previous[1])
+                dirty.append(rect)
+        for key, (_, rect) in self.drawn.items():
+            if key not in current:
+                dirty.append(rect)
+        self.drawn = current
+        return merge_rects(dirty)
+
+    def reset(self, drawables):
+        """
+        Remembers this frame's drawables after the whole screen was redrawn.
+
+        Args:
+            drawables (list[tuple[Hashable, pygame.Surface, pygame.Rect]]): The key, image and screen
+                area of everything drawn on top of the background this frame.
+        """
+        self.drawn = {key: (surface, rect) for key, surface, rect in drawables}
+
+
+def merge_rects(rects):
+    """
+    Merges overlapping rectangles until none of them overlap.
+
+    Args:
+        rects (list[pygame.Rect]): The rectangles to merge.
+
+    :returns list[pygame.Rect]: The merged rectangles.
+    """
+    merged = []
+    for rect in rects:
+        rect = pygame.Rect(rect)
+        if not rect:
+            continue
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect.union_ip(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
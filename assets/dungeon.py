@@ -0,0 +1,440 @@
+import random
+
+from assets.tilegrid import TileGrid, WALL, FLOOR, CORRIDOR, TRAPDOOR, DOOR
+
+ENEMY_TYPES = ["slime", "skeleton", "zombie"]
+BOSS_FLOOR = 10
+
+
+class Room:
+    """
+    Represents a rectangular room in a dungeon map environment. Positions and sizes are measured in tiles.
+
+    Attributes:
+        x(int): The x-coordinate of the top-left corner of the room in the grid.
+        y(int): The y-coordinate of the top-left corner of the room in the grid.
+        width(int): The width of the room in tiles.
+        height(int): The height of the room in tiles.
+    """
+    def __init__(self, x, y, width, height):
+        """
+        Initializes a Room object with the specified coordinates and dimensions.
+
+        Args:
+            x (int): The x-coordinate of the top-left corner of the room.
+            y (int): The y-coordinate of the top-left corner of the room.
+            width (int): The width of the room.
+            height (int): The height of the room.
+        """
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+    def center(self):
+        """
+        Calculates the center coordinates of the room.
+
+        :returns int: The center coordinates of the room.
+        """
+        center_x = self.x + self.width // 2
+        center_y = self.y + self.height // 2
+        return center_x, center_y
+
+    def check_overlap(self,other_room):
+        """
+        Checks if the room overlaps with another room.
+
+        Args:
+            other_room (Room): The other room to check for overlap.
+
+        :returns bool: True if the rooms overlap, False otherwise.
+        """
+        return (
+            self.x < other_room.x + other_room.width
+            and self.x + self.width > other_room.x
+            and self.y < other_room.y + other_room.height
+            and self.y + self.height > other_room.y
+                    )
+
+
+class RoomIndex:
+    """
+    A uniform grid of buckets for finding the rooms near a position. Every room is stored in each
+    cell it covers, so an overlap test only has to look at the rooms sharing a cell with the new room.
+
+    Attributes:
+        cell_size (int): The width and height of a cell in tiles.
+        cells (dict[tuple[int, int], list[Room]]): The rooms stored in each cell.
+    """
+    def __init__(self, cell_size):
+        """
+        Initializes an empty RoomIndex.
+
+        Args:
+            cell_size (int): The width and height of a cell in tiles.
+        """
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def covered_cells(self, room):
+        """
+        Args:
+            room (Room): The room to look up.
+
+        :returns list[tuple[int, int]]: The cells the room covers.
+        """
+        first_x = room.x // self.cell_size
+        first_y = room.y // self.cell_size
+        last_x = (room.x + room.width - 1) // self.cell_size
+        last_y = (room.y + room.height - 1) // self.cell_size
+        return [(cell_x, cell_y) for cell_y in range(first_y, last_y + 1) for cell_x in range(first_x, last_x + 1)]
+
+    def add(self, room):
+        """
+        Stores a room in every cell it covers.
+
+        Args:
+            room (Room): The room to store.
+        """
+        for cell in self.covered_cells(room):
+            self.cells.setdefault(cell, []).append(room)
+
+    def overlaps(self, room):
+        """
+        Checks if a room overlaps any of the stored rooms.
+
+        Args:
+            room (Room): The room to check.
+
+        :returns bool: True if the room overlaps a stored room, False otherwise.
+        """
+        for cell in self.covered_cells(room):
+            for other_room in self.cells.get(cell, ()):
+                if room.check_overlap(other_room):
+                    return True
+        return False
+
+
+class EnemyRecord:
+    """
+    An enemy placed on a floor. Records are created once when the floor is generated and never
+    changed afterwards, kills are kept in a FloorState instead.
+
+    Attributes:
+        index (int): The position of the record inside the floor's enemies.
+        y (int): The row of the tile the enemy stands on.
+        x (int): The column of the tile the enemy stands on.
+        enemy_type (str): The type of the enemy.
+    """
+    __slots__ = ("index", "y", "x", "enemy_type")
+
+    def __init__(self, index, y, x, enemy_type):
+        """
+        Initializes an EnemyRecord object.
+
+        Args:
+            index (int): The position of the record inside the floor's enemies.
+            y (int): The row of the tile the enemy stands on.
+            x (int): The column of the tile the enemy stands on.
+            enemy_type (str): The type of the enemy.
+        """
+        self.index = index
+        self.y = y
+        self.x = x
+        self.enemy_type = enemy_type
+
+    @property
+    def pos(self):
+        """
+        :returns tuple[int, int]: The (y, x) position of the enemy.
+        """
+        return self.y, self.x
+
+
+class FloorSnapshot:
+    """
+    The layout of a generated floor, without any images or sprites attached. A snapshot is
+    never changed once it's generated: its tile grid is read-only and its enemy records are shared,
+    so it can be handed between threads, scenes and saves without copying.
+
+    Attributes:
+        seed (int): The seed the floor was generated from.
+        floor_number (int): The number of the floor inside the tower.
+        dungeon_map (TileGrid): The read-only grid of tiles representing the dungeon map.
+        rooms (tuple[Room]): The rooms inside the dungeon.
+        player_spawn (tuple[int, int]): The (y, x) position the player starts on.
+        trapdoor (tuple[int, int]): The (y, x) position of the trapdoor.
+        door (tuple[int, int]): The (y, x) position of the door.
+        merchant (tuple[int, int]): The (y, x) position of the merchant.
+        enemies (tuple[EnemyRecord]): The enemies placed on the floor.
+    """
+    def __init__(self, seed, floor_number, dungeon_map, rooms, player_spawn, entity_positions):
+        """
+        Initializes a FloorSnapshot object and makes its tile grid read-only.
+
+        Args:
+            seed (int): The seed the floor was generated from.
+            floor_number (int): The number of the floor inside the tower.
+            dungeon_map (TileGrid): The grid of tiles representing the dungeon map.
+            rooms (list[Room]): The rooms inside the dungeon.
+            player_spawn (tuple[int, int]): The (y, x) position the player starts on.
+            entity_positions (dict[str, Any]): The positions of the dungeon entities:
+                'trapdoor': The position of the trapdoor.
+                'door': The position of the door.
+                'enemies': A list of enemy records.
+                'merchant': The position of the merchant.
+        """
+        dungeon_map.codes.flags.writeable = False
+        self.seed = seed
+        self.floor_number = floor_number
+        self.dungeon_map = dungeon_map
+        self.rooms = tuple(rooms)
+        self.player_spawn = player_spawn
+        self.trapdoor = entity_positions['trapdoor']
+        self.door = entity_positions['door']
+        self.merchant = entity_positions['merchant']
+        self.enemies = tuple(entity_positions['enemies'])
+
+
+class FloorState:
+    """
+    The changes made to a floor while it's played, kept apart from its snapshot. Only the
+    indices of the killed enemies are stored, so keeping or restoring the state of a floor
+    costs next to nothing.
+
+    Attributes:
+        snapshot (FloorSnapshot): The floor the changes are made to.
+        killed (set[int]): The indices of the killed enemies.
+    """
+    def __init__(self, snapshot, killed=None):
+        """
+        Initializes a FloorState object.
+
+        Args:
+            snapshot (FloorSnapshot): The floor the changes are made to.
+            killed (set[int], optional): The indices of the killed enemies. Defaults to none.
+        """
+        self.snapshot = snapshot
+        self.killed = set(killed or ())
+
+    def kill(self, record):
+        """
+        Marks an enemy as killed.
+
+        Args:
+            record (EnemyRecord): The record of the killed enemy.
+        """
+        self.killed.add(record.index)
+
+    def is_killed(self, record):
+        """
+        Args:
+            record (EnemyRecord): The record of the enemy.
+
+        :returns bool: True if the enemy was killed, False otherwise.
+        """
+        return record.index in self.killed
+
+    def alive_enemies(self):
+        """
+        :returns list[EnemyRecord]: The records of the enemies that weren't killed.
+        """
+        killed = self.killed
+        return [record for record in self.snapshot.enemies if record.index not in killed]
+
+
+def sort_tile_types(dungeon_map):
+    """
+    Sorts tile types in a dungeon map into floor tiles, wall tiles, and corner tiles.
+
+    Args:
+        dungeon_map (TileGrid): The grid of tiles representing the dungeon.
+
+    :returns list[tuple[int, int]]: A list of tuples representing positions (y, x) of floor tiles.
+    """
+    return dungeon_map.classify()
+
+def update_wall_boundaries(dungeon_map):
+    """
+    Updates wall boundaries in a dungeon map based on floor tiles. Check floor tiles neighbors for walls.
+    Updates the new map with said floor,corridor, and wall tiles.
+
+    Arg:
+        dungeon_map (TileGrid): The grid of tiles representing the dungeon.
+
+    :returns TileGrid: A new grid representing the updated dungeon map with updated wall boundaries.
+    """
+    return dungeon_map.dilate_walls()
+
+def create_empty_map(map_width, map_height):
+    """
+    Creates a new dungeon map filled with wall tiles.
+
+    Args:
+        map_width (int): The width of the map.
+        map_height (int): The height of the map.
+
+    :returns TileGrid: A grid representing the map with only wall tiles
+    """
+    return TileGrid(map_width, map_height, fill=WALL)
+
+def generate_rooms(floor_width, floor_height,num_rooms,rng=random,max_attempts=None):
+    """
+    Generates a list of non-overlapping rooms given the floor dimensions and number of rooms
+    to create. Applies a buffer to ensure the rooms are inside the floor boundaries.
+    Rejected rooms are retried until the requested number of rooms is placed or the attempts run out.
+
+    Args:
+        floor_width (int): The width of the floor where rooms will be placed, in tiles.
+        floor_height (int): The height of the floor where rooms will be placed, in tiles.
+        num_rooms (int): The number of rooms to generate.
+        rng (random.Random, optional): The random number generator to use. Defaults to the random module.
+        max_attempts (int, optional): The number of rooms that may be tried before giving up.
+            Defaults to 100 attempts per requested room.
+
+    :returns list[Room]: A list of Room objects representing generated non-overlapping rooms
+
+    :raises ValueError: If the floor is too small for a room or the rooms don't fit on the floor within the given attempts.
+    """
+    rooms = []
+    min_room_size = 3
+    max_room_size = 5
+    buffer = 1
+    if min(floor_width, floor_height) < max_room_size + 2 * buffer:
+        raise ValueError(f"A {floor_width}x{floor_height} floor is too small for rooms of up to "
+                         f"{max_room_size}x{max_room_size} tiles with a {buffer} tile border.")
+    room_index = RoomIndex(max_room_size)
+    if max_attempts is None:
+        max_attempts = num_rooms * 100
+
+    attempts = 0
+    while len(rooms) < num_rooms and attempts < max_attempts:
+        attempts += 1
+        room_width = rng.randint(min_room_size, max_room_size)
+        room_height = rng.randint(min_room_size, max_room_size)
+        room_x = rng.randint(buffer, floor_width - room_width - buffer)
+        room_y = rng.randint(buffer, floor_height - room_height - buffer)
+        new_room = Room(room_x, room_y, room_width, room_height)
+
+        if not room_index.overlaps(new_room):
+            rooms.append(new_room)
+            room_index.add(new_room)
+    if len(rooms) < num_rooms:
+        raise ValueError(f"Only {len(rooms)} of {num_rooms} rooms fit on the floor after {attempts} attempts.")
+    return rooms
+
+def fit_rooms(rooms, margin=1):
+    """
+    Moves the rooms so their bounding box starts a margin away from the top-left corner of the map
+    and calculates the map size that holds them with the same margin on every side.
+
+    Args:
+        rooms (list[Room]): A list of Room objects representing non-overlapping rooms.
+        margin (int, optional): The number of tiles kept around the rooms for their walls. Defaults to 1.
+
+    :returns tuple[int, int]: The width and height of the map in tiles.
+    """
+    min_x = min(room.x for room in rooms)
+    min_y = min(room.y for room in rooms)
+    max_x = max(room.x + room.width for room in rooms)
+    max_y = max(room.y + room.height for room in rooms)
+    for room in rooms:
+        room.x += margin - min_x
+        room.y += margin - min_y
+    return max_x - min_x + 2 * margin, max_y - min_y + 2 * margin
+
+def carve_rooms(room_list, dungeon_map):
+    """
+    Iterates over a list of rooms and replaces corresponding wall tiles with floor tiles
+    in the dungeon map.
+
+    Args:
+        room_list (list[Room]): A list of Room objects representing non-overlapping rooms.
+        dungeon_map (TileGrid): The grid of tiles representing the dungeon map.
+    """
+    for room in room_list:
+        dungeon_map.carve_rect(room.x, room.y, room.width, room.height, FLOOR)
+
+def carve_corridors(rooms,dungeon_map):
+    """
+    Checks the centre coordinates of each room in a list and replaces "WALL" tiles with "CORRIDOR" tiles.
+    Iterates over the x,y coordinates between the centers of two adjacent rooms.
+
+    Args:
+        rooms (list[Room]): A list of Room objects representing non-overlapping rooms.
+        dungeon_map (TileGrid): The grid of tiles representing the dungeon map.
+    """
+    for i in range(len(rooms) - 1):
+        center_a = rooms[i].center()
+        center_b = rooms[i + 1].center()
+        dungeon_map.carve_hline(center_a[0], center_b[0], center_a[1], CORRIDOR)
+        dungeon_map.carve_vline(center_b[0], center_a[1], center_b[1], CORRIDOR)
+
+def place_entities(dungeon_map, enemy_types, num_enemies, floor_number, rng=random):
+    """
+    Chooses the positions of the dungeon entities and marks the trapdoor and door on the dungeon map.
+
+    Args:
+        dungeon_map (TileGrid): The grid of tiles representing the dungeon map.
+        enemy_types (list[str]): A list containing different enemy type names.
+        num_enemies (int): The number of enemies to place. Only the boss is placed on the boss floor.
+        floor_number (int): The number of the floor inside the tower.
+        rng (random.Random, optional): The random number generator to use. Defaults to the random module.
+
+    :returns tuple[tuple[int, int], dict[str, list]]:
+        - The coordinates of the player's spawn location.
+        - A dictionary containing positions of the dungeon entities:
+            'trapdoor': The position of the trapdoor.
+            'door': The position of the door.
+            'enemies': A list of enemy records.
+            'merchant': The position of the merchant.
+    """
+    entity_positions = {'trapdoor' : None, 'door' : None, 'enemies': [], 'merchant': None}
+    floor_list, wall_list, _ = sort_tile_types(dungeon_map)
+
+    player_spawn = rng.choice(floor_list)
+    dungeon_map.codes[player_spawn] = TRAPDOOR
+    entity_positions['trapdoor'] = player_spawn
+
+    door_spawn = rng.choice(wall_list)
+    dungeon_map.codes[door_spawn] = DOOR
+    entity_positions['door'] = door_spawn
+
+    floor_list.remove(player_spawn)
+    merchant_spawn = rng.choice(floor_list)
+    entity_positions['merchant'] = merchant_spawn
+    floor_list.remove(merchant_spawn)
+    if floor_number == BOSS_FLOOR:
+        spawns = [("boss", rng.choice(floor_list))]
+    else:
+        spawns = [(rng.choice(enemy_types), spawn) for spawn in rng.sample(floor_list, num_enemies)]
+    for index, (enemy_type, (spawn_y, spawn_x)) in enumerate(spawns):
+        entity_positions['enemies'].append(EnemyRecord(index, spawn_y, spawn_x, enemy_type))
+
+    return player_spawn, entity_positions
+
+def generate_floor(seed, floor_number=1, floor_width=31, floor_height=31, num_rooms=5, enemy_types=None):
+    """
+    Generates a floor from a seed. The same arguments always give the same floor and nothing
+    outside the function is touched, so floors can be built in other threads or processes.
+
+    Args:
+        seed (int): The seed of the floor's random number generator.
+        floor_number (int, optional): The number of the floor inside the tower. Defaults to 1.
+        floor_width (int, optional): The width of the area rooms are placed in, in tiles. Defaults to 31.
+        floor_height (int, optional): The height of the area rooms are placed in, in tiles. Defaults to 31.
+        num_rooms (int, optional): The number of rooms, and enemies, on the floor. Defaults to 5.
+        enemy_types (list[str], optional): The enemy types to choose from. Defaults to ENEMY_TYPES.
+
+    :returns FloorSnapshot: The generated floor.
+    """
+    rng = random.Random(seed)
+    rooms = generate_rooms(floor_width, floor_height, num_rooms, rng)
+    dungeon_map = create_empty_map(*fit_rooms(rooms))
+    carve_rooms(rooms, dungeon_map)
+    carve_corridors(rooms, dungeon_map)
+    dungeon_map = update_wall_boundaries(dungeon_map)
+    player_spawn, entity_positions = place_entities(dungeon_map, enemy_types or ENEMY_TYPES, num_rooms,
+                                                    floor_number, rng)
+    return FloorSnapshot(seed, floor_number, dungeon_map, rooms, player_spawn, entity_positions)
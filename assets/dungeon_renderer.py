@@ -0,0 +1,217 @@
+from collections import OrderedDict
+
+import pygame
+
+from assets.autotile import autotile
+
+CHUNK_SIZE = 16
+MAX_CHUNKS = 64
+
+
+class Camera:
+    """
+    Follows a target across the dungeon and converts dungeon pixel positions into screen positions.
+    Along an axis where the whole dungeon fits on the screen the dungeon is centred instead.
+
+    Attributes:
+        view_width (int): The width of the screen area the dungeon is drawn into, in pixels.
+        view_height (int): The height of the screen area the dungeon is drawn into, in pixels.
+        world_width (int): The width of the dungeon in pixels.
+        world_height (int): The height of the dungeon in pixels.
+        offset_x (int): The screen x-coordinate of the dungeon's left edge.
+        offset_y (int): The screen y-coordinate of the dungeon's top edge.
+    """
+    def __init__(self, view_width, view_height, world_width, world_height):
+        """
+        Initializes a Camera object looking at the centre of the dungeon.
+
+        Args:
+            view_width (int): The width of the screen area the dungeon is drawn into, in pixels.
+            view_height (int): The height of the screen area the dungeon is drawn into, in pixels.
+            world_width (int): The width of the dungeon in pixels.
+            world_height (int): The height of the dungeon in pixels.
+        """
+        self.view_width = view_width
+        self.view_height = view_height
+        self.world_width = world_width
+        self.world_height = world_height
+        self.offset_x = 0
+        self.offset_y = 0
+        self.follow(world_width // 2, world_height // 2)
+
+    @staticmethod
+    def axis_offset(target, view_size, world_size):
+        """
+        Args:
+            target (int): The dungeon pixel coordinate to keep in the middle of the view.
+            view_size (int): The size of the view along the axis.
+            world_size (int): The size of the dungeon along the axis.
+
+        :returns int: The screen coordinate of the dungeon's edge along the axis.
+        """
+        if world_size <= view_size:
+            return (view_size - world_size) // 2
+        return -min(max(target - view_size // 2, 0), world_size - view_size)
+
+    def follow(self, target_x, target_y):
+        """
+        Moves the camera so the target is in the middle of the view, without showing past the dungeon's edges.
+
+        Args:
+            target_x (int): The dungeon pixel x-coordinate of the target.
+            target_y (int): The dungeon pixel y-coordinate of the target.
+        """
+        self.offset_x = self.axis_offset(target_x, self.view_width, self.world_width)
+        self.offset_y = self.axis_offset(target_y, self.view_height, self.world_height)
+
+    def apply(self, x, y):
+        """
+        Args:
+            x (int): The dungeon pixel x-coordinate.
+            y (int): The dungeon pixel y-coordinate.
+
+        :returns tuple[int, int]: The matching screen position.
+        """
+        return x + self.offset_x, y + self.offset_y
+
+    def visible_area(self):
+        """
+        :returns pygame.Rect: The part of the dungeon that is on screen, in dungeon pixel coordinates.
+        """
+        return pygame.Rect(-self.offset_x, -self.offset_y, self.view_width, self.view_height)
+
+
+class ChunkRenderer:
+    """
+    Draws a dungeon map as square chunks of tiles. A chunk is only drawn the first time it
+    comes into view and the least recently seen chunks are dropped once there are too many,
+    so the cost of a frame depends on the size of the screen instead of the size of the map.
+
+    Attributes:
+        dungeon_map (TileGrid): The grid of tiles representing the dungeon map.
+        atlas (dict[tuple, pygame.Surface]): The tile images keyed by the ATLAS_KEYS of the autotiler.
+        transform (PixelTransform): The conversion between tile and dungeon pixel coordinates.
+        chunk_size (int): The width and height of a chunk in tiles.
+        max_chunks (int): The number of drawn chunks kept before the least recently seen one is dropped.
+        chunks (OrderedDict[tuple[int, int], pygame.Surface]): The drawn chunks keyed by their chunk
+            column and row, from least to most recently seen.
+    """
+    def __init__(self, dungeon_map, atlas, transform, chunk_size=CHUNK_SIZE, max_chunks=MAX_CHUNKS):
+        """
+        Initializes a ChunkRenderer object without drawing any chunk.
+
+        Args:
+            dungeon_map (TileGrid): The grid of tiles representing the dungeon map.
+            atlas (dict[tuple, pygame.Surface]): The tile images keyed by the ATLAS_KEYS of the autotiler.
+            transform (PixelTransform): The conversion between tile and dungeon pixel coordinates.
+            chunk_size (int, optional): The width and height of a chunk in tiles. Defaults to CHUNK_SIZE.
+            max_chunks (int, optional): The number of drawn chunks to keep. Defaults to MAX_CHUNKS.
+        """
+        if chunk_size <= 0 or max_chunks <= 0:
+            raise ValueError("chunk_size and max_chunks must be positive.")
+        self.dungeon_map = dungeon_map
+        self.atlas = atlas
+        self.transform = transform
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self.chunks = OrderedDict()
+
+    @property
+    def tile_width(self):
+        return self.transform.tile_width
+
+    @property
+    def tile_height(self):
+        return self.transform.tile_height
+
+    @property
+    def pixel_width(self):
+        return self.transform.surface_size(self.dungeon_map)[0]
+
+    @property
+    def pixel_height(self):
+        return self.transform.surface_size(self.dungeon_map)[1]
+
+    def render_chunk(self, chunk_x, chunk_y):
+        """
+        Draws the tiles of a single chunk onto a new surface.
+
+        Args:
+            chunk_x (int): The column of the chunk.
+            chunk_y (int): The row of the chunk.
+
+        :returns pygame.Surface: The drawn chunk. Chunks on the right and bottom edge of the map can be smaller.
+        """
+        tile_x = chunk_x * self.chunk_size
+        tile_y = chunk_y * self.chunk_size
+        width = min(self.chunk_size, self.dungeon_map.width - tile_x)
+        height = min(self.chunk_size, self.dungeon_map.height - tile_y)
+        chunk_surf = pygame.Surface((width * self.tile_width, height * self.tile_height), pygame.SRCALPHA)
+        chunk_surf.blits([(self.atlas[key], (x * self.tile_width, y * self.tile_height))
+                          for y, x, key in autotile(self.dungeon_map, tile_x, tile_y, width, height)],
+                         doreturn=False)
+        return chunk_surf
+
+    def get_chunk(self, chunk_x, chunk_y):
+        """
+        Returns a drawn chunk, drawing it first if it isn't kept yet, and marks it as the most recently seen one.
+
+        Args:
+            chunk_x (int): The column of the chunk.
+            chunk_y (int): The row of the chunk.
+
+        :returns pygame.Surface: The drawn chunk.
+        """
+        key = (chunk_x, chunk_y)
+        chunk_surf = self.chunks.get(key)
+        if chunk_surf is None:
+            chunk_surf = self.render_chunk(chunk_x, chunk_y)
+            self.chunks[key] = chunk_surf
+            if len(self.chunks) > self.max_chunks:
+                self.chunks.popitem(last=False)
+        else:
+            self.chunks.move_to_end(key)
+        return chunk_surf
+
+    def visible_chunks(self, area):
+        """
+        Lists the chunks that intersect an area of the dungeon.
+
+        Args:
+            area (pygame.Rect): The area in dungeon pixel coordinates.
+
+        :returns list[tuple[int, int]]: The column and row of every chunk inside the area.
+        """
+        chunk_width = self.chunk_size * self.tile_width
+        chunk_height = self.chunk_size * self.tile_height
+        first_x = max(0, area.left // chunk_width)
+        first_y = max(0, area.top // chunk_height)
+        last_x = min((self.pixel_width - 1) // chunk_width, (area.right - 1) // chunk_width)
+        last_y = min((self.pixel_height - 1) // chunk_height, (area.bottom - 1) // chunk_height)
+        return [(chunk_x, chunk_y) for chunk_y in range(first_y, last_y + 1) for chunk_x in range(first_x, last_x + 1)]
+
+    def prerender(self, area):
+        """
+        Draws the chunks inside an area ahead of time, for example around the player's spawn
+        before the floor is shown.
+
+        Args:
+            area (pygame.Rect): The area in dungeon pixel coordinates.
+        """
+        for chunk_x, chunk_y in self.visible_chunks(area):
+            self.get_chunk(chunk_x, chunk_y)
+
+    def draw(self, screen, camera):
+        """
+        Blits the chunks that are on screen.
+
+        Args:
+            screen (pygame.Surface): The surface the dungeon is drawn onto.
+            camera (Camera): The camera looking at the dungeon.
+        """
+        chunk_width = self.chunk_size * self.tile_width
+        chunk_height = self.chunk_size * self.tile_height
+        screen.blits([(self.get_chunk(chunk_x, chunk_y),
+                       camera.apply(chunk_x * chunk_width, chunk_y * chunk_height))
+                      for chunk_x, chunk_y in self.visible_chunks(camera.visible_area())],
+                     doreturn=False)
@@ -0,0 +1,113 @@
+TURBO_SCALE = 4
+
+
+class GameClock:
+    """
+    The time of the game, used instead of pygame.time.get_ticks() for animations and delays.
+    The SceneManager advances it once per update, by the real time that passed multiplied by the speed
+    of the clock, so the game can be paused, slowed down or sped up without touching the scenes.
+
+    Turbo speeds the game up by the turbo scale. With skip_waits set, turbo also drops animation
+    and death delays entirely, so a combat resolves as fast as its updates run.
+
+    Attributes:
+        time (float): The game time in milliseconds.
+        scale (float): The speed of the game time compared to the real time.
+        paused (bool): Whether the game time is stopped.
+        turbo (bool): Whether turbo is on.
+        combat_turbo (bool): Whether combats are run in turbo.
+        turbo_scale (float): The speed up applied on top of the scale while turbo is on.
+        skip_waits (bool): Whether turbo skips waits instead of just shortening them.
+    """
+    def __init__(self, scale=1.0, turbo_scale=TURBO_SCALE, skip_waits=False):
+        """
+        Initializes a GameClock starting at 0.
+
+        Args:
+            scale (float, optional): The speed of the game time compared to the real time. Defaults to 1.
+            turbo_scale (float, optional): The speed up applied while turbo is on. Defaults to 4.
+            skip_waits (bool, optional): Whether turbo skips waits instead of shortening them. Defaults to False.
+        """
+        if scale < 0 or turbo_scale <= 0:
+            raise ValueError("The time scales must be positive.")
+        self.time = 0.0
+        self.scale = scale
+        self.paused = False
+        self.turbo = False
+        self.combat_turbo = False
+        self.turbo_scale = turbo_scale
+        self.skip_waits = skip_waits
+
+    @property
+    def speed(self):
+        """
+        :returns float: How many milliseconds of game time pass in one millisecond of real time.
+        """
+        if self.paused:
+            return 0.0
+        return self.scale * self.turbo_scale if self.turbo else self.scale
+
+    @property
+    def skipping(self):
+        """
+        :returns bool: Whether waits are skipped.
+        """
+        return self.turbo and self.skip_waits
+
+    def scaled(self, elapsed):
+        """
+        Converts real time to game time.
+
+        Args:
+            elapsed (float): The real time in milliseconds.
+
+        :returns float: The game time in milliseconds that passes in it.
+        """
+        return elapsed * self.speed
+
+    def advance(self, elapsed):
+        """
+        Moves the game time forward.
+
+        Args:
+            elapsed (float): The game time in milliseconds to add.
+        """
+        self.time += elapsed
+
+    def get_ticks(self):
+        """
+        :returns int: The game time in milliseconds.
+        """
+        return int(self.time)
+
+    def wait(self, delay):
+        """
+        Gives the length of a wait, such as an animation frame or a death delay, in game time.
+
+        Args:
+            delay (int): The length of the wait in milliseconds.
+
+        :returns int: The delay, or 0 if waits are skipped.
+        """
+        return 0 if self.skipping else delay
+
+    def toggle_pause(self):
+        """
+        Stops the game time, or starts it again if it's stopped.
+        """
+        self.paused = not self.paused
+
+    def toggle_turbo(self):
+        """
+        Turns turbo on or off.
+        """
+        self.turbo = not self.turbo
+
+    def toggle_skip_waits(self):
+        """
+        Switches turbo between skipping waits and just shortening them.
+        """
+        self.skip_waits = not self.skip_waits
+
+
+game_clock = GameClock()
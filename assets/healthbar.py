@@ -1,5 +1,7 @@
 import pygame
 
+from assets.text_cache import text_cache
+
 class HealthBar:
     """
     Represents a graphical health bar for a game entity.
@@ -33,7 +35,7 @@ class HealthBar:
         self.hp = max_hp
         self.rect = pygame.Rect(self.x, self.y, self.w, self.h)
 
-    def draw(self,screen):
+    def draw(self,screen,offset=(0,0)):
         """
         Draws a health bar on the screen indicating the current health status relative
         to the maximum health. The maximum health is displayed as a red bar and the
@@ -41,10 +43,14 @@ class HealthBar:
 
         Args:
             screen (pygame.Surface): The surface on which the health bar is drawn.
+            offset (tuple[int, int], optional): Added to the health bar's position, for surfaces
+                that don't start at the top-left corner of the screen. Defaults to (0, 0).
         """
         ratio = self.hp / self.max_hp
-        pygame.draw.rect(screen,"red",(self.x,self.y,self.w,self.h))
-        pygame.draw.rect(screen,"green",(self.x,self.y,self.w*ratio,self.h))
+        x = self.x + offset[0]
+        y = self.y + offset[1]
+        pygame.draw.rect(screen,"red",(x,y,self.w,self.h))
+        pygame.draw.rect(screen,"green",(x,y,self.w*ratio,self.h))
 
     def health_value_display(self,screen,font):
         """
@@ -55,8 +61,23 @@ class HealthBar:
             screen (pygame.Surface): The surface on which the health ratio is displayed.
             font (pygame.font.Font): The font used for rendering the health ratio.
         """
+        health_value = self.health_value_text(font)
+        if health_value:
+            screen.blit(*health_value)
+
+    def health_value_text(self,font):
+        """
+        Renders the current health to maximum health ratio if the health bar is hovered over.
+
+        Args:
+            font (pygame.font.Font): The font used for rendering the health ratio.
+
+        :returns tuple[pygame.Surface, pygame.Rect] or None: The rendered ratio and the area it's shown in,
+            or None if the health bar isn't hovered over.
+        """
         mouse_pos = pygame.mouse.get_pos()
         if self.rect.collidepoint(mouse_pos):
             health_text = f"{self.hp}/{self.max_hp}"
-            text_surface = font.render(health_text,False,(255,255,255))
-            screen.blit(text_surface,(self.x + self.w // 2 - text_surface.get_width() // 2,self.y - 25))
+            text_surface = text_cache.render(font, health_text)
+            return text_surface, text_surface.get_rect(topleft=(self.x + self.w // 2 - text_surface.get_width() // 2,self.y - 25))
+        return None
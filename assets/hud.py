@@ -0,0 +1,77 @@
+import pygame
+
+from assets.text_cache import text_cache
+
+
+class HudOverlay:
+    """
+    The exploration HUD: the player's health bar, the floor number and the gold, potion and
+    lucky die counters. Everything is drawn onto one run-length encoded image that is only
+    redrawn when the player's state changes, so a frame costs a single blit of the area the HUD covers.
+
+    Attributes:
+        player_state (PlayerState): The player's state shown by the HUD.
+        health_bar (HealthBar): The player's health bar.
+        floor_label (pygame.Surface): The rendered floor number.
+        items (list[Item]): The gold, potion and lucky die icons, each with a counter to its left.
+        screen_size (tuple[int, int]): The size of the screen.
+        image (pygame.Surface): The HUD, as large as the area it covers, or None until it's first drawn.
+        rect (pygame.Rect): The area of the screen the HUD covers.
+        version (int): The version of the player's state the image was drawn for, or None.
+    """
+    def __init__(self, screen_size, player_state, health_bar, floor_number, gold, potion, lucky_die):
+        """
+        Initializes a HudOverlay object. The image is drawn the first time it's needed.
+
+        Args:
+            screen_size (tuple[int, int]): The size of the screen.
+            player_state (PlayerState): The player's state shown by the HUD.
+            health_bar (HealthBar): The player's health bar.
+            floor_number (int): The number of the current floor.
+            gold (Item): The gold icon.
+            potion (Item): The potion icon.
+            lucky_die (Item): The lucky die icon.
+        """
+        self.player_state = player_state
+        self.health_bar = health_bar
+        self.floor_label = text_cache.render(text_cache.font(50), f"Floor: {floor_number}")
+        self.items = [gold, potion, lucky_die]
+        self.screen_size = screen_size
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.version = None
+
+    def counters(self):
+        """
+        :returns list[int]: The amounts shown next to the gold, potion and lucky die icons.
+        """
+        player_state = self.player_state
+        return [player_state.gold, player_state.potion_amount, player_state.lucky_die_amount]
+
+    def rebuild(self):
+        """
+        Redraws the image from the player's current state.
+        """
+        self.health_bar.hp = self.player_state.current_health
+        width, height = self.screen_size
+        blits = [(self.floor_label, (width / 2 - self.floor_label.get_width() / 2, height / 2 - 300))]
+        font = text_cache.font(50)
+        for item, amount in zip(self.items, self.counters()):
+            blits.append((item.image, item.rect.topleft))
+            blits.append((text_cache.render(font, f"{amount}"), (item.rect.left - 50, item.rect.centery - 10)))
+        areas = [pygame.Rect(position, image.get_size()) for image, position in blits]
+        self.rect = self.health_bar.rect.unionall(areas)
+        left, top = self.rect.topleft
+        self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+        self.health_bar.draw(self.image, (-left, -top))
+        self.image.blits([(image, (x - left, y - top)) for image, (x, y) in blits])
+        # Run-length encoding lets the blit skip the transparent runs between the HUD elements.
+        self.image.set_alpha(255, pygame.RLEACCEL)
+        self.version = self.player_state.version
+
+    def refresh(self):
+        """
+        Redraws the image if the player's state changed since it was last drawn.
+        """
+        if self.version != self.player_state.version:
+            self.rebuild()
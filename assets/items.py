@@ -1,6 +1,7 @@
 import pygame
 
 import assets.spritesheet as spritesheet
+from assets.asset_cache import asset_cache
 pygame.init()
 
 class Item(pygame.sprite.Sprite):
@@ -17,7 +18,10 @@ class Item(pygame.sprite.Sprite):
         image (pygame.Surface): The image representing the item.
         scale (int): The scale factor for the item's image.
         rect (pygame.Rect): The rectangle representing the item's position and size.
+        SPRITE_SHEET (str): The path of the item sprite sheet.
     """
+    SPRITE_SHEET = "../assets/map_entities/roguelikeitems.png"
+
     def __init__(self,x,y,name, cost = 0):
         """
         Initializes an Item object.
@@ -44,13 +48,13 @@ class Item(pygame.sprite.Sprite):
         """
         Loads the sprite sheet for the item.
         """
-        self.sprite_sheet = pygame.image.load("../assets/map_entities/roguelikeitems.png").convert_alpha()
+        self.sprite_sheet = asset_cache.load(self.SPRITE_SHEET)
 
     def load_items(self):
         """
         Loads the item's image and set it's cost.
         """
-        sprite_loader = spritesheet.HandleSpriteSheet(self.sprite_sheet)
+        sprite_loader = spritesheet.HandleSpriteSheet(self.sprite_sheet, self.SPRITE_SHEET)
         if self.name == "Lucky_die":
             self.image = sprite_loader.get_image(12, 11, 16, 16,scale=self.scale)
             self.rect = self.image.get_rect(topleft=(self.x*self.scale,self.y*self.scale))
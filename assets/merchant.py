@@ -1,72 +1,94 @@
 import pygame
 import assets.spritesheet as spritesheet
+from assets.asset_cache import asset_cache
 from assets.items import Item
+from assets.scene_manager import Scene
+from assets.text_cache import text_cache
 
 pygame.init()
-class BuyMenu:
+class BuyMenu(Scene):
     """
-    Manages the buy menu for the merchant.
+    The merchant's buy menu. It's a modal overlay pushed on top of the exploration scene, so it runs
+    inside the game's frame loop. The scene below keeps being updated and drawn under the menu,
+    and the menu only redraws itself when the selection changes or the scene below drew over it.
 
     Attributes:
         items (list): A list of items available for purchase.
         font (pygame.font.Font): The font used for rendering text.
-        screen (pygame.Surface): The surface on which the menu is rendered.
         x (int): The x-coordinate of the top-left corner of the menu.
         y (int): The y-coordinate of the top-left corner of the menu.
         width (int): The width of the menu.
         height (int): The height of the menu.
+        rect (pygame.Rect): The area of the screen the menu covers.
         selected_index (int): The index of the currently selected item.
-        is_open (bool): Whether the menu is open.
         player_state (PlayerState): The player's current state.
+        changed (bool): Whether the menu has to be redrawn in the next frame.
+        below (Scene): The scene the menu is drawn over, or None until the menu is pushed.
     """
-    def __init__(self,items,font,screen,x,y,width,height,player_state):
+    def __init__(self,manager,items,font,x,y,width,height,player_state):
         """
         Initializes the BuyMenu object.
 
         Args:
+            manager (SceneManager): The manager running the menu.
             items (list): A list of items available for purchase.
             font (pygame.font.Font): The font used for rendering text.
-            screen (pygame.Surface): The surface on which the menu is rendered.
             x (int): The x-coordinate of the top-left corner of the menu.
             y (int): The y-coordinate of the top-left corner of the menu.
             width (int): The width of the menu.
             height (int): The height of the menu.
             player_state (PlayerState): The player's current state.
         """
+        super().__init__(manager)
         self.items = items
         self.font = font
-        self.screen = screen
         self.x = x
         self.y = y
         self.width = width
         self.height = height
+        self.rect = pygame.Rect(x, y, width, height)
         self.selected_index = 0
-        self.is_open = True
         self.player_state = player_state
+        self.changed = True
+        self.below = None
+
+    def enter(self):
+        """
+        Remembers the scene the menu is drawn over.
+        """
+        self.below = self.manager.stack[-2] if len(self.manager.stack) > 1 else None
 
-    def render(self):
+    def exit(self):
+        """
+        Lets go of the scene below.
+        """
+        self.below = None
+
+    def render(self,screen):
         """
         Renders the BuyMenu,text and images for the menu and handles their positioning.
+
+        Args:
+            screen (pygame.Surface): The surface on which the menu is rendered.
         """
         menu_background_color = (50,50,50)
-        pygame.draw.rect(self.screen,menu_background_color,(self.x,self.y,self.width,self.height))
+        pygame.draw.rect(screen,menu_background_color,(self.x,self.y,self.width,self.height))
         for i, item in enumerate(self.items):
             border_color = (255, 255, 0) if i == self.selected_index else (255, 255, 255)
             image_x = self.x + 40 + i * 100
             image_y = self.y + 30
             text_y = image_y + 60
-            pygame.draw.rect(self.screen, border_color, (image_x-5, image_y-5, 60, 60), 2)
+            pygame.draw.rect(screen, border_color, (image_x-5, image_y-5, 60, 60), 2)
             if item.image:
-                self.screen.blit(item.image,(image_x,image_y))
-            name_text = self.font.render(item.name, False, border_color)
-            cost_text = self.font.render(f"{item.cost} Gold", False, border_color)
-            self.screen.blit(name_text, (image_x, text_y))
-            self.screen.blit(cost_text, (image_x, text_y + 20))
+                screen.blit(item.image,(image_x,image_y))
+            name_text = text_cache.render(self.font, item.name, border_color)
+            cost_text = text_cache.render(self.font, f"{item.cost} Gold", border_color)
+            screen.blit(name_text, (image_x, text_y))
+            screen.blit(cost_text, (image_x, text_y + 20))
 
-
-    def handle_input(self,event):
+    def handle_event(self,event):
         """
-        Handles user input and updates the player's state accordingly.
+        Handles user input and updates the player's state accordingly. Escape closes the menu.
 
         Args:
             event (pygame.event.Event): The event object representing the user input.
@@ -74,8 +96,10 @@ class BuyMenu:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_a:
                 self.selected_index = (self.selected_index - 1) % len(self.items)
+                self.changed = True
             elif event.key == pygame.K_d:
                 self.selected_index = (self.selected_index + 1) % len(self.items)
+                self.changed = True
             elif event.key == pygame.K_RETURN:
                 selected_item = self.items[self.selected_index]
                 if self.player_state.gold >= selected_item.cost:
@@ -88,7 +112,41 @@ class BuyMenu:
                 else:
                     print("Not enough gold")
             elif event.key == pygame.K_ESCAPE:
-                self.is_open = False
+                self.manager.pop()
+
+    def update(self,current_time):
+        """
+        Keeps the scene below running, so its animations and HUD go on under the menu.
+
+        Args:
+            current_time (int): The game time in milliseconds.
+        """
+        if self.below is not None:
+            self.below.update(current_time)
+
+    def draw(self,screen):
+        """
+        Draws the scene below and the menu over it. The menu is only redrawn if it changed
+        or the scene below drew over it.
+
+        Args:
+            screen (pygame.Surface): The surface on which the menu is rendered.
+
+        :returns list[pygame.Rect] or None: The areas of the screen that changed, or None if the whole screen changed.
+        """
+        dirty = []
+        if self.below is not None:
+            self.below.redraw = self.below.redraw or self.redraw
+            dirty = self.below.draw(screen)
+        if dirty is None:
+            self.render(screen)
+            self.redraw = self.changed = False
+            return None
+        if self.redraw or self.changed or self.rect.collidelist(dirty) != -1:
+            self.render(screen)
+            dirty.append(self.rect)
+        self.redraw = self.changed = False
+        return dirty
 
 class Merchant(pygame.sprite.Sprite):
     """
@@ -100,7 +158,11 @@ class Merchant(pygame.sprite.Sprite):
         sprite_sheet (pygame.Surface): The sprite sheet containing the merchant's image.
         image (pygame.Surface): The image representing the merchant.
         rect (pygame.Rect): The rectangle representing the merchant's position and size.
+        items (list[Item]): The items sold by the merchant.
+        SPRITE_SHEET (str): The path of the merchant's sprite sheet.
     """
+    SPRITE_SHEET = "../assets/map_entities/NPCS.png"
+
     def __init__(self,x,y):
         """
         Initializes a Merchant object.
@@ -117,63 +179,37 @@ class Merchant(pygame.sprite.Sprite):
         self.rect = pygame.Rect(self.x * 16, self.y * 16, 16, 16)
         self.load_sprite_sheet()
         self.load_img()
+        self.items = [Item(0,0,"Potion"),Item(0,0,"Lucky_die")]
 
     def load_sprite_sheet(self):
         """
         Loads the sprite sheet for the merchant.
         """
-        self.sprite_sheet = pygame.image.load("../assets/map_entities/NPCS.png").convert_alpha()
+        self.sprite_sheet = asset_cache.load(self.SPRITE_SHEET)
 
     def load_img(self):
         """
         Loads the image for the merchant.
         """
-        sprite_loader = spritesheet.HandleSpriteSheet(self.sprite_sheet)
+        sprite_loader = spritesheet.HandleSpriteSheet(self.sprite_sheet, self.SPRITE_SHEET)
         self.image = sprite_loader.get_image(1, 0, 16, 16)
 
-    def check_interact(self, player):
+    def interact(self,event,player_state,manager):
         """
-        Checks player interactions with the merchant based on their position.
-
-        Args:
-            player (Player): The player object interacting with the merchant.
-
-        :returns bool: True if player interacts with the merchant, False otherwise.
-        """
-        merchant_x, merchant_y = self.x, self.y
-        player_x, player_y = player.x // 16, player.y // 16
-        if merchant_x == player_x and merchant_y == player_y - 1:  # Above
-            return True
-        if merchant_x == player_x and merchant_y == player_y + 1:  # Below
-            return True
-        if merchant_x == player_x - 1 and merchant_y == player_y:  # Left
-            return True
-        if merchant_x == player_x + 1 and merchant_y == player_y:  # Right
-            return True
-        return False
-
-    def interact(self,event,player,player_state):
-        """
-        Handles player interactions with the merchant and shop.
-        Updates player's state accordingly.
+        Handles player interactions with the merchant and opens the shop. Only called while the player
+        stands next to the merchant, which the caller finds through the floor's OccupancyGrid.
 
         Args:
             event (pygame.event.Event): The event object representing the user input.
-            player (Player): The player object interacting with the merchant.
             player_state (PlayerState): The player's current state.
+            manager (SceneManager): The manager the buy menu is pushed onto.
+
+        :returns BuyMenu or None: The buy menu to push on top of the current scene, or None if the shop wasn't opened.
         """
         if event.type == pygame.KEYDOWN and event.key == pygame.K_e:
-            if self.check_interact(player):
-                potion = Item(0,0,"Potion")
-                lucky_die = Item(0,0,"Lucky_die")
-                items = [potion,lucky_die]
-                font = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 32)
-                screen = pygame.display.get_surface()
-                screen_height = pygame.display.get_surface().get_height()
-                screen_width = pygame.display.get_surface().get_width()
-                buy_menu = BuyMenu(items,font,screen,((screen_width-250) // 2),((screen_height-250) // 2),250,150,player_state)
-                while buy_menu.is_open:
-                    for event in pygame.event.get():
-                        buy_menu.handle_input(event)
-                    buy_menu.render()
-                    pygame.display.update()
\ No newline at end of file
+            font = text_cache.font(32)
+            screen = pygame.display.get_surface()
+            screen_height = screen.get_height()
+            screen_width = screen.get_width()
+            return BuyMenu(manager,self.items,font,((screen_width-250) // 2),((screen_height-250) // 2),250,150,player_state)
+        return None
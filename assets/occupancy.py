@@ -0,0 +1,96 @@
+NEIGHBOUR_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class OccupancyGrid:
+    """
+    Maps the tile positions of a floor to the entities standing on them, so finding what is
+    on or next to a tile doesn't have to go through every entity of the floor.
+
+    Attributes:
+        entities (dict[tuple[int, int], Any]): The entity on each occupied (y, x) tile position.
+        blocking (set[tuple[int, int]]): The positions of the entities that can't be walked through.
+    """
+    def __init__(self):
+        """
+        Initializes an empty OccupancyGrid.
+        """
+        self.entities = {}
+        self.blocking = set()
+
+    def __len__(self):
+        return len(self.entities)
+
+    def __contains__(self, pos):
+        return pos in self.entities
+
+    def add(self, pos, entity, blocking=False):
+        """
+        Puts an entity on a tile.
+
+        Args:
+            pos (tuple[int, int]): The (y, x) position of the tile.
+            entity (Any): The entity standing on the tile.
+            blocking (bool, optional): Whether the entity can't be walked through. Defaults to False.
+        """
+        if pos in self.entities:
+            raise ValueError(f"Tile {pos} is already occupied.")
+        self.entities[pos] = entity
+        if blocking:
+            self.blocking.add(pos)
+
+    def remove(self, pos):
+        """
+        Takes the entity off a tile, for example when it's killed.
+
+        Args:
+            pos (tuple[int, int]): The (y, x) position of the tile.
+
+        :returns Any: The removed entity, or None if the tile was empty.
+        """
+        self.blocking.discard(pos)
+        return self.entities.pop(pos, None)
+
+    def move(self, old_pos, new_pos):
+        """
+        Moves the entity of a tile onto another tile.
+
+        Args:
+            old_pos (tuple[int, int]): The (y, x) position the entity stands on.
+            new_pos (tuple[int, int]): The (y, x) position the entity moves to.
+        """
+        if new_pos in self.entities:
+            raise ValueError(f"Tile {new_pos} is already occupied.")
+        blocking = old_pos in self.blocking
+        self.add(new_pos, self.remove(old_pos), blocking)
+
+    def get(self, pos):
+        """
+        Args:
+            pos (tuple[int, int]): The (y, x) position of the tile.
+
+        :returns Any: The entity standing on the tile, or None if the tile is empty.
+        """
+        return self.entities.get(pos)
+
+    def is_blocked(self, pos):
+        """
+        Args:
+            pos (tuple[int, int]): The (y, x) position of the tile.
+
+        :returns bool: True if an entity that can't be walked through stands on the tile.
+        """
+        return pos in self.blocking
+
+    def neighbours(self, pos):
+        """
+        Lists the entities on the tiles above, below, left and right of a tile.
+
+        Args:
+            pos (tuple[int, int]): The (y, x) position of the tile.
+
+        :returns list[Any]: The neighbouring entities in that order.
+        """
+        y, x = pos
+        entities = self.entities
+        return [entities[neighbour] for neighbour in ((y + dy, x + dx) for dy, dx in NEIGHBOUR_OFFSETS)
+                if neighbour in entities]
@@ -1,6 +1,6 @@
 import pygame
 
-import assets.spritesheet as spritesheet
+from assets.animation_bank import get_animation_bank
 
 class Player(pygame.sprite.Sprite):
     """
@@ -18,7 +18,7 @@ class Player(pygame.sprite.Sprite):
         running (bool): Whether the player is currently moving.
         pre_x (int): The previous x-coordinate of the player.
         pre_y (int): The previous y-coordinate of the player.
-        frames (dict): A dictionary containing the player's animation frames.
+        frames (dict): The player's shared animation frames for each direction and movement.
     """
     def __init__(self, x, y, width, height):
         """
@@ -35,45 +35,15 @@ class Player(pygame.sprite.Sprite):
         self.y = y
         self.width = width
         self.height = height
-        self.image = pygame.image.load("../assets/map_entities/player_sheet.png")
-        self.current_frame = None
+        self.frames = get_animation_bank("player").frames()
+        self.current_frame = self.frames["front_idle"][0]
+        self.image = self.current_frame
         self.frame_index = 0
         self.facing = "front"
         self.running = False
         self.pre_x = self.x
         self.pre_y = self.y
 
-        self.frames = {
-            "right_idle": [],
-            "left_idle": [],
-            "back_idle": [],
-            "front_idle": [],
-            "right_run": [],
-            "left_run": [],
-            "back_run": [],
-            "front_run": []
-        }
-        self.load_frames()
-
-    def load_frames(self):
-        """
-        Loads the player's animation frames from the sprite sheet and associates them with their respective dictionary keys.
-        """
-        sprite_sheet = spritesheet.HandleSpriteSheet(self.image)
-        self.frames["right_idle"] = [sprite_sheet.get_image(0, 0, 16, 16, offset_v=8)]
-        self.frames["left_idle"] = [sprite_sheet.get_image(1, 0, 16, 16, offset_v=8)]
-        self.frames["back_idle"] = [sprite_sheet.get_image(2, 0, 16, 16, offset_v=8)]
-        self.frames["front_idle"] = [sprite_sheet.get_image(3, 0, 16, 16, offset_v=8)]
-        self.frames["right_run"] = [sprite_sheet.get_image(0, 1, 16, 16, offset_v=8),
-                                    sprite_sheet.get_image(0, 2, 16, 16, offset_v=8)]
-        self.frames["left_run"] = [sprite_sheet.get_image(1, 1, 16, 16, offset_v=8),
-                                   sprite_sheet.get_image(1, 2, 16, 16, offset_v=8)]
-        self.frames["back_run"] = [sprite_sheet.get_image(2, 1, 16, 16, offset_v=8),
-                                   sprite_sheet.get_image(2, 2, 16, 16, offset_v=8)]
-        self.frames["front_run"] = [sprite_sheet.get_image(3, 1, 16, 16, offset_v=8),
-                                    sprite_sheet.get_image(3, 2, 16, 16, offset_v=8)]
-        self.current_frame = self.frames["front_idle"][0]
-
     def animation_loop(self):
         """
         Handles the player's frames when the player isn't moving.
@@ -81,17 +51,19 @@ class Player(pygame.sprite.Sprite):
         if not self.running:
             self.current_frame = self.frames[self.facing + "_idle"][0]
 
-    def move(self, dx, dy,dungeon_map, event):
+    def move(self, transform, dungeon_map, event, occupancy=None):
         """
         Moves the player based on the provided input. Validates the move and updates the player's position if it's valid.
         Checks if the player has moved.
 
         Args:
-            dx (int): The x-coordinate change.
-            dy (int): The y-coordinate change.
-            dungeon_map (list): The list representing the dungeon.
+            transform (PixelTransform): The conversion between tile and pixel coordinates. The player moves a tile at a time.
+            dungeon_map (TileGrid): The grid of tiles representing the dungeon.
             event (pygame.event): The event object representing the user input.
+            occupancy (OccupancyGrid, optional): The entities of the floor. Tiles of blocking entities can't be entered.
         """
+        dx = transform.tile_width
+        dy = transform.tile_height
         new_x = self.x
         new_y = self.y
         self.running = False
@@ -118,7 +90,9 @@ class Player(pygame.sprite.Sprite):
             self.frame_index = (self.frame_index + 1) % len(animation_frames)
             self.current_frame = animation_frames[self.frame_index]
 
-        if dungeon_map[new_y // 16][new_x // 16] in ["FLOOR","TRAPDOOR","CORRIDOR"]:
+        tile_x, tile_y = transform.to_tile(new_x, new_y)
+        blocked = occupancy is not None and occupancy.is_blocked((tile_y, tile_x))
+        if dungeon_map.is_walkable(tile_x, tile_y) and not blocked:
             self.x = new_x
             self.y = new_y
         else:
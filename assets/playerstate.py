@@ -1,8 +1,12 @@
+WATCHED_ATTRIBUTES = frozenset(("max_health", "current_health", "gold", "potion_amount", "lucky_die_amount"))
+
+
 class PlayerState:
     """
     Player State class
 
-    Represents a player's current state.
+    Represents a player's current state. Every change of a value raises the version, so whatever
+    shows the state only has to redraw when the version differs from the one it last drew.
 
     Attributes:
         max_health (int): Maximum health of the player.
@@ -10,6 +14,7 @@ class PlayerState:
         gold (int): Amount of gold the player has.
         potion_amount (int): Amount of potions the player has.
         lucky_die_amount (int): Amount of lucky dice the player has.
+        version (int): The number of changes made to the values above.
     """
     def __init__(self,current_health,gold,max_health=150, potion_amount = 0, lucky_die_amount = 1):
         """
@@ -22,8 +27,14 @@ class PlayerState:
             potion_amount (int): Amount of potions the player has.
             lucky_die_amount (int): Amount of lucky dice the player has.
         """
+        self.version = 0
         self.max_health = max_health
         self.current_health = current_health
         self.gold = gold
         self.potion_amount = potion_amount
-        self.lucky_die_amount = lucky_die_amount
\ No newline at end of file
+        self.lucky_die_amount = lucky_die_amount
+
+    def __setattr__(self, name, value):
+        if name in WATCHED_ATTRIBUTES and getattr(self, name, None) != value:
+            object.__setattr__(self, "version", self.version + 1)
+        object.__setattr__(self, name, value)
@@ -0,0 +1,184 @@
+import os
+import struct
+
+import numpy as np
+
+from assets.dungeon import EnemyRecord, FloorSnapshot, FloorState
+from assets.playerstate import PlayerState
+from assets.tilegrid import TileGrid
+
+MAGIC = b"TTSV"
+VERSION = 1
+SAVE_ENEMY_TYPES = ("slime", "skeleton", "zombie", "boss")
+KILLED = 1
+
+HEADER = struct.Struct("<4sHH")
+RUN = struct.Struct("<IQ")
+PLAYER = struct.Struct("<iiiiiII")
+RNG = struct.Struct("<B625I?d")
+FLOOR = struct.Struct("<10II")
+ENEMY = struct.Struct("<IIBB")
+
+
+class RunSave:
+    """
+    Everything needed to continue a run: the current floor with its changes, the player and the
+    state of the random number generator the next floors are seeded from.
+
+    Attributes:
+        floor_number (int): The number of the current floor inside the tower.
+        floor_state (FloorState): The current floor and the changes made to it.
+        player_pos (tuple[int, int]): The (y, x) tile position of the player.
+        player_state (PlayerState): The player's health and inventory.
+        rng_state (tuple): The state of the random module, as returned by random.getstate().
+    """
+    def __init__(self, floor_number, floor_state, player_pos, player_state, rng_state):
+        """
+        Initializes a RunSave object.
+
+        Args:
+            floor_number (int): The number of the current floor inside the tower.
+            floor_state (FloorState): The current floor and the changes made to it.
+            player_pos (tuple[int, int]): The (y, x) tile position of the player.
+            player_state (PlayerState): The player's health and inventory.
+            rng_state (tuple): The state of the random module, as returned by random.getstate().
+        """
+        self.floor_number = floor_number
+        self.floor_state = floor_state
+        self.player_pos = player_pos
+        self.player_state = player_state
+        self.rng_state = rng_state
+
+
+def encode_run(run_save):
+    """
+    Packs a run into the binary save format. All numbers are little-endian and the sections
+    follow each other without padding:
+        - header: magic, format version, reserved flags
+        - run: floor number, floor seed
+        - player: health, max health, gold, potions, lucky dice, tile position
+        - rng: the Mersenne Twister state of the random module
+        - floor: width, height, player spawn, trapdoor, door, merchant and the number of enemy records
+        - one fixed size record per enemy: position, type and killed flag
+        - the tile codes of the floor, one byte per tile in row-major order
+
+    Args:
+        run_save (RunSave): The run to pack.
+
+    :returns bytes: The packed save.
+    """
+    floor_state = run_save.floor_state
+    snapshot = floor_state.snapshot
+    dungeon_map = snapshot.dungeon_map
+    player_state = run_save.player_state
+    rng_version, mt_state, gauss_next = run_save.rng_state
+
+    parts = [
+        HEADER.pack(MAGIC, VERSION, 0),
+        RUN.pack(run_save.floor_number, snapshot.seed),
+        PLAYER.pack(player_state.current_health, player_state.max_health, player_state.gold,
+                    player_state.potion_amount, player_state.lucky_die_amount, *run_save.player_pos),
+        RNG.pack(rng_version, *mt_state, gauss_next is not None, gauss_next or 0.0),
+        FLOOR.pack(dungeon_map.width, dungeon_map.height, *snapshot.player_spawn, *snapshot.trapdoor,
+                   *snapshot.door, *snapshot.merchant, len(snapshot.enemies)),
+    ]
+    for record in snapshot.enemies:
+        killed = KILLED if floor_state.is_killed(record) else 0
+        parts.append(ENEMY.pack(record.y, record.x, SAVE_ENEMY_TYPES.index(record.enemy_type), killed))
+    parts.append(np.ascontiguousarray(dungeon_map.codes).tobytes())
+    return b"".join(parts)
+
+def decode_run(data):
+    """
+    Unpacks a run from the binary save format. The tile grid is a read-only view into the data.
+
+    Args:
+        data (bytes): The packed save.
+
+    :returns RunSave: The unpacked run.
+    """
+    try:
+        return unpack_run(data)
+    except (struct.error, IndexError) as error:
+        raise ValueError(f"Save file is truncated or corrupt: {error}") from error
+
+def unpack_run(data):
+    """
+    Unpacks a run from the binary save format, without turning unpacking errors into ValueErrors.
+
+    Args:
+        data (bytes): The packed save.
+
+    :returns RunSave: The unpacked run.
+    """
+    if len(data) < HEADER.size:
+        raise ValueError("Save file is truncated.")
+    magic, version, _ = HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Not a Treasure Tower save file.")
+    if version != VERSION:
+        raise ValueError(f"Unsupported save file version {version}.")
+    offset = HEADER.size
+
+    floor_number, seed = RUN.unpack_from(data, offset)
+    offset += RUN.size
+    current_health, max_health, gold, potion_amount, lucky_die_amount, player_y, player_x = PLAYER.unpack_from(data, offset)
+    offset += PLAYER.size
+    rng_values = RNG.unpack_from(data, offset)
+    offset += RNG.size
+    rng_state = (rng_values[0], rng_values[1:626], rng_values[627] if rng_values[626] else None)
+    (width, height, spawn_y, spawn_x, trapdoor_y, trapdoor_x, door_y, door_x,
+     merchant_y, merchant_x, enemy_count) = FLOOR.unpack_from(data, offset)
+    offset += FLOOR.size
+
+    enemies = []
+    killed = set()
+    for index in range(enemy_count):
+        y, x, type_id, flags = ENEMY.unpack_from(data, offset)
+        offset += ENEMY.size
+        enemies.append(EnemyRecord(index, y, x, SAVE_ENEMY_TYPES[type_id]))
+        if flags & KILLED:
+            killed.add(index)
+
+    if len(data) < offset + width * height:
+        raise ValueError("Save file is truncated.")
+    codes = np.frombuffer(data, dtype=np.uint8, count=width * height, offset=offset).reshape(height, width)
+    entity_positions = {'trapdoor': (trapdoor_y, trapdoor_x), 'door': (door_y, door_x),
+                        'merchant': (merchant_y, merchant_x), 'enemies': enemies}
+    snapshot = FloorSnapshot(seed, floor_number, TileGrid.from_codes(codes), (), (spawn_y, spawn_x), entity_positions)
+    player_state = PlayerState(current_health, gold, max_health=max_health, potion_amount=potion_amount,
+                               lucky_die_amount=lucky_die_amount)
+    return RunSave(floor_number, FloorState(snapshot, killed), (player_y, player_x), player_state, rng_state)
+
+def save_run(path, run_save):
+    """
+    Writes a run to a save file. The file is written next to the old one first and then
+    swapped in, so a crash while saving never leaves a broken save behind.
+
+    Args:
+        path (str): The path of the save file.
+        run_save (RunSave): The run to save.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as save_file:
+        save_file.write(encode_run(run_save))
+    os.replace(temp_path, path)
+
+def load_run(path):
+    """
+    Loads a run from a save file. The file is read whole and closed right away, so it can be
+    replaced by the next save while the run is played.
+
+    Args:
+        path (str): The path of the save file.
+
+    :returns RunSave: The loaded run.
+    """
+    with open(path, "rb") as save_file:
+        data = save_file.read()
+    if not data:
+        raise ValueError("Save file is empty.")
+    return decode_run(data)
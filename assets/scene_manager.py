@@ -0,0 +1,234 @@
+import pygame
+
+from assets.game_clock import game_clock as default_game_clock
+
+
+class Scene:
+    """
+    Base class of a screen of the game, such as the main menu, exploration or combat.
+    Scenes don't run loops of their own, the SceneManager updates them in fixed time steps
+    and draws them once per frame.
+
+    Attributes:
+        manager (SceneManager): The manager running the scene.
+        redraw (bool): Whether the next frame has to draw the whole screen, for example because
+            another scene was drawn over it.
+    """
+    def __init__(self, manager):
+        """
+        Initializes a Scene object.
+
+        Args:
+            manager (SceneManager): The manager running the scene.
+        """
+        self.manager = manager
+        self.redraw = True
+
+    def enter(self):
+        """
+        Called when the scene is put on top of the stack.
+        """
+
+    def exit(self):
+        """
+        Called when the scene is taken off the stack. Scenes drop their surfaces, maps and sprites here.
+        """
+
+    def resume(self, result=None):
+        """
+        Called when the scene above this one is popped and this scene is on top again.
+
+        Args:
+            result (Any, optional): The result the popped scene was closed with.
+        """
+
+    def handle_event(self, event):
+        """
+        Handles a single event. QUIT events are handled by the manager.
+
+        Args:
+            event (pygame.event.Event): The event object representing the user input.
+        """
+
+    def update(self, current_time):
+        """
+        Advances the scene by one fixed time step of the manager.
+
+        Args:
+            current_time (int): The game time in milliseconds.
+        """
+
+    def draw(self, screen):
+        """
+        Draws the scene. Moving objects may be drawn between their last two positions using the
+        manager's interpolation.
+
+        Args:
+            screen (pygame.Surface): The display surface the scene is drawn onto.
+
+        :returns list[pygame.Rect] or None: The areas of the screen that changed, or None if the whole
+            screen has to be updated.
+        """
+
+
+class SceneManager:
+    """
+    Keeps the scenes of the game on a stack and runs the single frame loop of the game.
+    Only the scene on top of the stack receives events and is updated and drawn. Only the areas
+    of the screen the scene reports as changed are updated, or the whole screen if it reports None.
+
+    The scenes are updated in fixed time steps, independently of the frame rate. Each frame adds the
+    real time since the last frame, scaled by the game clock, to an accumulator and runs as many updates
+    as fit in it, so the game runs at the same speed when frames are dropped or the frame rate is
+    lowered or uncapped. Pausing the game clock stops the updates, turbo runs more of them per frame.
+
+    Attributes:
+        screen (pygame.Surface): The display surface the scenes are drawn onto.
+        fps (int): The maximum number of frames per second, 0 for no limit.
+        step (float): The length of a time step in milliseconds.
+        max_frame_time (int): The longest time in milliseconds simulated in one frame. Time beyond it
+            is dropped, so a stall doesn't have to be caught up with hundreds of updates.
+        clock (pygame.time.Clock): The clock limiting the frame rate.
+        game_clock (GameClock): The time of the game, advanced by one step per update.
+        accumulator (float): The game time in milliseconds that hasn't been simulated yet.
+        interpolation (float): How far the real time is between the last and the next update,
+            from 0 to 1. Scenes use it to draw moving objects between their last two positions.
+        stack (list[Scene]): The scenes, from the bottom to the top of the stack.
+        running (bool): Whether the frame loop keeps running.
+    """
+    def __init__(self, screen, fps=60, tick_rate=60, max_frame_time=250, game_clock=None):
+        """
+        Initializes a SceneManager with an empty stack.
+
+        Args:
+            screen (pygame.Surface): The display surface the scenes are drawn onto.
+            fps (int, optional): The maximum number of frames per second, 0 for no limit. Defaults to 60.
+            tick_rate (int, optional): The number of updates per second. Defaults to 60.
+            max_frame_time (int, optional): The longest time in milliseconds simulated in one frame. Defaults to 250.
+            game_clock (GameClock, optional): The time of the game. Defaults to the shared game clock.
+        """
+        if tick_rate <= 0:
+            raise ValueError("The tick rate must be positive.")
+        self.screen = screen
+        self.fps = fps
+        self.step = 1000 / tick_rate
+        self.max_frame_time = max_frame_time
+        self.clock = pygame.time.Clock()
+        self.game_clock = game_clock if game_clock is not None else default_game_clock
+        self.accumulator = 0.0
+        self.interpolation = 0.0
+        self.stack = []
+        self.running = False
+
+    @property
+    def top(self):
+        """
+        :returns Scene or None: The scene on top of the stack, or None if the stack is empty.
+        """
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        """
+        Puts a scene on top of the stack. The scene below is kept as it is until the new scene is popped.
+
+        Args:
+            scene (Scene): The scene to show.
+        """
+        self.stack.append(scene)
+        scene.redraw = True
+        scene.enter()
+
+    def pop(self, result=None):
+        """
+        Takes the scene on top of the stack off and resumes the scene below it.
+
+        Args:
+            result (Any, optional): The result handed to the resumed scene.
+
+        :returns Scene: The popped scene.
+        """
+        if not self.stack:
+            raise ValueError("Cannot pop a scene from an empty stack.")
+        scene = self.stack.pop()
+        scene.exit()
+        if self.stack:
+            self.stack[-1].redraw = True
+            self.stack[-1].resume(result)
+        return scene
+
+    def replace(self, scene):
+        """
+        Swaps the scene on top of the stack for a new one, without resuming the scene below.
+
+        Args:
+            scene (Scene): The scene to show instead.
+        """
+        if self.stack:
+            self.stack.pop().exit()
+        self.push(scene)
+
+    def pop_to_root(self, result=None):
+        """
+        Pops every scene above the bottom one, for example to go back to the main menu.
+
+        Args:
+            result (Any, optional): The result handed to the bottom scene.
+        """
+        while len(self.stack) > 1:
+            self.stack.pop().exit()
+        if self.stack:
+            self.stack[-1].redraw = True
+            self.stack[-1].resume(result)
+
+    def quit(self):
+        """
+        Stops the frame loop and exits every scene on the stack.
+        """
+        self.running = False
+        while self.stack:
+            self.stack.pop().exit()
+
+    def advance(self, elapsed):
+        """
+        Runs the updates of the scene on top for the real time that passed since the last frame.
+
+        Args:
+            elapsed (float): The real time in milliseconds since the last frame.
+        """
+        game_clock = self.game_clock
+        self.accumulator += game_clock.scaled(min(elapsed, self.max_frame_time))
+        while self.accumulator >= self.step and self.stack:
+            game_clock.advance(self.step)
+            self.accumulator -= self.step
+            self.top.update(game_clock.get_ticks())
+        self.interpolation = self.accumulator / self.step
+
+    def run(self):
+        """
+        Runs the frame loop until the manager is quit or the stack is empty.
+        """
+        self.running = True
+        previous_time = pygame.time.get_ticks()
+        self.accumulator = 0.0
+        while self.running and self.stack:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.quit()
+                    break
+                self.top.handle_event(event)
+                if not self.stack:
+                    break
+            if not self.stack:
+                break
+            current_time = pygame.time.get_ticks()
+            self.advance(current_time - previous_time)
+            previous_time = current_time
+            if not self.stack:
+                break
+            dirty = self.top.draw(self.screen)
+            if dirty is None:
+                pygame.display.flip()
+            elif dirty:
+                pygame.display.update(dirty)
+            self.clock.tick(self.fps)
+        self.running = False
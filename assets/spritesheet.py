@@ -1,5 +1,7 @@
 import pygame
 
+from assets.asset_cache import asset_cache, crop
+
 
 class HandleSpriteSheet:
     """
@@ -9,19 +11,41 @@ class HandleSpriteSheet:
 
     Attributes:
         sheet (pygame.Surface): The sprite sheet containing the sprites.
+        path (str): The path the sprite sheet was loaded from, or None.
     """
-    def __init__(self, image):
+    def __init__(self, image, path=None):
         """
-        Initializes the sprite sheet.
+        Initializes the sprite sheet. Frames of a sheet with a path are taken from the
+        asset cache, so every sprite cut from the same sheet shares them.
 
         Args:
             image: The sprite sheet containing the sprites.
+            path (str, optional): The path the sprite sheet was loaded from.
         """
         self.sheet = image
+        self.path = path
+
+    def get_view(self, frame_h, frame_v, width, height, offset_v=0, offset_h=0):
+        """
+        Returns a frame of the sprite sheet as a view, without copying its pixels.
+        The view shares the sheet's pixels, so it must never be drawn on.
+
+        Args:
+            frame_h (int): The horizontal index of the frame.
+            frame_v (int): The vertical index of the frame.
+            width (int): The width of the frame.
+            height (int): The height of the frame.
+            offset_v (int, optional): The vertical offset of the frame. Defaults to 0.
+            offset_h (int, optional): The horizontal offset of the frame. Defaults to 0.
+
+        :return: The frame.
+        """
+        return crop(self.sheet, ((frame_h * width) + offset_h, (frame_v * height) + offset_v, width, height))
 
     def get_image(self, frame_h, frame_v, width, height,offset_v=0,offset_h=0,scale = 1):
         """
         Extracts an image from the sprite sheet and scales it according to the provided parameters.
+        Unscaled images are views into the sheet, so they must never be drawn on.
 
         Args:
             frame_h (int): The horizontal index of the frame to extract.
@@ -34,7 +58,74 @@ class HandleSpriteSheet:
 
         :return: The extracted image.
         """
-        image = pygame.Surface((width, height),pygame.SRCALPHA).convert_alpha()
-        image.blit(self.sheet, (0, 0), ((frame_h * width)+offset_h, (frame_v * height)+offset_v, width, height))
-        image = pygame.transform.scale(image,(width*scale,height*scale))
-        return image
\ No newline at end of file
+        if self.path is not None:
+            return asset_cache.get(self.path, ((frame_h * width) + offset_h, (frame_v * height) + offset_v, width, height),
+                                   scale)
+        image = self.get_view(frame_h, frame_v, width, height, offset_v, offset_h)
+        if scale != 1:
+            image = pygame.transform.scale(image,(width*scale,height*scale))
+        return image
+
+    def get_frames(self, rects, scale=1):
+        """
+        Extracts several frames with a single scale. The area covering all the frames is scaled once
+        and every frame is a view into it, so a strip of N frames costs one scaled surface instead of N.
+        The frames share the scaled area's pixels, so they must never be drawn on.
+
+        Args:
+            rects (list[tuple[int, int, int, int]]): The x, y, width and height of every frame on the sheet.
+            scale (int, optional): The scale factor for the frames. Defaults to 1.
+
+        :returns list[pygame.Surface]: The frames in the order of rects.
+        """
+        if not isinstance(scale, int):
+            raise ValueError("Frames can only be extracted together with a whole number scale factor.")
+        left = min(x for x, _, _, _ in rects)
+        top = min(y for _, y, _, _ in rects)
+        right = max(x + width for x, _, width, _ in rects)
+        bottom = max(y + height for _, y, _, height in rects)
+        area = (left, top, right - left, bottom - top)
+        if self.path is not None:
+            image = asset_cache.get(self.path, area, scale)
+        else:
+            image = crop(self.sheet, area)
+            if scale != 1:
+                image = pygame.transform.scale(image, (area[2] * scale, area[3] * scale))
+        return [image.subsurface(((x - left) * scale, (y - top) * scale, width * scale, height * scale))
+                for x, y, width, height in rects]
+
+    def get_grid(self, frames, width, height, offset_v=0, offset_h=0, scale=1):
+        """
+        Extracts the frames at the given grid positions with a single scale.
+
+        Args:
+            frames (list[tuple[int, int]]): The horizontal and vertical index of every frame.
+            width (int): The width of a frame.
+            height (int): The height of a frame.
+            offset_v (int, optional): The vertical offset of the grid. Defaults to 0.
+            offset_h (int, optional): The horizontal offset of the grid. Defaults to 0.
+            scale (int, optional): The scale factor for the frames. Defaults to 1.
+
+        :returns list[pygame.Surface]: The frames in the order of frames.
+        """
+        return self.get_frames([((frame_h * width) + offset_h, (frame_v * height) + offset_v, width, height)
+                                for frame_h, frame_v in frames], scale)
+
+    def get_strip(self, frame_v, count, width, height, offset_v=0, offset_h=0, scale=1, start=0):
+        """
+        Extracts a row of frames with a single scale.
+
+        Args:
+            frame_v (int): The vertical index of the row.
+            count (int): The number of frames in the row.
+            width (int): The width of a frame.
+            height (int): The height of a frame.
+            offset_v (int, optional): The vertical offset of the grid. Defaults to 0.
+            offset_h (int, optional): The horizontal offset of the grid. Defaults to 0.
+            scale (int, optional): The scale factor for the frames. Defaults to 1.
+            start (int, optional): The horizontal index of the first frame. Defaults to 0.
+
+        :returns list[pygame.Surface]: The frames from left to right.
+        """
+        return self.get_grid([(frame_h, frame_v) for frame_h in range(start, start + count)],
+                             width, height, offset_v, offset_h, scale)
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+
+import pygame
+
+FONT_PATH = "../assets/map_entities/Pixeltype.ttf"
+DEFAULT_MAX_TEXTS = 256
+
+
+class TextCache:
+    """
+    Opens every font file once per size and keeps the text rendered with them, so text that
+    doesn't change between frames is only rendered once. Rendered surfaces are shared between
+    everything that asks for the same text, so they must never be drawn on. When more than
+    max_texts texts are cached, the least recently used ones are dropped.
+
+    Attributes:
+        max_texts (int): The number of rendered texts that are kept.
+        fonts (dict[tuple[str, int], pygame.font.Font]): The opened fonts keyed by (path, size).
+        texts (OrderedDict[tuple, pygame.Surface]): The rendered texts keyed by
+            (font, text, color, antialias), from least to most recently used.
+    """
+    def __init__(self, max_texts=DEFAULT_MAX_TEXTS):
+        """
+        Initializes an empty TextCache.
+
+        Args:
+            max_texts (int, optional): The number of rendered texts that are kept. Defaults to DEFAULT_MAX_TEXTS.
+        """
+        self.max_texts = max_texts
+        self.fonts = {}
+        self.texts = OrderedDict()
+
+    def font(self, size, path=FONT_PATH):
+        """
+        Returns a shared font, opening the font file only the first time it's asked for in that size.
+
+        Args:
+            size (int): The size of the font.
+            path (str, optional): The path of the font file. Defaults to FONT_PATH.
+
+        :returns pygame.font.Font: The shared font.
+        """
+        key = (path, size)
+        font = self.fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = self.fonts[key] = pygame.font.Font(path, size)
+        return font
+
+    def render(self, font, text, color=(255, 255, 255), antialias=False):
+        """
+        Returns a shared surface with the text rendered, rendering it only if it isn't cached yet.
+
+        Args:
+            font (pygame.font.Font): The font to render the text with, preferably one from font().
+            text (str): The text to render.
+            color (tuple or str, optional): The color of the text. Defaults to white.
+            antialias (bool, optional): Whether the text is antialiased. Defaults to False.
+
+        :returns pygame.Surface: The shared rendered text.
+        """
+        key = (font, text, color, antialias)
+        surface = self.texts.get(key)
+        if surface is not None:
+            self.texts.move_to_end(key)
+            return surface
+        surface = self.texts[key] = font.render(text, antialias, color)
+        if len(self.texts) > self.max_texts:
+            self.texts.popitem(last=False)
+        return surface
+
+    def clear(self):
+        """
+        Drops every rendered text. The fonts stay open.
+        """
+        self.texts.clear()
+
+text_cache = TextCache()
@@ -0,0 +1,285 @@
+import numpy as np
+
+EMPTY = 0
+WALL = 1
+FLOOR = 2
+CORRIDOR = 3
+TRAPDOOR = 4
+DOOR = 5
+MERCHANT = 6
+
+TILE_NAMES = ("EMPTY", "WALL", "FLOOR", "CORRIDOR", "TRAPDOOR", "DOOR", "MERCHANT")
+TILE_CODES = {name: code for code, name in enumerate(TILE_NAMES)}
+WALKABLE_TILES = (FLOOR, CORRIDOR, TRAPDOOR)
+
+
+def tile_code(tile):
+    """
+    Converts a tile name into its tile code. Tile codes are passed through unchanged.
+
+    Args:
+        tile (str or int): The tile name, for example "WALL", or an already converted tile code.
+
+    :returns int: The tile code.
+    """
+    if isinstance(tile, str):
+        return TILE_CODES[tile]
+    return int(tile)
+
+
+class TileRow:
+    """
+    A string keyed view of a single row of a TileGrid. Lets code written for
+    the list of lists dungeon map read and write tiles by name.
+
+    Attributes:
+        codes (numpy.ndarray): A view of the row's tile codes inside the grid.
+    """
+    def __init__(self, codes):
+        """
+        Initializes a TileRow object.
+
+        Args:
+            codes (numpy.ndarray): A view of the row's tile codes inside the grid.
+        """
+        self.codes = codes
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __getitem__(self, x):
+        return TILE_NAMES[self.codes[x]]
+
+    def __setitem__(self, x, tile):
+        self.codes[x] = tile_code(tile)
+
+    def __iter__(self):
+        return (TILE_NAMES[code] for code in self.codes.tolist())
+
+
+class TileGrid:
+    """
+    A dungeon map stored as a 2D array of uint8 tile codes. Carving, wall dilation and
+    tile classification work on the whole array at once instead of cell by cell.
+    Indexing as grid[y][x] reads and writes tile names, so it can stand in for the
+    old list of lists of strings.
+
+    Attributes:
+        codes (numpy.ndarray): The (height, width) array of tile codes.
+    """
+    def __init__(self, width, height, fill=WALL):
+        """
+        Initializes a TileGrid filled with a single tile type.
+
+        Args:
+            width (int): The width of the grid in tiles.
+            height (int): The height of the grid in tiles.
+            fill (str or int, optional): The tile every cell starts as. Defaults to WALL.
+        """
+        self.codes = np.full((height, width), tile_code(fill), dtype=np.uint8)
+
+    @classmethod
+    def from_codes(cls, codes):
+        """
+        Creates a TileGrid around an existing array of tile codes without copying it.
+
+        Args:
+            codes (numpy.ndarray): A 2D array of tile codes.
+
+        :returns TileGrid: The grid wrapping the array.
+        """
+        grid = cls.__new__(cls)
+        grid.codes = np.asarray(codes, dtype=np.uint8)
+        return grid
+
+    @property
+    def width(self):
+        return self.codes.shape[1]
+
+    @property
+    def height(self):
+        return self.codes.shape[0]
+
+    def __len__(self):
+        return self.height
+
+    def __getitem__(self, y):
+        return TileRow(self.codes[y])
+
+    def __iter__(self):
+        return (TileRow(row) for row in self.codes)
+
+    def copy(self):
+        """
+        :returns TileGrid: An independent copy of the grid.
+        """
+        return TileGrid.from_codes(self.codes.copy())
+
+    def is_walkable(self, x, y):
+        """
+        Checks if the tile at the given position can be walked on.
+
+        Args:
+            x (int): The x-coordinate of the tile.
+            y (int): The y-coordinate of the tile.
+
+        :returns bool: True if the tile is inside the grid and walkable, False otherwise.
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.codes[y, x] in WALKABLE_TILES
+        return False
+
+    def carve_rect(self, x, y, width, height, tile=FLOOR):
+        """
+        Sets every tile inside a rectangle to the given tile type.
+
+        Args:
+            x (int): The x-coordinate of the rectangle's top-left corner.
+            y (int): The y-coordinate of the rectangle's top-left corner.
+            width (int): The width of the rectangle in tiles.
+            height (int): The height of the rectangle in tiles.
+            tile (str or int, optional): The tile type to carve. Defaults to FLOOR.
+        """
+        self.codes[y:y + height, x:x + width] = tile_code(tile)
+
+    def carve_hline(self, x1, x2, y, tile=CORRIDOR):
+        """
+        Replaces the wall tiles of a horizontal line, both ends included.
+
+        Args:
+            x1 (int): The x-coordinate of one end of the line.
+            x2 (int): The x-coordinate of the other end of the line.
+            y (int): The y-coordinate of the line.
+            tile (str or int, optional): The tile type to carve. Defaults to CORRIDOR.
+        """
+        segment = self.codes[y, min(x1, x2):max(x1, x2) + 1]
+        segment[segment == WALL] = tile_code(tile)
+
+    def carve_vline(self, x, y1, y2, tile=CORRIDOR):
+        """
+        Replaces the wall tiles of a vertical line, both ends included.
+
+        Args:
+            x (int): The x-coordinate of the line.
+            y1 (int): The y-coordinate of one end of the line.
+            y2 (int): The y-coordinate of the other end of the line.
+            tile (str or int, optional): The tile type to carve. Defaults to CORRIDOR.
+        """
+        segment = self.codes[min(y1, y2):max(y1, y2) + 1, x]
+        segment[segment == WALL] = tile_code(tile)
+
+    def neighbour_count(self, mask):
+        """
+        Counts for every cell how many of its 8 neighbours are set in a boolean mask.
+        Cells outside the grid count as not set.
+
+        Args:
+            mask (numpy.ndarray): A boolean array with the same shape as the grid.
+
+        :returns numpy.ndarray: A uint8 array holding the neighbour count of each cell.
+        """
+        padded = np.pad(mask, 1).astype(np.uint8)
+        counts = np.zeros(self.codes.shape, dtype=np.uint8)
+        for dy in (0, 1, 2):
+            for dx in (0, 1, 2):
+                if dy == 1 and dx == 1:
+                    continue
+                counts += padded[dy:dy + self.height, dx:dx + self.width]
+        return counts
+
+    def dilate_walls(self):
+        """
+        Keeps only the wall tiles that touch a floor or corridor tile, including diagonally.
+        Floor and corridor tiles are kept, everything else becomes EMPTY.
+
+        :returns TileGrid: A new grid with the updated wall boundaries.
+        """
+        open_mask = (self.codes == FLOOR) | (self.codes == CORRIDOR)
+        boundary = (self.codes == WALL) & (self.neighbour_count(open_mask) > 0)
+        codes = np.where(open_mask, self.codes, EMPTY).astype(np.uint8)
+        codes[boundary] = WALL
+        return TileGrid.from_codes(codes)
+
+    def positions(self, mask):
+        """
+        Lists the positions of the cells set in a boolean mask in row-major order.
+
+        Args:
+            mask (numpy.ndarray): A boolean array with the same shape as the grid.
+
+        :returns list[tuple[int, int]]: The (y, x) positions of the set cells.
+        """
+        ys, xs = np.nonzero(mask)
+        return list(zip(ys.tolist(), xs.tolist()))
+
+    def classify(self):
+        """
+        Sorts the tiles into floor tiles, straight wall tiles and corner wall tiles. A wall
+        is a corner if it has a wall neighbour both horizontally and vertically.
+
+        :returns tuple[list[tuple[int, int]], list[tuple[int, int]], list[tuple[int, int]]]:
+            The (y, x) positions of the floor, wall and corner tiles.
+        """
+        walls = np.pad(self.codes == WALL, 1)
+        is_wall = walls[1:-1, 1:-1]
+        horizontal = walls[1:-1, :-2] | walls[1:-1, 2:]
+        vertical = walls[:-2, 1:-1] | walls[2:, 1:-1]
+        corners = is_wall & horizontal & vertical
+        return (self.positions(self.codes == FLOOR),
+                self.positions(is_wall & ~corners),
+                self.positions(corners))
+
+
+class PixelTransform:
+    """
+    Converts between tile coordinates of a TileGrid and pixel coordinates on a surface.
+
+    Attributes:
+        tile_width (int): The width of a tile in pixels.
+        tile_height (int): The height of a tile in pixels.
+        origin_x (int): The pixel x-coordinate of the grid's top-left corner.
+        origin_y (int): The pixel y-coordinate of the grid's top-left corner.
+    """
+    def __init__(self, tile_width, tile_height, origin_x=0, origin_y=0):
+        """
+        Initializes a PixelTransform object.
+
+        Args:
+            tile_width (int): The width of a tile in pixels.
+            tile_height (int): The height of a tile in pixels.
+            origin_x (int, optional): The pixel x-coordinate of the grid's top-left corner. Defaults to 0.
+            origin_y (int, optional): The pixel y-coordinate of the grid's top-left corner. Defaults to 0.
+        """
+        self.tile_width = tile_width
+        self.tile_height = tile_height
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+
+    def to_pixel(self, x, y):
+        """
+        Args:
+            x (int): The x-coordinate of the tile.
+            y (int): The y-coordinate of the tile.
+
+        :returns tuple[int, int]: The pixel position of the tile's top-left corner.
+        """
+        return self.origin_x + x * self.tile_width, self.origin_y + y * self.tile_height
+
+    def to_tile(self, pixel_x, pixel_y):
+        """
+        Args:
+            pixel_x (int): The pixel x-coordinate.
+            pixel_y (int): The pixel y-coordinate.
+
+        :returns tuple[int, int]: The position of the tile containing the pixel.
+        """
+        return (pixel_x - self.origin_x) // self.tile_width, (pixel_y - self.origin_y) // self.tile_height
+
+    def surface_size(self, grid):
+        """
+        Args:
+            grid (TileGrid): The grid to be drawn.
+
+        :returns tuple[int, int]: The pixel size of a surface holding the whole grid.
+        """
+        return grid.width * self.tile_width, grid.height * self.tile_height
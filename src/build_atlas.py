@@ -0,0 +1,101 @@
+"""
+Builds the sprite atlas from the animation manifest, so the game can load the frames
+from a few pages in the cache directory at startup instead of cutting them out of the sprite sheets.
+The atlas is only rebuilt when the manifest or one of the sprite sheets changed.
+
+Run from the project root, for example:
+    python -m src.build_atlas --force
+
+--bench times a cold start of the animations in fresh processes, once from the atlas and once cut
+out of the sprite sheets, to check the atlas still pays for itself.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+from assets.animation_bank import animation_banks, cut_animations
+from assets.animation_manifest import ANIMATIONS
+from assets.atlas import ATLAS_DIR, build_atlas, load_animations, read_index
+
+SOURCES = ("atlas", "sheets")
+
+
+def cold_start(source, atlas_dir):
+    """
+    Readies every frame of the manifest in this process and prints how long it took in milliseconds.
+
+    Args:
+        source (str): "atlas" to load the frames from the atlas, "sheets" to cut them out of the sprite sheets.
+        atlas_dir (str): The directory of the atlas.
+    """
+    start = time.perf_counter()
+    if source == "atlas":
+        load_animations(atlas_dir)
+        if len(animation_banks) != len(ANIMATIONS):
+            raise RuntimeError("The atlas couldn't be loaded.")
+    else:
+        for name in ANIMATIONS:
+            cut_animations(name)
+    print((time.perf_counter() - start) * 1000)
+
+def bench(runs, atlas_dir):
+    """
+    Times cold starts of the animations in fresh processes, alternating between the atlas and the sprite sheets.
+
+    Args:
+        runs (int): The number of processes started for each source.
+        atlas_dir (str): The directory of the atlas.
+    """
+    build_atlas(atlas_dir)
+    times = {source: [] for source in SOURCES}
+    for _ in range(runs):
+        for source in SOURCES:
+            output = subprocess.run([sys.executable, "-m", "src.build_atlas", "--cold-start", source,
+                                     "--out", atlas_dir], cwd="..", capture_output=True, text=True, check=True)
+            times[source].append(float(output.stdout.split()[-1]))
+    for source in SOURCES:
+        print(f"{source:>6}: median {statistics.median(times[source]):6.1f} ms, "
+              f"min {min(times[source]):6.1f} ms over {runs} processes")
+
+def main():
+    """
+    Parses the command line arguments and builds the atlas.
+    """
+    parser = argparse.ArgumentParser(description="Build the Treasure Tower sprite atlas.")
+    parser.add_argument("--force", action="store_true", help="rebuild the atlas even if it's up to date")
+    parser.add_argument("--out", default=ATLAS_DIR, help="directory to write the atlas to, relative to src")
+    parser.add_argument("--bench", type=int, metavar="RUNS",
+                        help="time cold starts from the atlas and from the sprite sheets in RUNS fresh processes each")
+    parser.add_argument("--cold-start", choices=SOURCES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.bench is not None and args.bench < 1:
+        parser.error("--bench must be at least 1")
+
+    # The manifest's paths are relative to src, like when the game is running.
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    if args.cold_start:
+        cold_start(args.cold_start, args.out)
+        return
+    if args.bench:
+        bench(args.bench, args.out)
+        return
+    start = time.perf_counter()
+    built = build_atlas(args.out, force=args.force)
+    elapsed = time.perf_counter() - start
+    if not built:
+        print(f"Atlas in {args.out} is up to date")
+        return
+    index = read_index(args.out)
+    frame_count = sum(len(frames) for states in index["animations"].values() for frames in states.values())
+    print(f"Packed {frame_count} frames onto {len(index['pages'])} pages in {args.out} in {elapsed:.3f} s")
+
+if __name__ == "__main__":
+    main()
@@ -1,129 +1,203 @@
 import math
+import random
 
 import pygame
 from assets.button import Button
 from assets.dice import Dice
 from assets.combat_enemy import CombatEnemy
 from assets.combat_player import CombatPlayer
+from assets.combat_rules import PLAYER_DAMAGE, Fight
 from assets.healthbar import HealthBar
 from assets.playerstate import PlayerState
+from assets.scene_manager import Scene
+from assets.asset_cache import asset_cache
+from assets.text_cache import text_cache
 
 pygame.init()
-clock = pygame.time.Clock()
 
-def combat(screen, main_menu,enemy_type,player_state):
+class CombatScene(Scene):
     """
     Handles the combat sequence between the player and an enemy. Manages all aspects of the combat, including
-    dice rolling, turn-based combat, player's states and endgame states.
+    dice rolling, turn-based combat, player's states and endgame states. When the enemy is defeated the scene
+    is popped with "ENEMY_DEFEATED", on death with "PLAYER_DIED" and after beating the boss with "BOSS_DEFEATED".
+    The T key turns turbo on or off for every combat, the S key makes turbo skip the waits between
+    animations instead of shortening them and the P key pauses the combat.
 
-    Args:
-        screen(pygame.Surface): The Pygame screen surface where the combat will be rendered.
-        main_menu(Callable): A callable function that, when invoked, transitions the user back to the main menu when
-        endgame states are achieved.
+    Attributes:
         enemy_type(str): The type of the enemy encountered during exploration state.
         player_state(PlayerState): The player's current state.
-
-    :returns str: A string indicating the outcome of the fight when the enemy is defeated, "ENEMY_DEFEATED".
+        enemy(CombatEnemy): The enemy fought.
+        player(CombatPlayer): The player's combat sprite.
+        dice(Dice): The dice rolled for attacks.
+        endgame_state(bool): Whether the player died.
+        victory(bool): Whether the boss was defeated.
+        rolling(bool): Whether the dice is being rolled.
+        player_attacked(bool): Whether the player attacked and waits for the enemy's attack.
+        fight(Fight): The rules of the combat. Each roll plays a turn of it, the scene only shows the turn.
+        turn(Turn): The turn being shown, or None if the player can roll.
+        clock(GameClock): The game clock timing the animations and delays of the combat.
     """
-    endgame_text = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 100).render("GAME OVER!", False, (255, 255, 255))
-    victory_text = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 100).render("YOU WIN!", False, (255, 255, 255))
-
-    endgame_state = False
-    victory = False
-    rolling = False
-    running = True
-
-    enemy_placements = {
-        "skeleton" : [620,370],
-        "zombie" : [640,410],
-        "slime" : [700,500],
-        "boss": [620,370]
-    }
-    placement_x,placement_y = enemy_placements.get(enemy_type)
-    enemy = CombatEnemy(placement_x,placement_y,enemy_type)
-    player = CombatPlayer(screen.get_width() / 2 - 250,150,player_state.current_health,10)
-
-    health_bar_player = HealthBar(screen.get_width() / 2 - 250, 690, 150, 10,150,player.current_health)
-    health_bar_enemy = HealthBar(screen.get_width()/2 + 100,690,150,10,enemy.max_health,enemy.current_health)
-    font = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 20)
-
-    bg = pygame.image.load("../assets/combat_elements/Old_dungeon/OldDungeon320X180.png").convert()
-    bg = pygame.transform.scale(bg, (screen.get_width(), screen.get_height()))
-    dice = Dice(200, 670)
-    dice_sprites = pygame.sprite.Group(dice)
-    player_attacked = False
-    roll_button = Button((200, 690),"Roll")
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if roll_button.rect.collidepoint(event.pos):
-                    dice.roll_dice_start()
-                    rolling = True
-
+    def __init__(self, manager, enemy_type, player_state):
+        """
+        Initializes a CombatScene object.
+
+        Args:
+            manager(SceneManager): The manager running the scene.
+            enemy_type(str): The type of the enemy encountered during exploration state.
+            player_state(PlayerState): The player's current state.
+        """
+        super().__init__(manager)
+        screen = manager.screen
+        self.enemy_type = enemy_type
+        self.player_state = player_state
+        self.endgame_text = text_cache.render(text_cache.font(100), "GAME OVER!")
+        self.victory_text = text_cache.render(text_cache.font(100), "YOU WIN!")
+        self.turbo_text = text_cache.render(text_cache.font(50), f"Turbo x{manager.game_clock.turbo_scale:g}")
+        self.skip_text = text_cache.render(text_cache.font(50), "Turbo, no waits")
+        self.paused_text = text_cache.render(text_cache.font(50), "Paused")
+
+        self.endgame_state = False
+        self.victory = False
+        self.rolling = False
+
+        enemy_placements = {
+            "skeleton" : [620,370],
+            "zombie" : [640,410],
+            "slime" : [700,500],
+            "boss": [620,370]
+        }
+        placement_x,placement_y = enemy_placements.get(enemy_type)
+        self.clock = manager.game_clock
+        self.fight = Fight(enemy_type, player_state.current_health, player_state.lucky_die_amount, random)
+        self.turn = None
+        self.enemy = CombatEnemy(placement_x,placement_y,enemy_type,flip=True,clock=self.clock,
+                                 damage=self.fight.enemy_damage,reward=self.fight.reward)
+        self.player = CombatPlayer(screen.get_width() / 2 - 250,150,player_state.current_health,PLAYER_DAMAGE,clock=self.clock)
+
+        self.health_bar_player = HealthBar(screen.get_width() / 2 - 250, 690, 150, 10,150,self.player.current_health)
+        self.health_bar_enemy = HealthBar(screen.get_width()/2 + 100,690,150,10,self.enemy.max_health,self.enemy.current_health)
+        self.font = text_cache.font(20)
+
+        self.bg = asset_cache.get("../assets/combat_elements/Old_dungeon/OldDungeon320X180.png",
+                                  scale=(screen.get_width(), screen.get_height()), alpha=False)
+        self.dice = Dice(200, 670)
+        self.dice_sprites = pygame.sprite.Group(self.dice)
+        self.player_attacked = False
+        self.roll_button = Button((200, 690),"Roll")
+
+    def enter(self):
+        """
+        Runs the combat in turbo if turbo was turned on in an earlier combat.
+        """
+        self.clock.turbo = self.clock.combat_turbo
+
+    def exit(self):
+        """
+        Goes back to the normal speed for exploring.
+        """
+        self.clock.turbo = False
+        self.clock.paused = False
+
+    def handle_event(self, event):
+        """
+        Starts a dice roll when the roll button is clicked, toggles turbo with T, skipping waits with S
+        and pauses with P.
+
+        Args:
+            event(pygame.event.Event): The event object representing the user input.
+        """
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_t:
+                self.clock.toggle_turbo()
+                self.clock.combat_turbo = self.clock.turbo
+            elif event.key == pygame.K_s:
+                self.clock.toggle_skip_waits()
+            elif event.key == pygame.K_p:
+                self.clock.toggle_pause()
+
+        if event.type == pygame.MOUSEBUTTONDOWN and not self.clock.paused:
+            if self.roll_button.rect.collidepoint(event.pos) and self.turn is None and not self.fight.over:
+                self.turn = self.fight.step()
+                self.dice.roll_dice_start(self.turn.face)
+                self.rolling = True
+
+    def update(self, current_time):
+        """
+        Shows the attacks of the turn played by the fight, waiting for the animations and the delays
+        between them, and checks the endgame states.
+
+        Args:
+            current_time(int): The game time in milliseconds.
+        """
+        enemy = self.enemy
+        player = self.player
         enemy.update()
         player.update()
+        if self.rolling and self.clock.skipping:
+            while not self.dice.has_landed:
+                self.dice.update()
 
-        if rolling and dice.has_landed:
-            dice_roll_value = dice.roll_value()
-            print(f"Dice has landed on {dice_roll_value}")
-            if dice_roll_value is not None:
-                print(f"Player rolled a {dice_roll_value}")
-                player.attack(enemy,dice_roll_value,player_state.lucky_die_amount)
-                player_attacked = True
-            rolling = False
+        if self.rolling and self.dice.has_landed:
+            player.attack(enemy,self.turn.player_damage)
+            self.player_attacked = True
+            self.rolling = False
 
-        if not enemy.is_dead and player_attacked:
+        if not enemy.is_dead and self.player_attacked:
             if player.animation_finished and enemy.animation_finished:
-                current_time = pygame.time.get_ticks()
                 attack_delay = 1000 if enemy.enemy_type == "zombie" else 500
-                if current_time - enemy.attack_timer >= attack_delay:
-                    enemy.attack(player,dice.roll_value())
-                    player_attacked = False
+                if current_time - enemy.attack_timer >= self.clock.wait(attack_delay):
+                    enemy.attack(player,self.turn.enemy_damage)
+                    self.player_attacked = False
+                    self.turn = None
 
         elif player.state == "death":
-            endgame_state = True
-            current_time = pygame.time.get_ticks()
+            self.endgame_state = True
             death_delay = 1500
-            if current_time - player.death_timer >= death_delay:
-                main_menu()
-                running = False
+            if current_time - player.death_timer >= self.clock.wait(death_delay):
+                self.manager.pop("PLAYER_DIED")
+                return
 
-        elif enemy.is_dead and enemy_type == "boss":
-            victory = True
-            current_time = pygame.time.get_ticks()
+        elif enemy.is_dead and self.enemy_type == "boss":
+            self.victory = True
             death_delay = 2500
-            if current_time - enemy.death_timer >= death_delay:
-                main_menu()
-                running = False
+            if current_time - enemy.death_timer >= self.clock.wait(death_delay):
+                self.manager.pop("BOSS_DEFEATED")
+                return
 
         elif enemy.is_dead:
-            current_time = pygame.time.get_ticks()
             death_delay = 2500
-            if current_time - enemy.death_timer >= death_delay:
-                player_state.current_health = player.current_health
-                player_state.gold += enemy.reward
-                return "ENEMY_DEFEATED"
-
-        health_bar_player.hp = player.current_health
-        health_bar_enemy.hp = enemy.current_health
-
-        screen.blit(bg, (0, 0))
-        dice_sprites.update()
-        dice_sprites.draw(screen)
-        roll_button.draw(screen)
-        health_bar_player.draw(screen)
-        health_bar_player.health_value_display(screen,font)
-        health_bar_enemy.draw(screen)
-        health_bar_enemy.health_value_display(screen,font)
-        screen.blit((pygame.transform.flip(enemy.image,flip_x=1,flip_y=0)), enemy.rect.topleft)
-        screen.blit(player.image, player.rect.topleft)
-        if victory:
-            screen.blit(victory_text, (screen.get_width() / 2 - endgame_text.get_width() / 2, screen.get_height() / 2 - 250))
-        if endgame_state:
-            screen.blit(endgame_text, (screen.get_width() / 2 - endgame_text.get_width() / 2, screen.get_height() / 2 - 250))
-        pygame.display.flip()
-        clock.tick(60)
\ No newline at end of file
+            if current_time - enemy.death_timer >= self.clock.wait(death_delay):
+                self.player_state.current_health = self.fight.player_health
+                self.player_state.gold += self.fight.reward
+                self.manager.pop("ENEMY_DEFEATED")
+                return
+
+        self.health_bar_player.hp = player.current_health
+        self.health_bar_enemy.hp = enemy.current_health
+        self.dice_sprites.update()
+
+    def draw(self, screen):
+        """
+        Draws the combat screen.
+
+        Args:
+            screen(pygame.Surface): The Pygame screen surface where the combat will be rendered.
+        """
+        screen.blit(self.bg, (0, 0))
+        screen.blit(self.dice.image, self.dice.interpolated_topleft(self.manager.interpolation))
+        self.roll_button.draw(screen)
+        self.health_bar_player.draw(screen)
+        self.health_bar_player.health_value_display(screen,self.font)
+        self.health_bar_enemy.draw(screen)
+        self.health_bar_enemy.health_value_display(screen,self.font)
+        screen.blit(self.enemy.image, self.enemy.rect.topleft)
+        screen.blit(self.player.image, self.player.rect.topleft)
+        if self.victory:
+            screen.blit(self.victory_text, (screen.get_width() / 2 - self.endgame_text.get_width() / 2, screen.get_height() / 2 - 250))
+        if self.clock.paused:
+            screen.blit(self.paused_text, (screen.get_width() - self.paused_text.get_width() - 20, 20))
+        elif self.clock.turbo:
+            turbo_text = self.skip_text if self.clock.skipping else self.turbo_text
+            screen.blit(turbo_text, (screen.get_width() - turbo_text.get_width() - 20, 20))
+        if self.endgame_state:
+            screen.blit(self.endgame_text, (screen.get_width() / 2 - self.endgame_text.get_width() / 2, screen.get_height() / 2 - 250))
@@ -1,4 +1,4 @@
-import copy
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 
@@ -11,15 +11,29 @@ from assets.items import Item
 from assets.healthbar import HealthBar
 from assets.playerstate import PlayerState
 from assets.merchant import Merchant
+from assets.autotile import ATLAS_KEYS
+from assets.dungeon_renderer import Camera, ChunkRenderer
+from assets.dungeon import generate_floor, FloorState, ENEMY_TYPES, BOSS_FLOOR
+from assets.scene_manager import Scene
+from assets.asset_cache import asset_cache
+from assets.text_cache import text_cache
+from assets.hud import HudOverlay
+from assets.dirty_rects import DirtyTracker
+from assets.occupancy import OccupancyGrid
+from assets.tilegrid import PixelTransform
+from assets.savefile import RunSave
+from assets.autosave import (AutosaveWriter, recover_run, pack_position, ENEMY_KILLED, GOLD_CHANGED, POTION_CHANGED,
+                             HEALTH_CHANGED, LUCKY_DIE_CHANGED, PLAYER_MOVED)
 import combat
 
 pygame.init()
-clock = pygame.time.Clock()
 
 floor_number = 1
-FLOOR_WIDTH = 500
-FLOOR_HEIGHT = 500
+FLOOR_WIDTH = 31
+FLOOR_HEIGHT = 31
 NUM_ROOMS = 5
+DOOR_ENTITY = "door"
+SAVE_PATH = "../saves/run.sav"
 player_state = PlayerState(150,50,potion_amount=3)
 
 class GameStates:
@@ -33,427 +47,171 @@ class GameStates:
     EXPLORATION = "exploration"
     COMBAT = "combat"
 
-class Room:
+class DungeonTiles:
     """
-    Represents a rectangular room in a dungeon map environment.
+    Holds the images used to draw the dungeon map.
 
     Attributes:
-        x(int): The x-coordinate of the top-left corner of the room in the grid.
-        y(int): The y-coordinate of the top-left corner of the room in the grid.
-        width(int): The width of the room.
-        height(int): The height of the room.
         TILE(pygame.Surface): The image representation of the floor tile for the room.
         WALL(pygame.Surface): The image representation of the wall tile for the room.
         TRAPDOOR(pygame.Surface): The image representation of the trapdoor entity.
         DOOR(pygame.Surface): The image representation of the door entity.
+        ATLAS(dict[tuple, pygame.Surface]): Every tile image in every rotation, keyed by the
+            ATLAS_KEYS of the autotiler.
     """
-    def __init__(self, x, y, width, height):
-        """
-        Initializes a Room object with the specified coordinates and dimensions.
-
-        Args:
-            x (int): The x-coordinate of the top-left corner of the room.
-            y (int): The y-coordinate of the top-left corner of the room.
-            width (int): The width of the room.
-            height (int): The height of the room.
-        """
-        self.x = x
-        self.y = y
-        self.width = width
-        self.height = height
-
     TILE = None
     WALL = None
     TRAPDOOR = None
     DOOR = None
+    ATLAS = None
 
     @classmethod
     def load_images(cls):
         """
-        Loads images for visual elements within the Room.
-        """
-        cls.TILE = pygame.image.load("../assets/map_assets/dongeonWallFloorTransparent1.png").convert_alpha()
-        cls.WALL = pygame.image.load("../assets/map_assets/dongeonWallFloorTransparent10.png").convert_alpha()
-        cls.TRAPDOOR = pygame.image.load("../assets/map_entities/trapdoor.png").convert_alpha()
-        cls.DOOR = pygame.image.load("../assets/map_entities/door.png").convert_alpha()
-
-    def center(self):
-        """
-        Calculates the center coordinates of the room.
-
-        :returns int: The center coordinates of the room.
-        """
-        center_x = self.x + self.width // 2
-        center_y = self.y + self.height // 2
-        return center_x, center_y
-
-    def check_overlap(self,other_room):
-        """
-        Checks if the room overlaps with another room.
-
-        Args:
-            other_room (Room): The other room to check for overlap.
-
-        :returns bool: True if the rooms overlap, False otherwise.
+        Loads images for visual elements within the dungeon and builds the rotated tile atlas.
+        The images are only loaded once.
         """
-        tile_width = Room.TILE.get_width()
-        tile_height = Room.TILE.get_height()
-
-        return (
-            self.x // tile_width < (other_room.x + other_room.width) // tile_width
-            and (self.x + self.width) // tile_width > other_room.x // tile_width
-            and self.y // tile_height < (other_room.y + other_room.height) // tile_height
-            and (self.y + self.height) // tile_height > other_room.y // tile_height
-                    )
-
-def sort_tile_types(dungeon_map):
-    """
-    Sorts tile types in a dungeon map into floor tiles, wall tiles, and corner tiles.
-
-    Args:
-        dungeon_map (list[list[str]]): A 2D list where each element represents a tile in the dungeon.
-
-    :returns list[tuple[int, int]]: A list of tuples representing positions (y, x) of floor tiles.
-    """
-    floor_list = []
-    wall_list = []
-    corner_list = []
-
-    for y,row in enumerate(dungeon_map):
-        for x,tile in enumerate(row):
-            if tile == "WALL":
-                if ((dungeon_map[y][x-1] == "WALL" or dungeon_map[y][x+1] == "WALL")
-                    and (dungeon_map[y-1][x] == "WALL" or dungeon_map[y+1][x] == "WALL")):
-                    corner_list.append((y,x))
-                else:
-                    wall_list.append((y,x))
-            elif tile == "FLOOR":
-                floor_list.append((y,x))
-
-    return floor_list, wall_list, corner_list
-
-def update_wall_boundaries(dungeon_map):
-    """
-    Updates wall boundaries in a dungeon map based on floor tiles. Check floor tiles neighbors for walls.
-    Updates the new map with said floor,corridor, and wall tiles.
+        if cls.ATLAS is not None:
+            return
+        images = {variant: asset_cache.load(f"../assets/map_assets/dongeonWallFloorTransparent{variant}.png")
+                  for variant in range(1, 17)}
+        edge = images[3].get_width() // 4
+        images["corner"] = pygame.Surface(images[3].get_size(), pygame.SRCALPHA)
+        images["corner"].blit(images[3], (images[3].get_width() - edge, 0),
+                              (images[3].get_width() - edge, 0, edge, edge))
+        images["trapdoor"] = asset_cache.load("../assets/map_entities/trapdoor.png")
+        images["door"] = asset_cache.load("../assets/map_entities/door.png")
+        atlas = {}
+        for name, rotation in ATLAS_KEYS:
+            image = images[name]
+            atlas[(name, rotation)] = pygame.transform.rotate(image, rotation) if rotation else image
+        cls.TILE = images[1]
+        cls.WALL = images[10]
+        cls.TRAPDOOR = images["trapdoor"]
+        cls.DOOR = images["door"]
+        cls.ATLAS = atlas
+
+def build_renderer(dungeon_map):
+    """
+    Creates the chunk renderer drawing the dungeon map from the tile atlas.
 
     Arg:
-        dungeon_map (list[list[str]]): A 2D list where each element represents a tile in the dungeon.
+        dungeon_map (TileGrid): The grid of tiles representing the dungeon map.
 
-    :returns list[list[str]]: A new 2D list representing the updated dungeon map with updated wall boundaries.
-    """
-    map_height = len(dungeon_map)
-    map_width = len(dungeon_map[0])
-    new_map = [["EMPTY" for _ in range(map_width)] for _ in range(map_height)]
-
-    for y in range(map_height):
-        for x in range(map_width):
-            if dungeon_map[y][x] in ["FLOOR", "CORRIDOR"]:
-                new_map[y][x] = dungeon_map[y][x]
-                for dy in [-1, 0,1]:
-                    for dx in [-1, 0,1]:
-                        neighbor_x = x + dx
-                        neighbor_y = y + dy
-
-                        if 0 <= neighbor_x < map_width and 0 <= neighbor_y < map_height:
-                            if dungeon_map[neighbor_y][neighbor_x] == "WALL":
-                                new_map[neighbor_y][neighbor_x] = "WALL"
-    return new_map
-
-def create_empty_map(map_width, map_height):
-    """
-    Creates a new dungeon map filled with wall tiles.
-
-    Args:
-        map_width (int): The width of the map.
-        map_height (int): The height of the map.
-
-    :returns list[list[str]]: A 2D list representing the map with only wall tiles
+    :returns (ChunkRenderer),(None): The renderer of the dungeon map.
+        Returns None if the input dungeon_map is empty or None.
     """
-    return [["WALL" for x in range(map_width)] for _ in range(map_height)]
+    if dungeon_map is None or len(dungeon_map) == 0:
+        print("Error: dungeon_map is empty or None in build_renderer.")
+        return None
+    transform = PixelTransform(DungeonTiles.TILE.get_width(), DungeonTiles.TILE.get_height())
+    return ChunkRenderer(dungeon_map, DungeonTiles.ATLAS, transform)
 
-def generate_rooms(floor_width, floor_height,num_rooms):
+def spawn_view(renderer, player_spawn, view_size):
     """
-    Generates a list of non-overlapping rooms given the floor dimensions and number of rooms
-    to create. Applies a buffer to ensure the rooms are inside the floor boundaries.
-
     Args:
-        floor_width (int): The width of the floor where rooms will be placed.
-        floor_height (int): The height of the floor where rooms will be placed.
-        num_rooms (int): The number of rooms to generate.
+        renderer (ChunkRenderer): The renderer of the dungeon map.
+        player_spawn (tuple[int, int]): The (y, x) tile position of the player's spawn.
+        view_size (tuple[int, int]): The width and height of the screen.
 
-    :returns list[Room]: A list of Room objects representing generated non-overlapping rooms
-    """
-    rooms = []
-    tile_width = Room.TILE.get_width()
-    min_room_size = tile_width * 3
-    max_room_size = tile_width * 5
-    buffer = 1 * tile_width
-
-    for i in range(num_rooms):
-        room_width = random.randint(min_room_size, max_room_size)
-        room_height = random.randint(min_room_size, max_room_size)
-        room_x = random.randint(buffer, floor_width - room_width - buffer)
-        room_y = random.randint(buffer, floor_height - room_height - buffer)
-        new_room = Room(room_x, room_y, room_width, room_height)
-
-        if all(not new_room.check_overlap(other_room) for other_room in rooms):
-            rooms.append(new_room)
-    return rooms
-
-def carve_rooms(room_list, dungeon_map):
+    :returns Camera: A camera following the player's spawn.
     """
-    Iterates over a list of rooms and replaces corresponding wall tiles with floor tiles
-    in the dungeon map.
+    camera = Camera(view_size[0], view_size[1], renderer.pixel_width, renderer.pixel_height)
+    pixel_x, pixel_y = renderer.transform.to_pixel(player_spawn[1], player_spawn[0])
+    camera.follow(pixel_x + renderer.tile_width // 2, pixel_y + renderer.tile_height // 2)
+    return camera
 
-    Args:
-        room_list (list[Room]): A list of Room objects representing non-overlapping rooms.
-        dungeon_map (list[list[str]]): A 2D list representing the dungeon map.
+def prepare_floor(floor_plan, view_size):
     """
-    tile_width = Room.TILE.get_width()
-    tile_height = Room.TILE.get_height()
+    Creates the renderer of a floor and draws the chunks seen from the player's spawn.
+    Draws pygame surfaces, so it's only called from the main thread.
 
-    for room in room_list:
-        for y in range(room.y // tile_height,(room.y+room.height) // tile_height):
-            for x in range(room.x // tile_width, (room.x + room.width) // tile_width):
-                dungeon_map[y][x] = "FLOOR"
+    Args:
+        floor_plan (FloorSnapshot): The generated floor.
+        view_size (tuple[int, int]): The width and height of the screen.
 
-def carve_corridors(rooms,dungeon_map):
+    :returns ChunkRenderer: The renderer of the floor.
     """
-    Checks the centre coordinates of each room in a list and replaces "WALL" tiles with "CORRIDOR" tiles.
-    Iterates over the x,y coordinates between the centers of two adjacent rooms.
+    renderer = build_renderer(floor_plan.dungeon_map)
+    renderer.prerender(spawn_view(renderer, floor_plan.player_spawn, view_size).visible_area())
+    return renderer
 
-    Args:
-        rooms (list[Room]): A list of Room objects representing non-overlapping rooms.
-        dungeon_map (list[list[str]]): A 2D list representing the dungeon map.
-    """
-    for i in range(len(rooms) - 1):
-        room_a = rooms[i]
-        room_b = rooms[i + 1]
-        tile_width = Room.TILE.get_width()
-        tile_height = Room.TILE.get_height()
-        center_a = (room_a.center()[0] // tile_width, room_a.center()[1] // tile_height)
-        center_b = (room_b.center()[0] // tile_width, room_b.center()[1] // tile_height)
-
-        for x in range(min(center_a[0], center_b[0]), max(center_a[0], center_b[0]) + 1):
-            if dungeon_map[center_a[1]][x] == "WALL":
-                dungeon_map[center_a[1]][x] = "CORRIDOR"
-
-        for y in range(min(center_a[1], center_b[1]), max(center_a[1], center_b[1]) + 1):
-            if dungeon_map[y][center_b[0]] == "WALL":
-                dungeon_map[y][center_b[0]] = "CORRIDOR"
-
-def rotate_walls(dungeon_map,x ,y):
+class FloorPrefetcher:
     """
-    Rotate the walls inside the dungeon map based on their neighboring cells.
-
-    Args:
-        dungeon_map (list[list[str]]): A 2D list representing the dungeon map.
-        x (int): The x-coordinate of the cell to inspect.
-        y (int): The y-coordinate of the cell to inspect.
+    Generates the next floor in a worker thread while the current one is played. The seed is
+    drawn by the caller when the request is made, so the floor and the random number generator
+    state stay the same however long the worker takes.
 
-    :returns str: A string describing the determined rotated state for the cell, such as "right_turn",
-             "left_turn" or "wall" for non-rotated walls.
+    Attributes:
+        executor (ThreadPoolExecutor): The single worker thread generating the floors.
+        future (Future): The floor being generated, or None if nothing was requested.
+        floor_number (int): The number of the floor being generated.
+        seed (int): The seed of the floor being generated.
     """
-    map_height = len(dungeon_map)
-    map_width = len(dungeon_map[0])
+    def __init__(self):
+        """
+        Initializes a FloorPrefetcher object.
+        """
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="floor-prefetch")
+        self.future = None
+        self.floor_number = None
+        self.seed = None
 
-    def is_wall(x,y):
+    def start(self, seed, number):
         """
-        Check if the cell is a wall or door.
+        Starts generating a floor in the background, replacing any earlier request.
 
         Args:
-            x (int): The x-coordinate of the cell to inspect.
-            y (int): The y-coordinate of the cell to inspect.
-
-        :returns bool: True if the cell is a wall or door, False otherwise.
+            seed (int): The seed of the floor.
+            number (int): The number of the floor inside the tower.
         """
-        if 0 <= x < map_width and 0 <= y < map_height:
-            return dungeon_map[y][x] == "WALL" or dungeon_map[y][x] == "DOOR"
-        return False
-
-    def is_floor_or_corridor(x,y):
+        if self.future is not None:
+            self.future.cancel()
+        self.floor_number = number
+        self.seed = seed
+        self.future = self.executor.submit(generate_floor, seed, number, FLOOR_WIDTH, FLOOR_HEIGHT, NUM_ROOMS,
+                                           ENEMY_TYPES)
+
+    def take(self, number):
         """
-        Check if the cell is a floor or corridor or trapdoor.
+        Hands over the requested floor, waiting for the worker if it isn't finished yet.
+        The request is cleared either way. An error raised while generating the floor is raised here.
 
         Args:
-            x (int): The x-coordinate of the cell to inspect.
-            y (int): The y-coordinate of the cell to inspect.
+            number (int): The number of the floor that is needed.
 
-        :returns bool: True if the cell is a floor or corridor or trapdoor, False otherwise.
+        :returns FloorSnapshot or None: The floor, or None if it wasn't requested and has to be
+            generated from a new seed.
         """
-        if 0 <= x < map_width and 0 <= y < map_height:
-            return (dungeon_map[y][x] == "FLOOR" or dungeon_map[y][x] == "CORRIDOR"
-                    or dungeon_map[y][x] == "TRAPDOOR")
-        return False
-
-    top = is_wall(x, y - 1)
-    bottom = is_wall(x, y + 1)
-    right = is_floor_or_corridor(x + 1, y)
-    left = is_floor_or_corridor(x - 1, y)
+        future, self.future = self.future, None
+        if future is None or self.floor_number != number:
+            if future is not None:
+                future.cancel()
+            return None
+        return future.result()
 
-    if top and bottom and left:
-        return "right_turn"
-    elif top and bottom and right:
-        return "left_turn"
-    else:
-        return "wall"
+floor_prefetcher = FloorPrefetcher()
 
-def generate_dungeon_surface(dungeon_map):
+def door_message_text(screen,message):
     """
-    Generates a surface representation of the dungeon based on the provided
-    dungeon map. Rotates the walls based on their neighboring cells.
-
-    Arg:
-        dungeon_map (list[list[str]]): A 2D list representing the dungeon map.
-
-    :returns (pygame.Surface),(None): A PyGame surface object containing the generated dungeon layout.
-        Returns None if the input dungeon_map is empty or None.
-    """
-    if dungeon_map is None or len(dungeon_map) == 0:
-        print("Error: dungeon_map is empty or None in generate_dungeon_surface.")
-        return None
-    tile_width = Room.TILE.get_width()
-    tile_height = Room.TILE.get_height()
-    dungeon_width = len(dungeon_map[0])
-    dungeon_height = len(dungeon_map)
-    dungeon_surf = pygame.Surface((dungeon_width, dungeon_height), pygame.SRCALPHA)
-
-    for y, row in enumerate(dungeon_map):
-        for x, tile_type in enumerate(row):
-            x_pixel_pos = x * tile_width
-            y_pixel_pos = y * tile_height
-            if tile_type == "WALL":
-                wall_rotation = rotate_walls(dungeon_map,x,y)
-                if wall_rotation == "right_turn":
-                    rotated_wall = pygame.transform.rotate(Room.WALL, -90)
-                    dungeon_surf.blit(rotated_wall, (x_pixel_pos, y_pixel_pos))
-                elif wall_rotation == "left_turn":
-                    rotated_wall = pygame.transform.rotate(Room.WALL, 90)
-                    dungeon_surf.blit(rotated_wall, (x_pixel_pos, y_pixel_pos))
-                else:
-                    dungeon_surf.blit(Room.WALL, (x_pixel_pos, y_pixel_pos))
-            elif tile_type == "DOOR":
-                wall_rotation = rotate_walls(dungeon_map,x,y)
-                if wall_rotation == "right_turn":
-                    rotated_wall = pygame.transform.rotate(Room.DOOR, -90)
-                    dungeon_surf.blit(rotated_wall, (x_pixel_pos, y_pixel_pos))
-                elif wall_rotation == "left_turn":
-                    rotated_wall = pygame.transform.rotate(Room.DOOR, 90)
-                    dungeon_surf.blit(rotated_wall, (x_pixel_pos, y_pixel_pos))
-                else:
-                    dungeon_surf.blit(Room.DOOR, (x_pixel_pos, y_pixel_pos))
-            elif tile_type == "FLOOR":
-                dungeon_surf.blit(Room.TILE, (x_pixel_pos, y_pixel_pos))
-            elif tile_type == "CORRIDOR":
-                dungeon_surf.blit(Room.TILE, (x_pixel_pos, y_pixel_pos))
-            elif tile_type == "TRAPDOOR":
-                dungeon_surf.blit(Room.TRAPDOOR, (x_pixel_pos, y_pixel_pos))
-    return dungeon_surf
-
-def dungeon_generator():
-    """
-    Generates a random dungeon map with rooms, corridors, and spawns for player and enemies
-    and other entities.
-
-    :returns tuple[list[list[str]], list[Room], tuple[int, int], pygame.sprite.Group, dict[str, list]]:
-        - The dungeon layout as a 2D list of strings representing tile types.
-        - The list of rooms inside the dungeon.
-        - The coordinates of the player's spawn location.
-        - A sprite group containing all enemy instances created in the dungeon level.
-        - A dictionary containing positions of the dungeon entities:
-            'trapdoor': The position of the trapdoor.
-            'door': The position of the door.
-            'enemies': A list of enemy data.
-            'merchant': The position of the merchant.
-    """
-    dungeon_map = create_empty_map(FLOOR_WIDTH, FLOOR_HEIGHT)
-    rooms = generate_rooms(FLOOR_WIDTH, FLOOR_HEIGHT, NUM_ROOMS)
-    carve_rooms(rooms, dungeon_map)
-    carve_corridors(rooms, dungeon_map)
-    dungeon_map = update_wall_boundaries(dungeon_map)
-    player_spawn,enemy_group,entity_positions = entity_spawner(dungeon_map,["slime","skeleton","zombie"])
-
-    return dungeon_map,rooms,player_spawn,enemy_group,entity_positions
-
-def load_dungeon(saved_dungeon_map, saved_entity_pos):
-    """
-    Loads the saved dungeon map and initializes entities based on saved data.
-
-    Args:
-        saved_dungeon_map (Any): The saved dungeon layout to be loaded.
-        saved_entity_pos (dict[str,list]): Data containing information about enemies and
-        other entities in the dungeon.
-
-    :returns tuple[tuple[int, int], pygame.sprite.Group, dict[str,list]]:
-        - The coordinates of the player's spawn location.
-        - A sprite group containing all enemy instances created in the dungeon level.
-        - A dictionary containing positions of the dungeon entities:
-            'trapdoor': The position of the trapdoor.
-            'door': The position of the door.
-            'enemies': A list of enemy data.
-            'merchant': The position of the merchant.
-    """
-    if saved_dungeon_map is None:
-        raise ValueError("No saved dungeon map found.")
-    enemy_group = pygame.sprite.Group()
-    player_spawn = None
-    for enemy_data in saved_entity_pos['enemies']:
-        spawn_x = enemy_data['x']
-        spawn_y = enemy_data['y']
-        enemy_type = enemy_data['type']
-        killed = enemy_data['killed']
-        spawned = enemy_data['spawned']
-        if not killed:
-            enemy = Enemy(spawn_y, spawn_x, enemy_type)
-            enemy_group.add(enemy)
-        elif killed and not spawned:
-            player_spawn = (spawn_x,spawn_y)
-            enemy_data['spawned'] = True
-    floor_list, wall_list, _ = sort_tile_types(saved_dungeon_map)
-    entity_pos = copy.deepcopy(saved_entity_pos)
-    return player_spawn,enemy_group,entity_pos
-
-def return_to_exploration(screen,main_menu, saved_dungeon_map=None, saved_entity_pos=None):
-    """
-    Handles the process of returning to the exploration state in the game after combat
-    state.
-
-    Args:
-        screen (pygame.Surface): The display surface where the game will be rendered.
-        main_menu (Any): Reference to the main menu for restarting or exiting the game.
-        saved_dungeon_map (Any): The saved dungeon layout to be loaded.
-        saved_entity_pos (dict[str,list]): Data containing information about enemies and
-        other entities in the dungeon.
-    """
-    print("Returning to exploration mode!")
-    if saved_dungeon_map and saved_entity_pos:
-        game(screen,main_menu,saved_dungeon_map,saved_entity_pos)
-
-    else:
-        print("Error: No saved dungeon map or enemy data!")
-
-def door_message(screen,message):
-    """
-    Checks if a message is provided and displays it on the screen if it is not None.
+    Renders a message and places it at the bottom of the screen.
 
     Args:
         screen (pygame.Surface): The display surface where the message will be rendered.
         message (str): The message to be displayed on the screen.
+
+    :returns tuple[pygame.Surface, pygame.Rect]: The rendered message and the area it's shown in.
     """
-    if message:
-        font = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 36)
-        text_surf = font.render(message,False,(255,255,255))
-        text_rect = text_surf.get_rect(center=(screen.get_width()/2,650))
-        screen.blit(text_surf,text_rect)
+    text_surf = text_cache.render(text_cache.font(36), message)
+    return text_surf, text_surf.get_rect(center=(screen.get_width()/2,650))
 
-def door_interact(door_spawn,player_pos,event,enemy_group):
+def door_interact(occupancy,player_pos,event,enemy_group):
     """
     Handles interaction with a door during the game based on the player's position,
     the event triggered, and state of the enemies in the game.
 
     Args:
-        door_spawn (tuple[int, int]): The coordinates of the door's spawn point on the dungeon map.
+        occupancy (OccupancyGrid): The entities of the floor, including the door.
         player_pos (tuple[int, int]): The current position of the player on the dungeon map.
         event (pygame.event.Event): The event object that represents user input.
         enemy_group (pygame.sprite.Group): A group of enemy objects currently present in the game.
@@ -461,201 +219,335 @@ def door_interact(door_spawn,player_pos,event,enemy_group):
         :returns str or bool: A message indicating how to go to the next floor or
         bool if there aren't any enemies left to defeat.
     """
-    adjacent_positions = [
-        (door_spawn[0] + 1, door_spawn[1]),  # Right
-        (door_spawn[0] - 1, door_spawn[1]),  # Left
-        (door_spawn[0], door_spawn[1] + 1),  # Down
-        (door_spawn[0], door_spawn[1] - 1)  # Up
-    ]
     if event.type == pygame.KEYDOWN and event.key == pygame.K_e:
-        if player_pos in adjacent_positions:
+        if DOOR_ENTITY in occupancy.neighbours(player_pos):
             if len(enemy_group) > 0:
                 return "Kill all enemies to progress to the next floor"
             else:
                 return True
         return False
 
-def entity_spawner(dungeon_map,enemy_types):
+def entity_spawner(floor_state, occupancy=None):
     """
-    Spawns dungeon entities within a dungeon map and creates a group for spawned enemies to be managed.
+    Creates the enemies of a dungeon level that are still alive and groups them to be managed.
 
     Args:
-        dungeon_map (list[list[str]]): A 2D list representing the dungeon map.
-        enemy_types (list[str]): A list containing different enemy type names.el.
-
-    :returns tuple[tuple[int, int], pygame.sprite.Group, dict[str, list]]:
-        - The coordinates of the player's spawn location.
-        - A sprite group containing all enemy instances created in the dungeon level.
-        - A dictionary containing positions of the dungeon entities:
-            'trapdoor': The position of the trapdoor.
-            'door': The position of the door.
-            'enemies': A list of enemy data.
-            'merchant': The position of the merchant.
+        floor_state (FloorState): The floor and the enemies killed on it.
+        occupancy (OccupancyGrid, optional): The index the enemies are added to.
+
+    :returns pygame.sprite.Group: A sprite group containing all enemy instances created in the dungeon level.
     """
     enemy_group = pygame.sprite.Group()
-    entity_positions = {'trapdoor' : None, 'door' : None, 'enemies': [], 'merchant': None}
-    floor_list, wall_list, _ = sort_tile_types(dungeon_map)
-
-    player_spawn = random.choice(floor_list)
-    trapdoor_pos = player_spawn
-    dungeon_map[player_spawn[0]][player_spawn[1]] = "TRAPDOOR"
-    entity_positions['trapdoor'] = trapdoor_pos
-
-    door_spawn = random.choice(wall_list)
-    dungeon_map[door_spawn[0]][door_spawn[1]] = "DOOR"
-
-    entity_positions['door'] = door_spawn
-    floor_list.remove(player_spawn)
-    merchant_spawn = random.choice(floor_list)
-    entity_positions['merchant'] = merchant_spawn
-    floor_list.remove(merchant_spawn)
-    if floor_number == 10:
-        spawn_x, spawn_y = random.choice(floor_list)
-        enemy = Enemy(spawn_y,spawn_x,"boss")
+    for record in floor_state.alive_enemies():
+        enemy = Enemy(record.x, record.y, record.enemy_type, record=record)
         enemy_group.add(enemy)
-        floor_list.remove((spawn_x,spawn_y))
-        entity_positions['enemies'].append({'x': spawn_x, 'y': spawn_y, 'type': "boss", 'killed': False, 'spawned': False})
-    else:
-        for _ in range(NUM_ROOMS):
-            spawn_x, spawn_y = random.choice(floor_list)
-            enemy_type = random.choice(enemy_types)
-            enemy = Enemy(spawn_y,spawn_x,enemy_type)
-            enemy_group.add(enemy)
-            floor_list.remove((spawn_x,spawn_y))
-            entity_positions['enemies'].append({'x': spawn_x, 'y': spawn_y, 'type': enemy_type, 'killed': False, 'spawned': False})
-
-    return player_spawn, enemy_group, entity_positions
-
-def draw_dungeon(screen, dungeon_surf):
+        if occupancy is not None:
+            occupancy.add(record.pos, enemy)
+    return enemy_group
+
+def draw_dungeon(screen, renderer, camera):
     """
-    Draws the dungeon surface onto the provided screen surface, centrally aligning it
-    based on the dimensions of both the dungeon surface and the screen.
+    Draws the part of the dungeon that is seen by the camera onto the provided screen surface.
 
     Args:
         screen (pygame.Surface): The main display surface where the dungeon will be rendered.
-        dungeon_surf (pygame.Surface): The surface representing the dungeon to be drawn.
+        renderer (ChunkRenderer): The renderer of the dungeon to be drawn.
+        camera (Camera): The camera following the player.
     """
-    dungeon_width = dungeon_surf.get_width()
-    dungeon_height = dungeon_surf.get_height()
-    global offset_x, offset_y
-
-    screen_width, screen_height = screen.get_size()
+    renderer.draw(screen, camera)
 
-    offset_x = (screen_width - dungeon_width) // 2
-    offset_y = (screen_height - dungeon_height) // 2
+autosave = AutosaveWriter(SAVE_PATH)
 
-    screen.blit(dungeon_surf, (offset_x, offset_y))
-
-def game(screen, main_menu,dungeon_map = None,saved_entity_pos = None):
+def load_game(path=SAVE_PATH):
     """
-    Plays the dungeon-crawling game loop, initializing or continuing the gameplay with
-    necessary entities. It handles game states, player interactions, enemy encounters.
+    Loads a saved run, replaying the changes autosaved after it, and restores the floor number,
+    the player's state and the random number generator the next floors are seeded from.
 
     Args:
-        screen (pygame.Surface): The Pygame surface where the game will be rendered.
-        main_menu (Any): Reference to the main menu for restarting or exiting the game.
-        dungeon_map (list[list[str]]): Optional existing dungeon map for resuming gameplay.
-        saved_entity_pos (dict): Optional data for retaining existing enemy data.
+        path (str, optional): The path of the save file. Defaults to SAVE_PATH.
+
+    :returns RunSave: The loaded run, to be handed to an ExplorationScene.
+    """
+    global floor_number, player_state
+    autosave.flush()
+    run_save = recover_run(path)
+    floor_number = run_save.floor_number
+    player_state = run_save.player_state
+    random.setstate(run_save.rng_state)
+    return run_save
 
+class ExplorationScene(Scene):
     """
-    gold = Item(410,5,"Gold")
-    potion = Item(410,25,"Potion")
-    lucky_die = Item(410,45,"Lucky_die")
-    global player_state, floor_number
-    health_bar_player = HealthBar(50, 50, 200, 15,150,player_state.current_health)
-    font = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 20)
-    number_of_floors = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 50).render(f"Floor: {floor_number}", False, (255, 255, 255))
-    message = ""
-    message_duration = 0
-    Room.load_images()
-
-    if dungeon_map is None:
-        dungeon_map,rooms,player_spawn,enemy_group,entity_pos = dungeon_generator()
-    else:
-        player_spawn, enemy_group, entity_pos = load_dungeon(dungeon_map,saved_entity_pos)
-
-    player_start = player_spawn
-    merchant = Merchant(entity_pos['merchant'][1],entity_pos['merchant'][0])
-    player = Player(player_start[1] * 16, player_start[0] * 16, 16, 16)
-    dungeon_surface = generate_dungeon_surface(dungeon_map)
-    saved_dungeon_map = copy.deepcopy(dungeon_map)
-    state = GameStates.EXPLORATION
-    dungeon_map[merchant.y][merchant.x] = "MERCHANT"
-    running = True
-
-    while running:
-        potions_amount = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 50).render(f"{player_state.potion_amount}", False, (255, 255, 255))
-        potions_text_x = potion.rect.left - 50
-        potions_text_y = potion.rect.centery - 10
-        gold_amount = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 50).render(f"{player_state.gold}", False, (255, 255, 255))
-        gold_text_x = gold.rect.left - 50
-        gold_text_y = gold.rect.centery - 10
-        lucky_die_amount = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 50).render(f"{player_state.lucky_die_amount}", False, (255, 255, 255))
-        lucky_die_x = lucky_die.rect.left - 50
-        lucky_die_y = lucky_die.rect.centery - 10
-        health_bar_player.hp = player_state.current_health
-        current_time = pygame.time.get_ticks()
+    Plays a floor of the dungeon, handling the player's movement, interactions and enemy encounters.
+    Encounters push a CombatScene on top of this one and the floor is kept as it is while the combat runs.
+    Going through the door replaces this scene with the next floor.
+
+    Attributes:
+        floor_plan (FloorSnapshot): The generated floor.
+        floor_state (FloorState): The enemies killed on the floor.
+        dungeon_map (TileGrid): The grid of tiles representing the dungeon map.
+        renderer (ChunkRenderer): The renderer of the dungeon map.
+        transform (PixelTransform): The conversion between tile and dungeon pixel coordinates, shared with the renderer.
+        enemy_group (pygame.sprite.Group): The enemies left on the floor.
+        merchant (Merchant): The merchant of the floor.
+        player (Player): The player.
+        camera (Camera): The camera following the player.
+        state (str): The GameStates value of the floor.
+        current_enemy (Enemy): The enemy fought in the running combat, or None.
+        shop_version (int): The version of the player's state when the buy menu was opened, or None.
+        rng_state (tuple): The state of the random module before the next floor's seed was drawn.
+        message (str): The message shown above the HUD.
+        message_duration (int): The game time in milliseconds until the message is shown.
+        hud (HudOverlay): The health bar, floor number and inventory counters.
+        dirty_tracker (DirtyTracker): What was drawn where in the last frame.
+        drawn_offset (tuple[int, int]): The camera offset the screen was last fully drawn with.
+    """
+    def __init__(self, manager, run_save=None):
+        """
+        Initializes an ExplorationScene with the prefetched floor, waiting for it if it isn't finished,
+        or a newly generated one if it wasn't requested, and starts prefetching the next floor.
+
+        Args:
+            manager (SceneManager): The manager running the scene.
+            run_save (RunSave, optional): A run loaded with load_game to continue instead of starting a new floor.
+        """
+        super().__init__(manager)
+        screen = manager.screen
+        self.gold = Item(410,5,"Gold")
+        self.potion = Item(410,25,"Potion")
+        self.lucky_die = Item(410,45,"Lucky_die")
+        self.health_bar_player = HealthBar(50, 50, 200, 15,150,player_state.current_health)
+        self.font = text_cache.font(20)
+        self.hud = HudOverlay(screen.get_size(), player_state, self.health_bar_player, floor_number,
+                              self.gold, self.potion, self.lucky_die)
+        self.dirty_tracker = DirtyTracker()
+        self.drawn_offset = None
+        self.message = ""
+        self.message_duration = 0
+        DungeonTiles.load_images()
+
+        if run_save is None:
+            self.floor_plan = floor_prefetcher.take(floor_number)
+            if self.floor_plan is None:
+                self.floor_plan = generate_floor(random.getrandbits(32), floor_number, FLOOR_WIDTH, FLOOR_HEIGHT,
+                                                 NUM_ROOMS, ENEMY_TYPES)
+            self.floor_state = FloorState(self.floor_plan)
+            player_start = self.floor_plan.player_spawn
+        else:
+            self.floor_state = run_save.floor_state
+            self.floor_plan = self.floor_state.snapshot
+            player_start = run_save.player_pos
+        self.renderer = prepare_floor(self.floor_plan, screen.get_size())
+        self.dungeon_map = self.floor_plan.dungeon_map
+        self.occupancy = OccupancyGrid()
+        self.enemy_group = entity_spawner(self.floor_state, self.occupancy)
+        self.rng_state = random.getstate()
+        if floor_number < BOSS_FLOOR:
+            floor_prefetcher.start(random.getrandbits(32), floor_number + 1)
+
+        self.merchant = Merchant(self.floor_plan.merchant[1],self.floor_plan.merchant[0])
+        self.occupancy.add(self.floor_plan.merchant, self.merchant, blocking=True)
+        self.occupancy.add(self.floor_plan.door, DOOR_ENTITY, blocking=True)
+        self.transform = self.renderer.transform
+        self.player = Player(*self.transform.to_pixel(player_start[1], player_start[0]),
+                             self.transform.tile_width, self.transform.tile_height)
+        self.camera = spawn_view(self.renderer, player_start, screen.get_size())
+        self.state = GameStates.EXPLORATION
+        self.current_enemy = None
+        self.shop_version = None
+        self.save()
+
+    def exit(self):
+        """
+        Releases the floor's sprites and drawn chunks.
+        """
+        self.enemy_group.empty()
+        self.renderer.chunks.clear()
+
+    def resume(self, result=None):
+        """
+        Continues exploring after a combat or the merchant's buy menu. Purchases are recorded
+        in the autosave. A defeated enemy is marked as killed and removed, and the player
+        stands where the enemy stood. When the player died or beat the boss, the run is over:
+        its save is deleted and the game goes back to the main menu.
+
+        Args:
+            result (str, optional): The result of the combat: "ENEMY_DEFEATED", "PLAYER_DIED" or "BOSS_DEFEATED".
+        """
+        self.state = GameStates.EXPLORATION
+        shop_version, self.shop_version = self.shop_version, None
+        if shop_version is not None and shop_version != player_state.version:
+            autosave.record(GOLD_CHANGED, player_state.gold)
+            autosave.record(POTION_CHANGED, player_state.potion_amount)
+            autosave.record(LUCKY_DIE_CHANGED, player_state.lucky_die_amount)
+        current_enemy, self.current_enemy = self.current_enemy, None
+        if result in ("PLAYER_DIED", "BOSS_DEFEATED"):
+            autosave.discard()
+            autosave.flush()
+            self.manager.pop_to_root()
+            return
+        if result != "ENEMY_DEFEATED" or current_enemy is None:
+            return
+        self.floor_state.kill(current_enemy.record)
+        self.occupancy.remove(current_enemy.record.pos)
+        autosave.record(ENEMY_KILLED, current_enemy.record.index)
+        autosave.record(HEALTH_CHANGED, player_state.current_health)
+        autosave.record(GOLD_CHANGED, player_state.gold)
+        current_enemy.kill()
+        self.player.x, self.player.y = self.transform.to_pixel(current_enemy.x, current_enemy.y)
+        self.player.pre_x, self.player.pre_y = self.player.x, self.player.y
+        autosave.record(PLAYER_MOVED, pack_position(self.player_pos()))
+
+    def save(self):
+        """
+        Hands the whole run at the current floor over to the autosave, to be written in the background.
+        The saved random number generator state is the one from before the next floor's seed was drawn,
+        so a continued run draws the same seed again.
+        """
+        autosave.snapshot(RunSave(floor_number, self.floor_state, self.player_pos(), player_state, self.rng_state))
+
+    def player_pos(self):
+        """
+        :returns tuple[int, int]: The (y, x) tile position of the player.
+        """
+        x, y = self.transform.to_tile(self.player.x, self.player.y)
+        return y, x
+
+    def next_floor(self):
+        """
+        Replaces this scene with the next floor of the tower.
+        """
+        global floor_number
+        floor_number += 1
+        print("Proceeding to the next floor...")
+        self.manager.replace(ExplorationScene(self.manager))
+
+    def handle_event(self, event):
+        """
+        Handles the player's movement and interactions with the merchant, the door and the enemies.
+
+        Args:
+            event (pygame.event.Event): The event object representing the user input.
+        """
+        player = self.player
+        player_pos = self.player_pos()
+        if self.merchant in self.occupancy.neighbours(player_pos):
+            buy_menu = self.merchant.interact(event,player_state,self.manager)
+            if buy_menu is not None:
+                self.shop_version = player_state.version
+                self.manager.push(buy_menu)
+                return
+
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.potion.rect.collidepoint(event.pos):
+                if player_state.potion_amount > 0:
+                    player_state.potion_amount -= 1
+                    self.potion.use(player_state)
+                    autosave.record(POTION_CHANGED, player_state.potion_amount)
+                    autosave.record(HEALTH_CHANGED, player_state.current_health)
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop_to_root()
+                return
+            if event.key == pygame.K_F5:
+                self.save()
+                self.message = "Game saved"
+                self.message_duration = self.manager.game_clock.get_ticks() + 2000
+            player.move(self.transform,self.dungeon_map,event,self.occupancy)
+            player_pos = self.player_pos()
+            door_result = door_interact(self.occupancy, player_pos,event,self.enemy_group)
+            if isinstance(door_result, str):
+                self.message = door_result
+                self.message_duration = self.manager.game_clock.get_ticks() + 2000
+            elif door_result:
+                self.message = ""
+                self.next_floor()
+                return
+
+            if self.state == GameStates.EXPLORATION:
+                enemy = self.occupancy.get(player_pos)
+                if enemy is None and event.key == pygame.K_e:
+                    enemy = next((entity for entity in self.occupancy.neighbours(player_pos)
+                                  if isinstance(entity, Enemy)), None)
+                if isinstance(enemy, Enemy):
+                    self.state = GameStates.COMBAT
+                    self.current_enemy = enemy
+                    self.manager.push(combat.CombatScene(self.manager, enemy.enemy_type, player_state))
+
+    def update(self, current_time):
+        """
+        Animates the player and the enemies and moves the camera after the player.
+
+        Args:
+            current_time (int): The game time in milliseconds.
+        """
+        self.player.animation_loop()
+        self.enemy_group.update(current_time)
+        self.camera.follow(self.player.x + self.transform.tile_width // 2, self.player.y + self.transform.tile_height // 2)
+
+    def drawables(self, screen):
+        """
+        Lists everything drawn on top of the dungeon this frame, from the bottom to the top.
+
+        Args:
+            screen (pygame.Surface): The Pygame surface where the game will be rendered.
+
+        :returns list[tuple[Any, pygame.Surface, pygame.Rect]]: The owner, image and screen area of everything drawn.
+        """
+        camera = self.camera
+        transform = self.transform
+        drawables = [(enemy, enemy.image,
+                      enemy.image.get_rect(topleft=camera.apply(*transform.to_pixel(enemy.x, enemy.y))))
+                     for enemy in self.enemy_group]
+        player_frame = self.player.current_frame
+        drawables.append((self.player, player_frame,
+                          player_frame.get_rect(topleft=camera.apply(self.player.x, self.player.y))))
+        merchant_image = self.merchant.image
+        drawables.append((self.merchant, merchant_image,
+                          merchant_image.get_rect(topleft=camera.apply(*transform.to_pixel(self.merchant.x, self.merchant.y)))))
+        if self.message and self.manager.game_clock.get_ticks() <= self.message_duration:
+            drawables.append(("message", *door_message_text(screen, self.message)))
+        self.hud.refresh()
+        drawables.append((self.hud, self.hud.image, self.hud.rect))
+        health_value = self.health_bar_player.health_value_text(self.font)
+        if health_value:
+            drawables.append((self.health_bar_player, *health_value))
+        return drawables
+
+    def draw_layers(self, screen, drawables):
+        """
+        Draws the dungeon and everything on top of it. Only the clip area of the screen is changed.
+
+        Args:
+            screen (pygame.Surface): The Pygame surface where the game will be rendered.
+            drawables (list[tuple[Any, pygame.Surface, pygame.Rect]]): Everything drawn on top of the dungeon.
+        """
         screen.fill((0, 0, 0))
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if merchant and merchant.check_interact(player):
-                merchant.interact(event,player,player_state)
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if potion.rect.collidepoint(event.pos):
-                    if player_state.potion_amount > 0:
-                        player_state.potion_amount -= 1
-                        potion.use(player_state)
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-                player.move(16,16,dungeon_map,event)
-                door_result = door_interact(entity_pos['door'], (player.y // 16, player.x // 16),event,enemy_group)
-                if isinstance(door_result, str):
-                    message = door_result
-                    message_duration = current_time + 2000
-                elif door_result:
-                    floor_number += 1
-                    message = ""
-                    print("Proceeding to the next floor...")
-                    dungeon_map = None  # Clear the current dungeon map
-                    saved_dungeon_map = None
-                    saved_entity_pos = None
-                    dungeon_surface = None
-                    game(screen, main_menu)  # Restart the game function to regenerate the dungeon
-                    return  # Exit the current loop to avoid conflicting with the new game call
-
-            if state == GameStates.EXPLORATION:
-                for enemy in enemy_group:
-                    if enemy.interact(event,player):
-                        state = GameStates.COMBAT
-                        current_enemy = enemy
-                        result = combat.combat(screen,main_menu,current_enemy.enemy_type,player_state)
-                        if result == "ENEMY_DEFEATED":
-                            for enemy_data in entity_pos['enemies']:
-                                if enemy_data['x'] == current_enemy.y and enemy_data['y'] == current_enemy.x:
-                                    enemy_data['killed'] = True
-                            return_to_exploration(screen, main_menu,saved_dungeon_map,entity_pos)
-                            current_enemy.kill()
-                        break
-        player.animation_loop()
-        draw_dungeon(screen, dungeon_surface)
-        enemy_group.update(current_time)
-        for enemy in enemy_group:
-            screen.blit(enemy.image, (((enemy.x * 16) + offset_x), (enemy.y * 16) + offset_y))
-        screen.blit(player.current_frame, (player.x + offset_x, player.y + offset_y))
-        screen.blit(merchant.image,((merchant.x * 16) + offset_x,(merchant.y * 16) + offset_y))
-        if message and current_time <= message_duration:
-            door_message(screen, message)
-        health_bar_player.draw(screen)
-        health_bar_player.health_value_display(screen, font)
-        screen.blit(number_of_floors, (screen.get_width()/2-number_of_floors.get_width()/2, screen.get_height()/2-300))
-        screen.blit(gold.image,gold.rect.topleft)
-        screen.blit(potions_amount, (potions_text_x, potions_text_y))
-        screen.blit(gold_amount, (gold_text_x, gold_text_y))
-        screen.blit(potion.image,potion.rect.topleft)
-        screen.blit(lucky_die.image,lucky_die.rect.topleft)
-        screen.blit(lucky_die_amount,(lucky_die_x,lucky_die_y))
-        pygame.display.flip()
-        clock.tick(60)
\ No newline at end of file
+        draw_dungeon(screen, self.renderer, self.camera)
+        screen.blits([(surface, rect) for _, surface, rect in drawables], doreturn=False)
+
+    def draw(self, screen):
+        """
+        Draws the visible part of the floor, its entities and the HUD. The whole screen is only
+        redrawn when the camera moved or the scene was covered, otherwise just the areas where
+        something changed since the last frame.
+
+        Args:
+            screen (pygame.Surface): The Pygame surface where the game will be rendered.
+
+        :returns list[pygame.Rect] or None: The areas of the screen that changed, or None if the whole screen did.
+        """
+        drawables = self.drawables(screen)
+        offset = (self.camera.offset_x, self.camera.offset_y)
+        if self.redraw or offset != self.drawn_offset:
+            self.redraw = False
+            self.drawn_offset = offset
+            self.dirty_tracker.reset(drawables)
+            self.draw_layers(screen, drawables)
+            return None
+        dirty = self.dirty_tracker.changes(drawables)
+        for rect in dirty:
+            screen.set_clip(rect)
+            self.draw_layers(screen, drawables)
+        screen.set_clip(None)
+        return dirty
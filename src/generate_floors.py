@@ -0,0 +1,134 @@
+"""
+Generates floors without a display, for pre-baking tower content and measuring generator throughput.
+
+Run from the project root, for example:
+    python -m src.generate_floors --count 1000 --seed 42 --out floors
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from assets.dungeon import generate_floor
+
+
+def build_floor(job):
+    """
+    Generates a single floor and measures how long it took. Runs inside the worker processes.
+
+    Args:
+        job (tuple[int, int, int, int, int]): The seed, floor number, floor width, floor height and number of rooms.
+
+    :returns tuple[FloorSnapshot, float]: The generated floor and the generation time in seconds.
+    """
+    seed, floor_number, floor_width, floor_height, num_rooms = job
+    start = time.perf_counter()
+    floor_plan = generate_floor(seed, floor_number, floor_width, floor_height, num_rooms)
+    return floor_plan, time.perf_counter() - start
+
+def percentile(sorted_values, fraction):
+    """
+    Picks the value below which the given fraction of a sorted list lies, using the nearest rank.
+
+    Args:
+        sorted_values (list[float]): The values sorted in ascending order.
+        fraction (float): The fraction between 0 and 1.
+
+    :returns float: The percentile value.
+    """
+    if not sorted_values:
+        raise ValueError("Can't take the percentile of no values.")
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def dump_floor(out_dir, index, floor_plan):
+    """
+    Writes the tile grid of a floor as a .npy file and returns its entry for the floor index.
+
+    Args:
+        out_dir (str): The directory the floors are written to.
+        index (int): The position of the floor inside the batch.
+        floor_plan (FloorSnapshot): The floor to write.
+
+    :returns dict: The seed, file name, player spawn and entity positions of the floor.
+    """
+    file_name = f"floor_{index:05d}.npy"
+    np.save(os.path.join(out_dir, file_name), floor_plan.dungeon_map.codes)
+    return {
+        'seed': floor_plan.seed,
+        'floor_number': floor_plan.floor_number,
+        'tiles': file_name,
+        'player_spawn': floor_plan.player_spawn,
+        'trapdoor': floor_plan.trapdoor,
+        'door': floor_plan.door,
+        'merchant': floor_plan.merchant,
+        'enemies': [{'y': record.y, 'x': record.x, 'type': record.enemy_type} for record in floor_plan.enemies],
+    }
+
+def run_batch(count, seed, floor_number, floor_width, floor_height, num_rooms, workers, out_dir=None):
+    """
+    Generates a batch of floors across a process pool and prints the throughput and latency.
+    Floor i is generated from seed + i, so a batch can always be reproduced.
+
+    Args:
+        count (int): The number of floors to generate.
+        seed (int): The seed of the first floor.
+        floor_number (int): The floor number the floors are generated for.
+        floor_width (int): The width of the area rooms are placed in, in tiles.
+        floor_height (int): The height of the area rooms are placed in, in tiles.
+        num_rooms (int): The number of rooms on each floor.
+        workers (int): The number of worker processes.
+        out_dir (str, optional): The directory to write the floors to. Nothing is written when it's None.
+
+    :returns list[float]: The generation time of each floor in seconds.
+    """
+    jobs = [(seed + i, floor_number, floor_width, floor_height, num_rooms) for i in range(count)]
+    chunk_size = max(1, count // (workers * 8))
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    index = []
+    latencies = []
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for i, (floor_plan, elapsed) in enumerate(executor.map(build_floor, jobs, chunksize=chunk_size)):
+            latencies.append(elapsed)
+            if out_dir:
+                index.append(dump_floor(out_dir, i, floor_plan))
+    total = time.perf_counter() - start
+
+    if out_dir:
+        with open(os.path.join(out_dir, "index.json"), "w") as index_file:
+            json.dump(index, index_file)
+
+    latencies.sort()
+    print(f"Generated {count} floors with {workers} workers in {total:.3f} s ({count / total:.1f} floors/sec)")
+    print("Latency: " + ", ".join(f"p{int(fraction * 100)} {percentile(latencies, fraction) * 1000:.3f} ms"
+                                  for fraction in (0.5, 0.9, 0.99, 1.0)))
+    return latencies
+
+def main():
+    """
+    Parses the command line arguments and runs the batch.
+    """
+    parser = argparse.ArgumentParser(description="Generate Treasure Tower floors without a display.")
+    parser.add_argument("--count", type=int, default=100, help="number of floors to generate")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first floor")
+    parser.add_argument("--floor", type=int, default=1, help="floor number to generate for")
+    parser.add_argument("--width", type=int, default=31, help="width of the room area in tiles")
+    parser.add_argument("--height", type=int, default=31, help="height of the room area in tiles")
+    parser.add_argument("--rooms", type=int, default=5, help="number of rooms per floor")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--out", default=None, help="directory to dump the tile grids and entity layouts to")
+    args = parser.parse_args()
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    run_batch(args.count, args.seed, args.floor, args.width, args.height, args.rooms, args.workers, args.out)
+
+if __name__ == "__main__":
+    main()
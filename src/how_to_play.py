@@ -2,57 +2,81 @@ import math
 
 import pygame
 from assets.button import Button
+from assets.asset_cache import asset_cache
+from assets.text_cache import text_cache
+from assets.scene_manager import Scene
 pygame.init()
-clock = pygame.time.Clock()
 
 
-def how_to_play(screen, main_menu):
+class HowToPlayScene(Scene):
     """
     Displays the How to Play screen, which provides the player with instructions on the game's controls
-    and objectives.
+    and objectives. The Back button and the escape key pop the scene to go back to the main menu.
 
-    Args:
-        screen(pygame.Surface): The Pygame screen surface where the How to Play screen will be rendered.
-        main_menu(Callable): A callable function that, when invoked, transitions the user back to the main menu.
+    Attributes:
+        back_button(Button): The button going back to the main menu.
+        informations(list[pygame.Surface]): The rendered instruction lines.
+        bg(pygame.Surface): The scrolling background image.
+        scroll(int): The horizontal scroll offset of the background.
+        tiles(int): The number of background images needed to cover the screen.
     """
-    text = "Your goal is to collect the treasure on top of the tower."
-    text2 = "You can move using the W, A, S and D keys and interact with entities using the E key."
-    text3 = "To claim the final treasure,you need to reach the end of the tower and kill the boss."
-    text4 = "To overcome all of this you will use a magic dice_faces to defeat your enemies."
-    back_button = Button((screen.get_width() / 2, screen.get_height() / 2 + 120),"Back")
-    informations = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 30).render(text, False, (255, 255, 255))
-    informations2 = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 30).render(text2, False, (255, 255, 255))
-    informations3 = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 30).render(text3, False, (255, 255, 255))
-    informations4 = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 30).render(text4, False, (255, 255, 255))
-    running = True
-    bg = pygame.image.load("../assets/background/fallen_kingdom_1280x720.png").convert()
-    scroll = 0
-    tiles = math.ceil(screen.get_width() / bg.get_width()) + 1
-    while running:
-        for event in pygame.event.get():
-
-            if event.type == pygame.QUIT:
-                running = False
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if back_button.rect.collidepoint(event.pos):
-                    main_menu()
-                    running = False
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    running = False
-
-        for i in range(tiles):
-            screen.blit(bg, (i * bg.get_width() + scroll, 0))
-        scroll -= 3
-        if abs(scroll) > bg.get_width():
-            scroll = 0
+    def __init__(self, manager):
+        """
+        Initializes a HowToPlayScene object.
+
+        Args:
+            manager(SceneManager): The manager running the scene.
+        """
+        super().__init__(manager)
+        screen = manager.screen
+        text = "Your goal is to collect the treasure on top of the tower."
+        text2 = "You can move using the W, A, S and D keys and interact with entities using the E key."
+        text3 = "To claim the final treasure,you need to reach the end of the tower and kill the boss."
+        text4 = "To overcome all of this you will use a magic dice_faces to defeat your enemies."
+        self.back_button = Button((screen.get_width() / 2, screen.get_height() / 2 + 120),"Back")
+        self.informations = [text_cache.render(text_cache.font(30), line)
+                             for line in (text, text2, text3, text4)]
+        self.bg = asset_cache.load("../assets/background/fallen_kingdom_1280x720.png", alpha=False)
+        self.scroll = 0
+        self.tiles = math.ceil(screen.get_width() / self.bg.get_width()) + 1
+
+    def handle_event(self, event):
+        """
+        Goes back to the main menu when the Back button is clicked or escape is pressed.
+
+        Args:
+            event(pygame.event.Event): The event object representing the user input.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.back_button.rect.collidepoint(event.pos):
+                self.manager.pop()
+                return
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.pop()
+
+    def update(self, current_time):
+        """
+        Scrolls the background.
+
+        Args:
+            current_time(int): The game time in milliseconds.
+        """
+        self.scroll -= 3
+        if abs(self.scroll) > self.bg.get_width():
+            self.scroll = 0
+
+    def draw(self, screen):
+        """
+        Draws the How to Play screen.
+
+        Args:
+            screen(pygame.Surface): The Pygame screen surface where the How to Play screen will be rendered.
+        """
+        for i in range(self.tiles):
+            screen.blit(self.bg, (i * self.bg.get_width() + self.scroll, 0))
         pygame.draw.rect(screen, (0, 0, 0), (390,100, 740, 100),border_radius=10)
-        screen.blit(informations, (screen.get_width()/2-informations.get_width()/2, screen.get_height()/2-250))
-        screen.blit(informations2, (screen.get_width()/2-informations.get_width()/2, screen.get_height()/2-230))
-        screen.blit(informations3, (screen.get_width()/2-informations.get_width()/2, screen.get_height()/2-210))
-        screen.blit(informations4, (screen.get_width()/2-informations.get_width()/2, screen.get_height()/2-190))
-        back_button.draw(screen)
-        pygame.display.flip()
-        clock.tick(60)
\ No newline at end of file
+        for i, informations in enumerate(self.informations):
+            screen.blit(informations, (screen.get_width()/2-self.informations[0].get_width()/2, screen.get_height()/2-250+i*20))
+        self.back_button.draw(screen)
@@ -1,67 +1,142 @@
+import os
 import sys
 
 import pygame
 from assets.button import Button
+from assets.asset_cache import asset_cache
+from assets.text_cache import text_cache
+from assets.atlas import load_animations
 import math
 from assets.playerstate import PlayerState
-from src.how_to_play import how_to_play
-from src.game import game
+from assets.scene_manager import Scene, SceneManager
+from src.how_to_play import HowToPlayScene
+from src.game import ExplorationScene, SAVE_PATH, load_game, autosave
 
 # pygame setup
 pygame.init()
 player_state = PlayerState(150, 50,potion_amount = 3,lucky_die_amount = 1)
 screen = pygame.display.set_mode((1280, 720))
 pygame.display.set_caption('Treasure Tower')
+load_animations()
 
-def main_menu():
+class MainMenuScene(Scene):
     """
     Displays the main menu for the game enabling the player to choose between playing or quitting.
+    The main menu is the bottom of the scene stack, every other scene returns to it.
+
+    Attributes:
+        title(pygame.Surface): The rendered title of the game.
+        quit_button(Button): The button quitting the game.
+        info_button(Button): The button opening the How to Play screen.
+        play_button(Button): The button starting the game.
+        continue_button(Button): The button continuing the saved run, or None if there is no save.
+        broken_save(int): The modification time of the save file that couldn't be loaded, or None.
+        bg(pygame.Surface): The scrolling background image.
+        scroll(int): The horizontal scroll offset of the background.
+        tiles(int): The number of background images needed to cover the screen.
     """
-    clock = pygame.time.Clock()
-    title = pygame.font.Font("../assets/map_entities/Pixeltype.ttf", 100).render("Treasure Tower", False, (255, 255, 255))
-    quit_button = Button((screen.get_width() / 2, screen.get_height() / 2 + 180), "Quit")
-    info_button = Button((screen.get_width() / 2, screen.get_height() / 2 + 120), "How to play")
-    play_button = Button((screen.get_width() / 2, screen.get_height() / 2 + 60), "Play")
-    bg = pygame.image.load("../assets/background/fallen_kingdom_1280x720.png").convert()
-
-    scroll = 0
-    tiles = math.ceil(screen.get_width() / bg.get_width()) + 1
-
-    running = True
-
-    while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if play_button.rect.collidepoint(event.pos):
-                    game(screen, main_menu)
-
-                if quit_button.rect.collidepoint(event.pos):
-                    pygame.quit()
-                    sys.exit()
-
-                if info_button.rect.collidepoint(event.pos):
-                    how_to_play(screen, main_menu)
-
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    pygame.quit()
-                    sys.exit()
-
-        for i in range(tiles):
-            screen.blit(bg, (i * bg.get_width() + scroll, 0))
-
-        scroll -= 3
-        if abs(scroll) > bg.get_width():
-            scroll = 0
-
-        screen.blit(title, (screen.get_width()/2-title.get_width()/2, screen.get_height()/2-250))
-        quit_button.draw(screen)
-        info_button.draw(screen)
-        play_button.draw(screen)
-        pygame.display.flip()
-        clock.tick(60)
-
-main_menu()
\ No newline at end of file
+    def __init__(self, manager):
+        """
+        Initializes a MainMenuScene object.
+
+        Args:
+            manager(SceneManager): The manager running the scene.
+        """
+        super().__init__(manager)
+        screen = manager.screen
+        self.title = text_cache.render(text_cache.font(100), "Treasure Tower")
+        self.quit_button = Button((screen.get_width() / 2, screen.get_height() / 2 + 180), "Quit")
+        self.info_button = Button((screen.get_width() / 2, screen.get_height() / 2 + 120), "How to play")
+        self.play_button = Button((screen.get_width() / 2, screen.get_height() / 2 + 60), "Play")
+        self.continue_button = None
+        self.broken_save = None
+        self.resume()
+        self.bg = asset_cache.load("../assets/background/fallen_kingdom_1280x720.png", alpha=False)
+        self.scroll = 0
+        self.tiles = math.ceil(screen.get_width() / self.bg.get_width()) + 1
+
+    def resume(self, result=None):
+        """
+        Shows the Continue button if there is a saved run that didn't fail to load.
+
+        Args:
+            result(Any, optional): The result the popped scene was closed with.
+        """
+        if os.path.exists(SAVE_PATH) and os.stat(SAVE_PATH).st_mtime_ns != self.broken_save:
+            screen = self.manager.screen
+            self.continue_button = Button((screen.get_width() / 2, screen.get_height() / 2), "Continue")
+        else:
+            self.continue_button = None
+
+    def handle_event(self, event):
+        """
+        Starts or continues the game, opens the How to Play screen or quits depending on the clicked button.
+        If the saved run can't be loaded, the Continue button is removed.
+
+        Args:
+            event(pygame.event.Event): The event object representing the user input.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if self.play_button.rect.collidepoint(event.pos):
+                self.manager.push(ExplorationScene(self.manager))
+
+            elif self.continue_button and self.continue_button.rect.collidepoint(event.pos):
+                try:
+                    run_save = load_game()
+                except (OSError, ValueError) as error:
+                    print(f"Error: could not load the saved run: {error}")
+                    self.broken_save = os.stat(SAVE_PATH).st_mtime_ns if os.path.exists(SAVE_PATH) else None
+                    self.continue_button = None
+                    return
+                self.manager.push(ExplorationScene(self.manager, run_save))
+
+            elif self.quit_button.rect.collidepoint(event.pos):
+                self.manager.quit()
+
+            elif self.info_button.rect.collidepoint(event.pos):
+                self.manager.push(HowToPlayScene(self.manager))
+
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.manager.quit()
+
+    def update(self, current_time):
+        """
+        Scrolls the background.
+
+        Args:
+            current_time(int): The game time in milliseconds.
+        """
+        self.scroll -= 3
+        if abs(self.scroll) > self.bg.get_width():
+            self.scroll = 0
+
+    def draw(self, screen):
+        """
+        Draws the main menu.
+
+        Args:
+            screen(pygame.Surface): The Pygame screen surface where the menu will be rendered.
+        """
+        for i in range(self.tiles):
+            screen.blit(self.bg, (i * self.bg.get_width() + self.scroll, 0))
+
+        screen.blit(self.title, (screen.get_width()/2-self.title.get_width()/2, screen.get_height()/2-250))
+        self.quit_button.draw(screen)
+        self.info_button.draw(screen)
+        self.play_button.draw(screen)
+        if self.continue_button:
+            self.continue_button.draw(screen)
+
+def main_menu():
+    """
+    Runs the game starting from the main menu until the player quits.
+    """
+    manager = SceneManager(screen)
+    manager.push(MainMenuScene(manager))
+    manager.run()
+    autosave.close()
+    pygame.quit()
+    sys.exit()
+
+main_menu()
@@ -0,0 +1,69 @@
+"""
+Simulates fights against every enemy type without a display, for balancing ENEMY_STATS.
+
+Run from the project root, for example:
+    python -m src.simulate_combat --fights 10000000 --health 150 --lucky 1
+"""
+import argparse
+import time
+
+from assets.combat_rules import ENEMY_STATS
+from assets.combat_simulator import simulate_fights, distribution_percentile
+
+
+def describe(counts):
+    """
+    Formats the percentiles of a distribution.
+
+    Args:
+        counts (numpy.ndarray): The number of samples with value i at index i.
+
+    :returns str: The median, p90 and p99 of the distribution, or "-" if it's empty.
+    """
+    if distribution_percentile(counts, 1.0) is None:
+        return "-"
+    return ", ".join(f"p{int(fraction * 100)} {distribution_percentile(counts, fraction)}"
+                     for fraction in (0.5, 0.9, 0.99))
+
+def run_simulation(enemy_types, fights, player_health, lucky_die_amount, seed):
+    """
+    Simulates fights against each enemy type and prints the win rate, the turns to kill
+    and the health left after the won fights.
+
+    Args:
+        enemy_types (list[str]): The enemy types to fight.
+        fights (int): The number of fights per enemy type.
+        player_health (int): The player's health at the start of each fight.
+        lucky_die_amount (int): The amount of lucky dice the player holds.
+        seed (int): The seed of the first enemy type. Enemy type i uses seed + i.
+
+    :returns dict[str, FightResults]: The outcomes of the fights for each enemy type.
+    """
+    results = {}
+    for i, enemy_type in enumerate(enemy_types):
+        start = time.perf_counter()
+        result = simulate_fights(enemy_type, fights, player_health, lucky_die_amount, seed + i)
+        total = time.perf_counter() - start
+        results[enemy_type] = result
+        print(f"{enemy_type}: won {result.win_rate:.2%} of {fights} fights in {total:.3f} s "
+              f"({fights / total:,.0f} fights/sec)")
+        print(f"  turns to kill: {describe(result.turns_distribution())}")
+        print(f"  health left: {describe(result.health_distribution())}")
+    return results
+
+def main():
+    """
+    Parses the command line arguments and runs the simulation.
+    """
+    parser = argparse.ArgumentParser(description="Simulate Treasure Tower fights without a display.")
+    parser.add_argument("--fights", type=int, default=1000000, help="number of fights per enemy type")
+    parser.add_argument("--health", type=int, default=150, help="player's health at the start of each fight")
+    parser.add_argument("--lucky", type=int, default=0, help="number of lucky dice the player holds")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the random number generator")
+    parser.add_argument("--enemy", action="append", choices=sorted(ENEMY_STATS),
+                        help="enemy type to fight, can be repeated (default: every type)")
+    args = parser.parse_args()
+    run_simulation(args.enemy or list(ENEMY_STATS), args.fights, args.health, args.lucky, args.seed)
+
+if __name__ == "__main__":
+    main()
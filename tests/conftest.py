@@ -0,0 +1,39 @@
+import os
+import random
+import sys
+
+import pytest
+
+# The game imports its modules as assets.*, so the tests run against the project root.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from assets.dungeon import FloorState, generate_floor
+from assets.playerstate import PlayerState
+from assets.savefile import RunSave
+
+
+@pytest.fixture(scope="session")
+def display():
+    """
+    Opens a display without a window, for the code that converts surfaces to the display's pixel format.
+
+    :returns pygame.Surface: The display surface.
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    pygame.init()
+    screen = pygame.display.set_mode((64, 64))
+    yield screen
+    pygame.quit()
+
+
+@pytest.fixture
+def run_save():
+    """
+    :returns RunSave: A run on a generated floor with one enemy killed.
+    """
+    snapshot = generate_floor(1234, 2)
+    floor_state = FloorState(snapshot)
+    floor_state.kill(snapshot.enemies[0])
+    player_state = PlayerState(90, 35, max_health=150, potion_amount=2, lucky_die_amount=3)
+    return RunSave(2, floor_state, snapshot.enemies[0].pos, player_state, random.Random(99).getstate())
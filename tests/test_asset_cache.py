@@ -0,0 +1,61 @@
+import pygame
+import pytest
+
+from assets.asset_cache import AssetCache
+
+
+@pytest.fixture
+def image_path(tmp_path, display):
+    """
+    :returns str: The path of a 32x16 image, red on the left half and blue on the right half.
+    """
+    image = pygame.Surface((32, 16), pygame.SRCALPHA)
+    image.fill((255, 0, 0, 255), (0, 0, 16, 16))
+    image.fill((0, 0, 255, 255), (16, 0, 16, 16))
+    path = str(tmp_path / "sheet.png")
+    pygame.image.save(image, path)
+    return path
+
+
+def test_image_is_read_once(image_path):
+    cache = AssetCache()
+    image = cache.load(image_path)
+    assert cache.load(image_path) is image
+    assert cache.get(image_path, (16, 0, 16, 16)).get_at((0, 0)) == (0, 0, 255, 255)
+    assert cache.get(image_path, (0, 0, 16, 16), scale=2).get_size() == (32, 32)
+    assert cache.get(image_path, (0, 0, 16, 16), flip=True).get_parent() is None
+    assert cache.disk_loads == 1
+
+
+def test_frames_are_views(image_path):
+    cache = AssetCache()
+    frame = cache.get(image_path, (16, 0, 16, 16))
+    assert frame.get_parent() is cache.load(image_path)
+    assert AssetCache.surface_bytes(frame) == 0
+
+
+def test_least_recently_used_is_evicted(display):
+    surfaces = {name: pygame.Surface((16, 16), pygame.SRCALPHA) for name in "abc"}
+    surface_bytes = AssetCache.surface_bytes(surfaces["a"])
+    cache = AssetCache(byte_budget=2 * surface_bytes)
+    cache.store("a", surfaces["a"])
+    cache.store("b", surfaces["b"])
+    cache.entries.move_to_end("a")
+    cache.store("c", surfaces["c"])
+
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.size == 2 * surface_bytes
+
+
+def test_surface_over_budget_is_not_cached(display):
+    cache = AssetCache(byte_budget=100)
+    cache.store("big", pygame.Surface((16, 16), pygame.SRCALPHA))
+    assert len(cache.entries) == 0 and cache.size == 0
+
+
+def test_get_reloads_evicted_image(image_path):
+    cache = AssetCache(byte_budget=AssetCache.surface_bytes(pygame.Surface((32, 16), pygame.SRCALPHA)))
+    cache.load(image_path)
+    cache.get(image_path, (0, 0, 16, 16), flip=True)
+    cache.load(image_path)
+    assert cache.disk_loads == 2
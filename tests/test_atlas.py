@@ -0,0 +1,69 @@
+import json
+import os
+
+import pygame
+import pytest
+
+from assets.animation_bank import animation_banks
+from assets.atlas import INDEX_FILE, build_atlas, load_animations, pack_frames, read_index, scale_page
+
+
+@pytest.fixture
+def manifest(tmp_path, display):
+    """
+    :returns dict: A manifest with one two-frame animation, cut from a 32x16 sheet that is red on
+        the left half and blue on the right half.
+    """
+    sheet = pygame.Surface((32, 16), pygame.SRCALPHA)
+    sheet.fill((255, 0, 0, 255), (0, 0, 16, 16))
+    sheet.fill((0, 0, 255, 255), (16, 0, 16, 16))
+    path = str(tmp_path / "sheet.png")
+    pygame.image.save(sheet, path)
+    yield {"test/atlas": {"sheet": path, "frame_size": (16, 16), "scale": 2, "states": {"idle": [(0, 0), (1, 0)]}}}
+    animation_banks.pop("test/atlas", None)
+
+
+def test_pack_frames_fills_shelves_and_pages():
+    placements, page_sizes = pack_frames([(4, 2), (4, 4), (4, 4), (4, 4), (4, 4)], page_width=8, page_height=8)
+    assert placements == [(1, 0, 0), (0, 0, 0), (0, 4, 0), (0, 0, 4), (0, 4, 4)]
+    assert page_sizes == [(8, 8), (4, 2)]
+
+
+def test_pack_frames_rejects_oversized_frame():
+    with pytest.raises(ValueError):
+        pack_frames([(9, 1)], page_width=8, page_height=8)
+
+
+def test_scale_page_matches_pygame_scale(display):
+    page = pygame.Surface((5, 3), pygame.SRCALPHA)
+    for x in range(5):
+        for y in range(3):
+            page.set_at((x, y), (x * 50, y * 80, 7, 255 - x * y * 20))
+    page = page.convert_alpha()
+    scaled = scale_page(page, 3)
+    expected = pygame.transform.scale(page, (15, 9))
+    assert scaled.get_size() == (15, 9)
+    assert all(scaled.get_at((x, y)) == expected.get_at((x, y)) for x in range(15) for y in range(9))
+
+
+def test_load_animations_from_atlas(tmp_path, manifest):
+    atlas_dir = str(tmp_path / "atlas")
+    load_animations(atlas_dir, manifest)
+    frames = animation_banks["test/atlas"].frames()["idle"]
+    assert [frame.get_size() for frame in frames] == [(32, 32), (32, 32)]
+    assert frames[0].get_at((31, 31)) == (255, 0, 0, 255)
+    assert frames[1].get_at((0, 0)) == (0, 0, 255, 255)
+    assert not build_atlas(atlas_dir, manifest)
+
+
+def test_corrupt_index_is_rebuilt(tmp_path, manifest):
+    atlas_dir = str(tmp_path / "atlas")
+    build_atlas(atlas_dir, manifest)
+    index = read_index(atlas_dir)
+    del index["animations"]
+    with open(os.path.join(atlas_dir, INDEX_FILE), "w") as index_file:
+        json.dump(index, index_file)
+
+    load_animations(atlas_dir, manifest)
+    assert "test/atlas" in animation_banks
+    assert "animations" in read_index(atlas_dir)
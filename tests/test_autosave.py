@@ -0,0 +1,95 @@
+import zlib
+
+from assets.autosave import (AutosaveWriter, recover_run, read_journal, pack_position, unpack_position,
+                             JOURNAL_DATA, JOURNAL_RECORD, GOLD_CHANGED, HEALTH_CHANGED, ENEMY_KILLED, PLAYER_MOVED)
+
+
+def write_journal(save_path, run_save):
+    """
+    Saves a run and journals four changes to it.
+
+    Args:
+        save_path (str): The path of the save file.
+        run_save (RunSave): The run to save.
+    """
+    writer = AutosaveWriter(save_path, compact_every=1000)
+    writer.snapshot(run_save)
+    writer.record(GOLD_CHANGED, 50)
+    writer.record(ENEMY_KILLED, 1)
+    writer.record(PLAYER_MOVED, pack_position((7, 9)))
+    writer.record(HEALTH_CHANGED, 70)
+    writer.close()
+
+
+def test_recover_run_replays_journal(tmp_path, run_save):
+    save_path = str(tmp_path / "run.sav")
+    write_journal(save_path, run_save)
+    recovered = recover_run(save_path)
+
+    assert recovered.player_state.gold == 50
+    assert recovered.player_state.current_health == 70
+    assert recovered.player_pos == (7, 9)
+    assert recovered.floor_state.killed == {0, 1}
+
+
+def test_recover_run_ignores_torn_tail(tmp_path, run_save):
+    save_path = str(tmp_path / "run.sav")
+    write_journal(save_path, run_save)
+    with open(save_path + ".journal", "ab") as journal_file:
+        journal_file.write(JOURNAL_RECORD.pack(GOLD_CHANGED, 999, zlib.crc32(JOURNAL_DATA.pack(GOLD_CHANGED, 999)))[:7])
+    recovered = recover_run(save_path)
+
+    assert recovered.player_state.gold == 50
+    assert recovered.player_state.current_health == 70
+
+
+def test_read_journal_stops_at_damaged_record(tmp_path, run_save):
+    save_path = str(tmp_path / "run.sav")
+    write_journal(save_path, run_save)
+    journal_path = save_path + ".journal"
+    with open(journal_path, "r+b") as journal_file:
+        data = bytearray(journal_file.read())
+        data[-JOURNAL_RECORD.size * 2 + 1] ^= 0xFF
+        journal_file.seek(0)
+        journal_file.write(data)
+
+    assert read_journal(journal_path, run_save.floor_number, run_save.floor_state.snapshot.seed) == \
+        [(GOLD_CHANGED, 50), (ENEMY_KILLED, 1)]
+
+
+def test_discard_deletes_save_and_journal(tmp_path, run_save):
+    save_path = str(tmp_path / "run.sav")
+    writer = AutosaveWriter(save_path)
+    writer.snapshot(run_save)
+    writer.record(GOLD_CHANGED, 50)
+    writer.discard()
+    writer.record(GOLD_CHANGED, 60)
+    writer.close()
+
+    assert not (tmp_path / "run.sav").exists()
+    assert not (tmp_path / "run.sav.journal").exists()
+
+
+def test_discard_without_snapshot(tmp_path, run_save):
+    save_path = str(tmp_path / "run.sav")
+    write_journal(save_path, run_save)
+    AutosaveWriter(save_path).discard()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_enemy_killed_leaves_player_in_place(tmp_path, run_save):
+    save_path = str(tmp_path / "run.sav")
+    writer = AutosaveWriter(save_path)
+    writer.snapshot(run_save)
+    writer.record(ENEMY_KILLED, 2)
+    writer.close()
+    recovered = recover_run(save_path)
+
+    assert recovered.floor_state.killed == {0, 2}
+    assert recovered.player_pos == run_save.player_pos
+
+
+def test_pack_position_round_trip():
+    for pos in [(0, 0), (3, 17), (1000, 2**31)]:
+        assert unpack_position(pack_position(pos)) == pos
@@ -0,0 +1,66 @@
+import numpy as np
+
+from assets.autotile import (autotile, neighbour_mask, floor_variant, wall_variant, NORTH, EAST, SOUTH, WEST,
+                             NORTH_EAST, SOUTH_EAST, SOUTH_WEST, NORTH_WEST)
+from assets.dungeon import generate_floor
+from assets.tilegrid import TileGrid, TRAPDOOR
+
+
+def test_neighbour_mask_bits():
+    mask = np.zeros((3, 3), dtype=bool)
+    mask[1, 1] = True
+    bits = neighbour_mask(mask)
+    assert bits.tolist() == [[SOUTH_EAST, SOUTH, SOUTH_WEST],
+                             [EAST, 0, WEST],
+                             [NORTH_EAST, NORTH, NORTH_WEST]]
+
+
+def test_neighbour_mask_edges_are_unset():
+    bits = neighbour_mask(np.ones((2, 2), dtype=bool))
+    assert bits[0, 0] == EAST | SOUTH | SOUTH_EAST
+
+
+def test_floor_variants():
+    assert floor_variant(0) == (1, 0)
+    assert floor_variant(NORTH | WEST) == (16, 0)
+    assert floor_variant(NORTH | EAST) == (16, 270)
+    assert floor_variant(SOUTH | WEST) == (15, 0)
+    assert floor_variant(WEST) == (2, 0)
+    assert floor_variant(EAST) == (2, 180)
+
+
+def test_wall_variants():
+    assert wall_variant(SOUTH) == (10, 0)
+    assert wall_variant(EAST) == (3, 0)
+    assert wall_variant(WEST) == (6, 0)
+    assert wall_variant(NORTH) == (3, 90)
+    assert wall_variant(NORTH_EAST) == ("corner", 0)
+    assert wall_variant(NORTH_WEST) == ("corner", 90)
+
+
+def test_autotile_room():
+    grid = TileGrid(5, 5)
+    grid.carve_rect(1, 1, 3, 3)
+    grid.codes[2, 2] = TRAPDOOR
+    tiles = {(y, x): key for y, x, key in autotile(grid)}
+
+    assert len(tiles) == 25
+    assert tiles[(1, 1)] == (16, 0)
+    assert tiles[(1, 3)] == (16, 270)
+    assert tiles[(3, 1)] == (15, 0)
+    assert tiles[(2, 1)] == (2, 0)
+    assert tiles[(2, 2)] == ("trapdoor", 0)
+    assert tiles[(0, 2)] == (10, 0)
+    assert tiles[(2, 0)] == (3, 0)
+    assert tiles[(2, 4)] == (6, 0)
+    assert tiles[(4, 2)] == (3, 90)
+
+
+def test_autotile_regions_match_whole_map():
+    grid = generate_floor(5).dungeon_map
+    whole = autotile(grid)
+    pieces = []
+    for y in range(0, grid.height, 7):
+        for x in range(0, grid.width, 7):
+            pieces += [(y + tile_y, x + tile_x, key) for tile_y, tile_x, key in autotile(grid, x, y, 7, 7)]
+    assert sorted(pieces, key=str) == sorted(whole, key=str)
@@ -0,0 +1,50 @@
+import random
+
+import pytest
+
+from assets.combat_rules import Fight
+from assets.combat_simulator import simulate_fights
+
+FIGHTS = 20000
+
+
+def test_fight_ends_once():
+    fight = Fight("slime", 150, rng=random.Random(3))
+    assert fight.run()
+    assert fight.won and not fight.lost
+    with pytest.raises(ValueError):
+        fight.step()
+
+
+def test_fight_is_reproducible():
+    first = Fight("zombie", 50, 1, random.Random(5))
+    second = Fight("zombie", 50, 1, random.Random(5))
+    while not first.over:
+        first_turn, second_turn = first.step(), second.step()
+        assert (first_turn.face, first_turn.player_damage, first_turn.enemy_damage) == \
+               (second_turn.face, second_turn.player_damage, second_turn.enemy_damage)
+    assert second.over and first.player_health == second.player_health
+
+
+@pytest.mark.parametrize("enemy_type, player_health, lucky_die_amount", [
+    ("skeleton", 30, 1),
+    ("zombie", 50, 0),
+    ("boss", 150, 2),
+])
+def test_simulator_matches_fight(enemy_type, player_health, lucky_die_amount):
+    rng = random.Random(7)
+    fights = [Fight(enemy_type, player_health, lucky_die_amount, rng) for _ in range(FIGHTS)]
+    win_rate = sum(fight.run() for fight in fights) / FIGHTS
+    mean_turns = sum(fight.turns for fight in fights) / FIGHTS
+
+    result = simulate_fights(enemy_type, 100000, player_health, lucky_die_amount, seed=7)
+    assert result.win_rate == pytest.approx(win_rate, abs=0.02)
+    assert float(result.turns.mean()) == pytest.approx(mean_turns, abs=0.1)
+
+
+def test_simulator_is_reproducible():
+    first = simulate_fights("zombie", 5000, 50, 1, seed=11, chunk_size=1000)
+    second = simulate_fights("zombie", 5000, 50, 1, seed=11, chunk_size=1000)
+    assert (first.won == second.won).all()
+    assert (first.turns == second.turns).all()
+    assert (first.player_health == second.player_health).all()
@@ -0,0 +1,31 @@
+import pygame
+
+from assets.dirty_rects import DirtyTracker, merge_rects
+
+
+def test_separate_rects_are_kept():
+    rects = [pygame.Rect(0, 0, 4, 4), pygame.Rect(10, 0, 4, 4)]
+    assert merge_rects(rects) == rects
+
+
+def test_overlapping_rects_are_merged():
+    assert merge_rects([(0, 0, 4, 4), (2, 2, 4, 4)]) == [pygame.Rect(0, 0, 6, 6)]
+
+
+def test_merged_rect_picks_up_rects_it_grows_into():
+    # (0, 6) only overlaps the union of the other two, not either of them.
+    rects = [(0, 0, 4, 4), (8, 8, 4, 4), (0, 6, 2, 2), (2, 2, 8, 8)]
+    assert merge_rects(rects) == [pygame.Rect(0, 0, 12, 12)]
+
+
+def test_empty_rects_are_dropped():
+    assert merge_rects([(0, 0, 0, 4), (5, 5, 3, 0)]) == []
+
+
+def test_tracker_reports_moved_and_removed_drawables():
+    tracker = DirtyTracker()
+    image = pygame.Surface((4, 4))
+    tracker.reset([("player", image, pygame.Rect(0, 0, 4, 4)), ("coin", image, pygame.Rect(20, 0, 4, 4))])
+    dirty = tracker.changes([("player", image, pygame.Rect(2, 0, 4, 4))])
+    assert dirty == [pygame.Rect(0, 0, 6, 4), pygame.Rect(20, 0, 4, 4)]
+    assert tracker.changes([("player", image, pygame.Rect(2, 0, 4, 4))]) == []
@@ -0,0 +1,46 @@
+import pytest
+
+from assets.dungeon import FloorState, generate_floor, generate_rooms
+
+
+def floor_layout(snapshot):
+    """
+    :returns tuple: Everything generate_floor places on a floor, in a comparable form.
+    """
+    return (snapshot.dungeon_map.codes.tobytes(),
+            [(room.x, room.y, room.width, room.height) for room in snapshot.rooms],
+            snapshot.player_spawn, snapshot.trapdoor, snapshot.door, snapshot.merchant,
+            [(record.index, record.pos, record.enemy_type) for record in snapshot.enemies])
+
+
+def test_generate_floor_is_reproducible():
+    for seed in range(20):
+        assert floor_layout(generate_floor(seed, 3)) == floor_layout(generate_floor(seed, 3))
+
+
+def test_generate_floor_depends_on_seed():
+    layouts = {floor_layout(generate_floor(seed))[0] for seed in range(20)}
+    assert len(layouts) > 1
+
+
+def test_generate_rooms_rejects_small_floor():
+    with pytest.raises(ValueError):
+        generate_rooms(6, 31, 5)
+
+
+def test_snapshot_is_read_only():
+    snapshot = generate_floor(8)
+    with pytest.raises(ValueError):
+        snapshot.dungeon_map.codes[0, 0] = 0
+
+
+def test_floor_state_tracks_kills_apart_from_snapshot():
+    snapshot = generate_floor(8)
+    first, second = FloorState(snapshot), FloorState(snapshot)
+    killed = snapshot.enemies[1]
+    first.kill(killed)
+
+    assert first.is_killed(killed) and not second.is_killed(killed)
+    assert first.alive_enemies() == [record for record in snapshot.enemies if record is not killed]
+    assert second.alive_enemies() == list(snapshot.enemies)
+    assert FloorState(snapshot, first.killed).alive_enemies() == first.alive_enemies()
@@ -0,0 +1,40 @@
+import pytest
+
+from assets.game_clock import GameClock
+
+
+def test_speed_follows_scale_turbo_and_pause():
+    clock = GameClock(scale=0.5, turbo_scale=4)
+    assert clock.scaled(100) == 50
+    clock.toggle_turbo()
+    assert clock.scaled(100) == 200
+    clock.toggle_pause()
+    assert clock.speed == 0
+    clock.toggle_pause()
+    clock.toggle_turbo()
+    assert clock.speed == 0.5
+
+
+def test_waits_are_skipped_only_in_turbo():
+    clock = GameClock()
+    clock.toggle_skip_waits()
+    assert clock.wait(300) == 300
+    clock.toggle_turbo()
+    assert clock.skipping
+    assert clock.wait(300) == 0
+    clock.toggle_skip_waits()
+    assert clock.wait(300) == 300
+
+
+def test_ticks_are_whole_milliseconds():
+    clock = GameClock()
+    clock.advance(16.7)
+    clock.advance(16.7)
+    assert clock.get_ticks() == 33
+
+
+def test_invalid_scales_are_rejected():
+    with pytest.raises(ValueError):
+        GameClock(scale=-1)
+    with pytest.raises(ValueError):
+        GameClock(turbo_scale=0)
@@ -0,0 +1,50 @@
+import pytest
+
+from assets.occupancy import OccupancyGrid
+
+
+def test_add_get_remove():
+    occupancy = OccupancyGrid()
+    occupancy.add((2, 3), "slime")
+    assert (2, 3) in occupancy and len(occupancy) == 1
+    assert occupancy.get((2, 3)) == "slime"
+    assert occupancy.remove((2, 3)) == "slime"
+    assert occupancy.get((2, 3)) is None
+    assert occupancy.remove((2, 3)) is None
+    assert len(occupancy) == 0
+
+
+def test_add_rejects_occupied_tile():
+    occupancy = OccupancyGrid()
+    occupancy.add((1, 1), "slime")
+    with pytest.raises(ValueError):
+        occupancy.add((1, 1), "zombie")
+
+
+def test_blocking():
+    occupancy = OccupancyGrid()
+    occupancy.add((1, 1), "merchant", blocking=True)
+    occupancy.add((1, 2), "slime")
+    assert occupancy.is_blocked((1, 1))
+    assert not occupancy.is_blocked((1, 2))
+    occupancy.remove((1, 1))
+    assert not occupancy.is_blocked((1, 1))
+
+
+def test_move_keeps_blocking():
+    occupancy = OccupancyGrid()
+    occupancy.add((1, 1), "merchant", blocking=True)
+    occupancy.add((4, 4), "slime")
+    occupancy.move((1, 1), (1, 2))
+    assert occupancy.get((1, 2)) == "merchant" and occupancy.is_blocked((1, 2))
+    assert (1, 1) not in occupancy and not occupancy.is_blocked((1, 1))
+    with pytest.raises(ValueError):
+        occupancy.move((1, 2), (4, 4))
+
+
+def test_neighbours():
+    occupancy = OccupancyGrid()
+    for pos, entity in (((0, 1), "above"), ((2, 1), "below"), ((1, 0), "left"), ((1, 2), "right"), ((0, 0), "corner")):
+        occupancy.add(pos, entity)
+    assert occupancy.neighbours((1, 1)) == ["above", "below", "left", "right"]
+    assert occupancy.neighbours((5, 5)) == []
@@ -0,0 +1,31 @@
+import pytest
+
+from assets.savefile import save_run, load_run
+
+
+def test_save_run_round_trip(tmp_path, run_save):
+    path = str(tmp_path / "run.sav")
+    save_run(path, run_save)
+    loaded = load_run(path)
+
+    assert loaded.floor_number == run_save.floor_number
+    assert loaded.player_pos == run_save.player_pos
+    assert loaded.rng_state == run_save.rng_state
+    snapshot, loaded_snapshot = run_save.floor_state.snapshot, loaded.floor_state.snapshot
+    assert loaded_snapshot.seed == snapshot.seed
+    assert loaded_snapshot.dungeon_map.codes.tobytes() == snapshot.dungeon_map.codes.tobytes()
+    assert [record.pos for record in loaded.floor_state.alive_enemies()] == \
+           [record.pos for record in run_save.floor_state.alive_enemies()]
+    player_state, loaded_player = run_save.player_state, loaded.player_state
+    assert (loaded_player.current_health, loaded_player.gold, loaded_player.max_health,
+            loaded_player.potion_amount, loaded_player.lucky_die_amount) == \
+           (player_state.current_health, player_state.gold, player_state.max_health,
+            player_state.potion_amount, player_state.lucky_die_amount)
+
+
+def test_load_run_rejects_truncated_save(tmp_path, run_save):
+    path = tmp_path / "run.sav"
+    save_run(str(path), run_save)
+    path.write_bytes(path.read_bytes()[:20])
+    with pytest.raises(ValueError):
+        load_run(str(path))
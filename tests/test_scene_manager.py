@@ -0,0 +1,67 @@
+import pytest
+
+from assets.game_clock import GameClock
+from assets.scene_manager import Scene, SceneManager
+
+
+class RecordingScene(Scene):
+    """
+    A scene that remembers the game time of every update.
+    """
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.updates = []
+
+    def update(self, current_time):
+        self.updates.append(current_time)
+
+
+@pytest.fixture
+def manager(display):
+    """
+    :returns SceneManager: A manager updating 100 times a second on its own game clock, with a recording scene.
+    """
+    manager = SceneManager(display, tick_rate=100, game_clock=GameClock())
+    manager.push(RecordingScene(manager))
+    return manager
+
+
+def test_advance_runs_one_update_per_step(manager):
+    manager.advance(35)
+    assert manager.top.updates == [10, 20, 30]
+    assert manager.interpolation == pytest.approx(0.5)
+
+
+def test_advance_carries_leftover_time(manager):
+    for _ in range(4):
+        manager.advance(5)
+    assert manager.top.updates == [10, 20]
+    assert manager.accumulator == pytest.approx(0)
+
+
+def test_advance_drops_time_beyond_max_frame_time(manager):
+    manager.advance(10000)
+    assert len(manager.top.updates) == manager.max_frame_time // 10
+
+
+def test_advance_follows_game_clock_speed(manager):
+    manager.game_clock.toggle_pause()
+    manager.advance(100)
+    assert manager.top.updates == []
+    manager.game_clock.toggle_pause()
+    manager.game_clock.toggle_turbo()
+    manager.advance(10)
+    assert manager.top.updates == [10, 20, 30, 40]
+
+
+def test_advance_stops_when_scene_pops(manager):
+    class PoppingScene(RecordingScene):
+        def update(self, current_time):
+            super().update(current_time)
+            self.manager.pop()
+
+    scene = PoppingScene(manager)
+    manager.replace(scene)
+    manager.advance(50)
+    assert manager.stack == []
+    assert scene.updates == [10]
@@ -0,0 +1,37 @@
+from assets.text_cache import TextCache
+
+
+def test_font_is_opened_once_per_size(display):
+    cache = TextCache()
+    font = cache.font(12, path=None)
+    assert cache.font(12, path=None) is font
+    assert cache.font(14, path=None) is not font
+
+
+def test_text_is_rendered_once(display):
+    cache = TextCache()
+    font = cache.font(12, path=None)
+    surface = cache.render(font, "Gold: 5")
+    assert cache.render(font, "Gold: 5") is surface
+    assert cache.render(font, "Gold: 5", color=(255, 0, 0)) is not surface
+    assert cache.render(font, "Gold: 6") is not surface
+
+
+def test_least_recently_used_text_is_dropped(display):
+    cache = TextCache(max_texts=2)
+    font = cache.font(12, path=None)
+    first = cache.render(font, "a")
+    cache.render(font, "b")
+    cache.render(font, "a")
+    cache.render(font, "c")
+    assert [text for _, text, _, _ in cache.texts] == ["a", "c"]
+    assert cache.render(font, "a") is first
+
+
+def test_clear_keeps_fonts(display):
+    cache = TextCache()
+    font = cache.font(12, path=None)
+    surface = cache.render(font, "a")
+    cache.clear()
+    assert cache.font(12, path=None) is font
+    assert cache.render(font, "a") is not surface
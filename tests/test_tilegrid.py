@@ -0,0 +1,101 @@
+import numpy as np
+
+from assets.tilegrid import TileGrid, PixelTransform, EMPTY, WALL, FLOOR, CORRIDOR, TRAPDOOR
+
+
+def old_update_wall_boundaries(dungeon_map):
+    """
+    The list of lists version of TileGrid.dilate_walls the grid replaced.
+    """
+    map_height = len(dungeon_map)
+    map_width = len(dungeon_map[0])
+    new_map = [["EMPTY" for _ in range(map_width)] for _ in range(map_height)]
+    for y in range(map_height):
+        for x in range(map_width):
+            if dungeon_map[y][x] in ["FLOOR", "CORRIDOR"]:
+                new_map[y][x] = dungeon_map[y][x]
+                for dy in [-1, 0, 1]:
+                    for dx in [-1, 0, 1]:
+                        neighbor_x = x + dx
+                        neighbor_y = y + dy
+                        if 0 <= neighbor_x < map_width and 0 <= neighbor_y < map_height:
+                            if dungeon_map[neighbor_y][neighbor_x] == "WALL":
+                                new_map[neighbor_y][neighbor_x] = "WALL"
+    return new_map
+
+
+def old_sort_tile_types(dungeon_map):
+    """
+    The list of lists version of TileGrid.classify the grid replaced.
+    """
+    floor_list = []
+    wall_list = []
+    corner_list = []
+    for y, row in enumerate(dungeon_map):
+        for x, tile in enumerate(row):
+            if tile == "WALL":
+                if ((dungeon_map[y][x-1] == "WALL" or dungeon_map[y][x+1] == "WALL")
+                        and (dungeon_map[y-1][x] == "WALL" or dungeon_map[y+1][x] == "WALL")):
+                    corner_list.append((y, x))
+                else:
+                    wall_list.append((y, x))
+            elif tile == "FLOOR":
+                floor_list.append((y, x))
+    return floor_list, wall_list, corner_list
+
+
+def random_grid(seed, width=24, height=18):
+    """
+    :returns TileGrid: A grid of random walls, floors and corridors inside a frame of empty tiles,
+        so the old functions never read past the edge of the map.
+    """
+    rng = np.random.default_rng(seed)
+    codes = np.full((height, width), EMPTY, dtype=np.uint8)
+    codes[1:-1, 1:-1] = rng.choice([WALL, WALL, WALL, FLOOR, CORRIDOR], size=(height - 2, width - 2))
+    return TileGrid.from_codes(codes)
+
+
+def test_dilate_walls_matches_lists():
+    for seed in range(20):
+        grid = random_grid(seed)
+        assert [list(row) for row in grid.dilate_walls()] == old_update_wall_boundaries([list(row) for row in grid])
+
+
+def test_classify_matches_lists():
+    for seed in range(20):
+        grid = random_grid(seed).dilate_walls()
+        assert grid.classify() == old_sort_tile_types([list(row) for row in grid])
+
+
+def test_rows_read_and_write_names():
+    grid = TileGrid(4, 3)
+    grid[1][2] = "FLOOR"
+    assert grid.codes[1, 2] == FLOOR
+    assert grid[1][2] == "FLOOR"
+    assert list(grid[0]) == ["WALL"] * 4
+
+
+def test_copy_is_independent():
+    grid = TileGrid(5, 5)
+    copy = grid.copy()
+    copy.carve_rect(1, 1, 2, 2)
+    assert (grid.codes == WALL).all()
+    assert (copy.codes == FLOOR).sum() == 4
+
+
+def test_is_walkable():
+    grid = TileGrid(5, 5)
+    grid.carve_rect(1, 1, 2, 1)
+    grid.carve_hline(3, 4, 1)
+    grid.codes[3, 3] = TRAPDOOR
+    walkable = {(x, y) for y in range(-1, 6) for x in range(-1, 6) if grid.is_walkable(x, y)}
+    assert walkable == {(1, 1), (2, 1), (3, 1), (4, 1), (3, 3)}
+
+
+def test_pixel_transform_round_trip():
+    transform = PixelTransform(16, 12, origin_x=5, origin_y=-3)
+    for x, y in [(0, 0), (3, 7), (30, 1)]:
+        pixel_x, pixel_y = transform.to_pixel(x, y)
+        assert transform.to_tile(pixel_x, pixel_y) == (x, y)
+        assert transform.to_tile(pixel_x + 15, pixel_y + 11) == (x, y)
+    assert transform.surface_size(TileGrid(31, 20)) == (31 * 16, 20 * 12)